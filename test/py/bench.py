@@ -0,0 +1,189 @@
+import sys
+import json
+import time
+import argparse
+import platform
+import tracemalloc
+from thokit import ThoKit, _TOKEN
+
+thokit = ThoKit()
+
+data = {
+    "tailo.asc": "./test/data/tailo.asc.txt",
+    "tailo.uni": "./test/data/tailo.uni.txt",
+    "poj.asc": "./test/data/poj.asc.txt",
+    "poj.uni": "./test/data/poj.uni.txt",
+}
+
+
+def receipts(engines=("regex", "table", "token")):
+    """
+    逐个公開轉換方法、白話字標準、轉換引擎个測試項目：名 => (輸入, 轉換函數)
+
+    regex 引擎个項目名無後綴，佮較早个基準仝名；table、token 引擎个項目名後壁加 "@table"、"@token"。
+    cascade 方法無 `compile` 通用，干焦測 regex。
+    """
+    methods = {
+        "tl_u2a": ("tailo.uni", "tailoUnicode2Ascii", {}),
+        "tl_a2u": ("tailo.asc", "tailoAscii2Unicode", {}),
+        "poja2tla": ("poj.asc", "pojAscii2TailoAscii", {}),
+        "tla2poja": ("tailo.asc", "tailoAscii2PojAscii", {}),
+        "tla2ipa": ("tailo.asc", "tailoAscii2Ipa", {}),
+    }
+    for standard in [None, *thokit.poj_standards]:
+        suffix = f"[{standard}]" if standard else ""
+        methods["poj_u2a" + suffix] = ("poj.uni", "pojUnicode2Ascii", {"standard": standard})
+        methods["poj_a2u" + suffix] = ("poj.asc", "pojAscii2Unicode", {"standard": standard})
+        methods["poju2tlu" + suffix] = ("poj.uni", "pojUnicode2TailoUnicode", {"poj_standard": standard})
+        methods["tlu2poju" + suffix] = ("tailo.uni", "tailoUnicode2PojUnicode", {"poj_standard": standard})
+        methods["poju2tlu_cascade" + suffix] = ("poj.uni", "pojUnicode2TailoUnicodeCascade", {"poj_standard": standard})
+        methods["tlu2poju_cascade" + suffix] = ("tailo.uni", "tailoUnicode2PojUnicodeCascade", {"poj_standard": standard})
+
+    cases = {}
+    for engine in engines:
+        for name, (key, method, options) in methods.items():
+            if engine == "regex":
+                cases[name] = (key, lambda text, method=getattr(thokit, method), options=options: method(text, **options))
+            elif not method.endswith("Cascade"):
+                cases[f"{name}@{engine}"] = (key, compiled(method, engine, options))
+    return cases
+
+
+def compiled(method, engine, options):
+    """
+    頭一擺呼叫才編譯，table 引擎建表个時間算入 `measure` 先行彼擺，袂算入別个項目
+    """
+    converter = None
+
+    def convert(text):
+        nonlocal converter
+        if converter is None:
+            converter = thokit.compile(method, engine, **options)
+        return converter(text)
+
+    return convert
+
+
+def percentile(values, q):
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+
+def measure(fn, lines, memory_lines):
+    # 先行一擺，予轉換器、快取準備好
+    list(map(fn, lines[:1000]))
+
+    start_time = time.perf_counter()
+    list(map(fn, lines))
+    seconds = time.perf_counter() - start_time
+
+    latencies = []
+    clock = time.perf_counter_ns
+    for line in lines:
+        t0 = clock()
+        fn(line)
+        latencies.append(clock() - t0)
+    latencies.sort()
+
+    # 逐擺呼叫个記憶體峰值（呼叫前已經佔个毋算）佮呼叫了後留落來个（快取等），單位 bytes
+    peaks = []
+    retained = 0
+    tracemalloc.start()
+    for line in lines[:memory_lines]:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        fn(line)
+        after, peak = tracemalloc.get_traced_memory()
+        peaks.append(peak - before)
+        retained += after - before
+    tracemalloc.stop()
+    peaks.sort()
+
+    syllables = sum(len(_TOKEN.findall(line)) for line in lines)
+    return {
+        "lines": len(lines),
+        "syllables": syllables,
+        "seconds": seconds,
+        "lines_per_s": len(lines) / seconds,
+        "syllables_per_s": syllables / seconds,
+        "p50_us": percentile(latencies, 0.50) / 1000,
+        "p99_us": percentile(latencies, 0.99) / 1000,
+        "call_peak_p50_b": percentile(peaks, 0.50),
+        "call_peak_max_b": peaks[-1],
+        "retained_kib": retained / 1024,
+    }
+
+
+def compare(results, baseline, threshold, pattern="", engines=("regex", "table", "token")):
+    """
+    比較基準，通過量降超過 threshold 就算退步，返回退步个項目
+
+    基準有、即擺無測着个項目（pattern、engines 揀掉个無算）嘛算退步。
+    """
+    regressions = []
+    for name in baseline["cases"]:
+        engine = name.rpartition("@")[2] if "@" in name else "regex"
+        if pattern in name and engine in engines and name not in results["cases"]:
+            print("%-28s missing" % name)
+            regressions.append(name)
+    for name, result in results["cases"].items():
+        if name not in baseline["cases"]:
+            continue
+        old = baseline["cases"][name]["lines_per_s"]
+        change = result["lines_per_s"] / old - 1
+        print("%-28s %12.0f -> %12.0f lines/s  %+7.2f%%" % (name, old, result["lines_per_s"], change * 100))
+        if change < -threshold:
+            regressions.append(name)
+    return regressions
+
+
+def bench(pattern="", step=1, memory_lines=10000, engines=("regex", "table", "token")):
+    lines = {}
+    for key, path in data.items():
+        with open(path, "r", encoding="utf-8") as f:
+            lines[key] = f.readlines()[::step]
+    results = {"python": platform.python_version(), "step": step, "cases": {}}
+    for name, (key, fn) in receipts(engines).items():
+        if pattern not in name:
+            continue
+        result = measure(fn, lines[key], memory_lines)
+        results["cases"][name] = result
+        print(
+            "%-28s %10.0f lines/s %10.0f syl/s  p50 %7.1fus  p99 %7.1fus  call peak p50 %7dB max %8dB  retained %8.1fKiB"
+            % (
+                name,
+                result["lines_per_s"],
+                result["syllables_per_s"],
+                result["p50_us"],
+                result["p99_us"],
+                result["call_peak_p50_b"],
+                result["call_peak_max_b"],
+                result["retained_kib"],
+            )
+        )
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="THOKIT 轉換效能測試")
+    parser.add_argument("-k", "--filter", default="", help="干焦測名有即个字串个項目")
+    parser.add_argument("-o", "--output", help="結果寫入 JSON 檔案")
+    parser.add_argument("--compare", help="佮即个 JSON 基準比較")
+    parser.add_argument("--threshold", type=float, default=0.1, help="通過量降幾成算退步，默認 0.1")
+    parser.add_argument("--step", type=int, default=1, help="逐幾逝提一逝，默認 1（全部）")
+    parser.add_argument("--memory-lines", type=int, default=10000, help="量記憶體用个逝數")
+    parser.add_argument(
+        "--engines", nargs="+", choices=["regex", "table", "token"], default=["regex", "table", "token"], help="欲測个轉換引擎，默認全部"
+    )
+    args = parser.parse_args()
+
+    results = bench(args.filter, args.step, args.memory_lines, args.engines)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold, args.filter, args.engines)
+        if regressions:
+            print("Regressions: %s" % ", ".join(regressions))
+            sys.exit(1)
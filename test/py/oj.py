@@ -68,12 +68,12 @@ def judge(strict=True, mode=""):
         tgt_lines = list(map(fn, src_lines))
         end_time = time.time()
         print("Time for %s: %.6fs" % (mode, end_time - start_time))
+        total = len(src_lines)
         for i in range(total):
             if tgt_lines[i] == ref_lines[i]:
                 correct += 1
         with open(receipts[mode]["tgt"], "w", encoding="utf-8") as fo:
             fo.writelines(tgt_lines)
-        total = len(src_lines)
     else:
         total_time = 0
         for _mode in receipts:
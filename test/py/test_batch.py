@@ -0,0 +1,76 @@
+import os
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from thokit import ThoKit
+
+DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data")
+
+
+def readLines(name, step=1):
+    with open(os.path.join(DATA, name), encoding="utf-8") as f:
+        return f.read().splitlines()[::step]
+
+
+class BatchTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.thokit = ThoKit()
+        cls.lines = readLines("poj.asc.txt", 20)
+        cls.expected = [cls.thokit.pojAscii2Unicode(line, standard="campbell") for line in cls.lines]
+
+    def test_convert_batch(self):
+        for workers, chunksize in [(1, 1024), (2, 7), (3, 1000)]:
+            with self.subTest(workers=workers, chunksize=chunksize):
+                converted = self.thokit.convertBatch(self.lines, "pojAscii2Unicode", workers, chunksize, standard="campbell")
+                self.assertEqual(converted, self.expected)
+
+    def test_imap_batch(self):
+        # 輸入是產生器嘛會使，結果照順序一逝一逝來
+        lines = (line for line in self.lines)
+        converted = self.thokit.imapBatch(lines, "pojAscii2Unicode", 2, 50, "table", standard="campbell")
+        self.assertEqual(list(converted), self.expected)
+
+    def test_convert_batch_threaded(self):
+        for max_workers, chunksize in [(1, 1024), (4, 7), (2, 1000)]:
+            for engine in ["regex", "token", "table"]:
+                with self.subTest(max_workers=max_workers, chunksize=chunksize, engine=engine):
+                    converted = self.thokit.convertBatchThreaded(
+                        iter(self.lines), "pojAscii2Unicode", max_workers, chunksize, engine, standard="campbell"
+                    )
+                    self.assertEqual(converted, self.expected)
+
+    def test_shared_converter(self):
+        # 逐个執行緒共用仝一个轉換器佮快取，結果佮一个執行緒仝款
+        converter = self.thokit.compile("pojAscii2Unicode", "token", standard="campbell")
+        lines = self.lines * 3
+        converted = self.thokit.convertBatchThreaded(lines, "pojAscii2Unicode", 8, 16, "token", standard="campbell")
+        self.assertEqual(converted, list(map(converter, lines)))
+
+    def test_shared_instance(self):
+        # 一个 ThoKit 予幾若个執行緒仝時間用，中途閣清快取，結果袂亂
+        thokit = ThoKit()
+        methods = ["pojAscii2Unicode", "pojAscii2TailoAscii", "tailoAscii2Ipa"]
+        expected = {method: list(map(getattr(self.thokit, method), self.lines)) for method in methods}
+
+        def run(i):
+            if i % 5 == 4:
+                thokit.cacheClear()
+                return None
+            method = methods[i % len(methods)]
+            return method, list(map(getattr(thokit, method), self.lines))
+
+        with ThreadPoolExecutor(8) as executor:
+            for result in executor.map(run, range(20)):
+                if result is not None:
+                    self.assertEqual(result[1], expected[result[0]])
+
+    def test_bad_chunksize(self):
+        with self.assertRaises(AssertionError):
+            self.thokit.convertBatch(self.lines, "pojAscii2Unicode", 2, 0)
+        with self.assertRaises(AssertionError):
+            self.thokit.convertBatchThreaded(self.lines, "pojAscii2Unicode", 2, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
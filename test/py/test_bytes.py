@@ -0,0 +1,44 @@
+import os
+import unittest
+
+from thokit import ThoKit
+
+DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data")
+
+
+def readBytes(name):
+    with open(os.path.join(DATA, name), "rb") as f:
+        return f.read()
+
+
+class BytesTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.thokit = ThoKit()
+
+    def test_matches_str(self):
+        for method, name in [("pojAscii2TailoAscii", "poj.asc.txt"), ("tailoAscii2PojAscii", "tailo.asc.txt")]:
+            data = readBytes(name)
+            with self.subTest(method=method):
+                expected = getattr(self.thokit, method)(data.decode("utf-8")).encode("utf-8")
+                self.assertEqual(getattr(self.thokit, method + "Bytes")(data), expected)
+
+    def test_buffer_types(self):
+        data = "Tsua7 TSING1 tsing-khì 水 Tsue3\r\n".encode("utf-8")
+        expected = "Choa7 CHENG1 cheng-khì 水 Choe3\r\n".encode("utf-8")
+        for buffer in [data, bytearray(data), memoryview(data)]:
+            with self.subTest(type=type(buffer).__name__):
+                converted = self.thokit.tailoAscii2PojAsciiBytes(buffer)
+                self.assertIsInstance(converted, bytes)
+                self.assertEqual(converted, expected)
+        self.assertEqual(self.thokit.pojAscii2TailoAsciiBytes(expected), data)
+
+    def test_case_variants(self):
+        for text in ["hoa5", "Hoa5", "HOA5", "hOa5", "HoA5", "eng", "ENG", "Eng", "eNg"]:
+            with self.subTest(text=text):
+                converted = self.thokit.pojAscii2TailoAsciiBytes(text.encode("ascii"))
+                self.assertEqual(converted.decode("ascii"), self.thokit.pojAscii2TailoAscii(text))
+
+
+if __name__ == "__main__":
+    unittest.main()
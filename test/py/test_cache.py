@@ -0,0 +1,40 @@
+import os
+import unittest
+
+from thokit import ThoKit
+
+DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data")
+
+
+def readLines(name, step=1):
+    with open(os.path.join(DATA, name), encoding="utf-8") as f:
+        return f.read().splitlines()[::step]
+
+
+class CacheTest(unittest.TestCase):
+    def test_cache_info(self):
+        thokit = ThoKit()
+        self.assertEqual(thokit.tailoAscii2Unicode("tsa1-bo2 tsa1-bo2"), "tsa-bó tsa-bó")
+        info = thokit.cacheInfo()[("moveTailoToneNumber", None)]
+        self.assertEqual((info.hits, info.misses, info.currsize), (2, 2, 2))
+        thokit.cacheClear()
+        info = thokit.cacheInfo()[("moveTailoToneNumber", None)]
+        self.assertEqual((info.hits, info.misses, info.currsize), (0, 0, 0))
+
+    def test_cache_size(self):
+        # 快取真細、無快取个結果攏愛仝款，大小寫無仝个音節共用快取
+        lines = readLines("poj.asc.txt", 50)
+        expected = [ThoKit().pojAscii2Unicode(line, standard="campbell") for line in lines]
+        for cache_size in [0, 2]:
+            thokit = ThoKit(cache_size=cache_size)
+            with self.subTest(cache_size=cache_size):
+                self.assertEqual([thokit.pojAscii2Unicode(line, standard="campbell") for line in lines], expected)
+                for info in thokit.cacheInfo().values():
+                    self.assertLessEqual(info.currsize, cache_size)
+        thokit = ThoKit()
+        self.assertEqual(thokit.pojAscii2Unicode("chui2 Chui2 CHUI2"), "chúi Chúi CHÚI")
+        self.assertEqual(thokit.cacheInfo()[("movePojToneNumber", None)].currsize, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
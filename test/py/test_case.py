@@ -0,0 +1,75 @@
+import re
+import unittest
+
+from thokit import ThoKit
+
+# 全大寫、首字母大寫、細寫个文本轉換了愛佮細寫个結果仝款，干焦大小寫無仝
+LINES = {
+    "pojUnicode2Ascii": ["tsúi chia̍h cha-bó͘", "ô͘-á kiâⁿ lâi", "ho͘hⁿ hō͘"],
+    "pojAscii2Unicode": ["chui2 chiah8 cha1-boo2", "oo5-a2 kiann5 lai5", "bee1 kee5"],
+    "tailoUnicode2PojUnicode": ["tsuí tsia̍h tsa-bóo", "ôo-á kiânn lâi", "mē kê"],
+    "pojUnicode2TailoUnicode": ["chúi chia̍h cha-bó͘", "ô͘-á kiâⁿ lâi", "mē kê"],
+}
+
+
+def upper(text):
+    # `str.upper` 袂共白話字鼻音 `ⁿ` 改做 `ᴺ`
+    return text.upper().replace("ⁿ", "ᴺ")
+
+
+def title(text):
+    # `str.title` 會共 `o͘` 後壁个字母當做新个詞；白話字連字符號連起來个詞干焦頭一个字母大寫
+    return re.sub(r"\S+", lambda match: match[0][0].upper() + match[0][1:], text)
+
+
+class CaseTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.thokit = ThoKit()
+
+    def test_lone_single_letter(self):
+        thokit = self.thokit
+        self.assertEqual(thokit.pojUnicode2Ascii("O͘"), "OO1")
+        self.assertEqual(thokit.pojUnicode2Ascii("Ó͘"), "OO2")
+        self.assertEqual(thokit.pojUnicode2TailoUnicode("Ó͘"), "Óo")
+
+    def test_single_letter_beside_syllables(self):
+        thokit = self.thokit
+        self.assertEqual(thokit.pojUnicode2Ascii("Ó͘ Ê"), "OO2 E5")
+        self.assertEqual(thokit.pojUnicode2Ascii("Ó͘ ê"), "Oo2 e5")
+        self.assertEqual(thokit.pojUnicode2Ascii("TSÚI Ó͘"), "TSUI2 OO2")
+
+    def test_douglas_upper(self):
+        thokit = self.thokit
+        self.assertEqual(thokit.pojAscii2Unicode("BEE1", standard="douglas"), "BƐ")
+        self.assertEqual(thokit.tailoUnicode2PojUnicode("ME̋E", poj_standard="douglas"), "MƐ̆")
+        self.assertEqual(thokit.tailoUnicode2PojUnicode("ME̋E"), "MĔE")
+
+    def test_upper_and_title_match_lower(self):
+        options = {
+            "pojUnicode2Ascii": "standard",
+            "pojAscii2Unicode": "standard",
+            "tailoUnicode2PojUnicode": "poj_standard",
+            "pojUnicode2TailoUnicode": "poj_standard",
+        }
+        for direction, lines in LINES.items():
+            for standard in [None, *self.thokit.poj_standards]:
+                method = getattr(self.thokit, direction)
+                kwargs = {options[direction]: standard}
+                for line in lines:
+                    with self.subTest(direction=direction, standard=standard, line=line):
+                        lower = method(line, **kwargs)
+                        self.assertEqual(method(upper(line), **kwargs), upper(lower))
+                        self.assertEqual(method(title(line), **kwargs), title(lower))
+
+    def test_engines_agree_on_upper(self):
+        for direction, lines in LINES.items():
+            converters = [self.thokit.compile(direction, engine) for engine in ["regex", "token", "table"]]
+            for line in lines:
+                for text in [upper(line), title(line), upper(line) + " " + line]:
+                    with self.subTest(direction=direction, text=text):
+                        self.assertEqual(len({convert(text) for convert in converters}), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
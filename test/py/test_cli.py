@@ -0,0 +1,110 @@
+import io
+import os
+import sys
+import tempfile
+import unittest
+import subprocess
+from contextlib import redirect_stderr
+
+from thokit import ThoKit
+from thokit import cli
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..")
+
+TEXT = "Tsui2 tsiah8\r\ntsa1-boo2\n\n水 Tsua7"
+
+# 轉換方法个輸入拼寫 => 臺羅 ASCII 轉做該拼寫个方法
+SOURCES = {
+    "tailoAscii": [],
+    "tailoUnicode": ["tailoAscii2Unicode"],
+    "pojAscii": ["tailoAscii2PojAscii"],
+    "pojUnicode": ["tailoAscii2PojAscii", "pojAscii2Unicode"],
+    "ipa": ["tailoAscii2Ipa"],
+}
+
+
+class CliTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.thokit = ThoKit()
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def convert(self, command, data, *options):
+        """
+        用檔案行命令行，返回輸出个 bytes
+        """
+        source, target = os.path.join(self.directory, "in.txt"), os.path.join(self.directory, "out.txt")
+        with open(source, "wb") as f:
+            f.write(data)
+        cli.main([command, source, "-o", target, *options])
+        with open(target, "rb") as f:
+            return f.read()
+
+    def source(self, method):
+        text = TEXT
+        for direction in SOURCES[method.split("2")[0]]:
+            text = "".join(getattr(self.thokit, direction)(line) for line in text.splitlines(keepends=True))
+        return text
+
+    def expected(self, method, text, **options):
+        # 換逝符原樣保留
+        lines = []
+        for line in text.splitlines(keepends=True):
+            content = line.rstrip("\r\n")
+            lines.append(getattr(self.thokit, method)(content, **options) + line[len(content) :])
+        return "".join(lines)
+
+    def test_commands(self):
+        for command, method in cli._COMMANDS.items():
+            text = self.source(method)
+            with self.subTest(command=command):
+                converted = self.convert(command, text.encode("utf-8")).decode("utf-8")
+                self.assertEqual(converted, self.expected(method, text))
+
+    def test_options(self):
+        text = self.source("pojAscii2Unicode")
+        expected = self.expected("pojAscii2Unicode", text, standard="campbell", case_spelling=False)
+        for options in [[], ["-w", "2", "--chunksize", "1"], ["--engine", "table"]]:
+            with self.subTest(options=options):
+                converted = self.convert("poj-a2u", text.encode("utf-8"), "--standard", "campbell", "--no-case-spelling", *options)
+                self.assertEqual(converted.decode("utf-8"), expected)
+
+    def test_ascii_stream(self):
+        # 逐塊佇換逝符切開，塊比一逝較細嘛會使
+        data = "Tsua7 tsing-khì\nTSUE3 水\n\nhuat".encode("utf-8") * 5
+        for chunk_size in [1, 7, 1 << 24]:
+            writer = io.BytesIO()
+            cli._convertAsciiStream(io.BytesIO(data), writer, "tailoAscii2PojAscii", chunk_size)
+            self.assertEqual(writer.getvalue(), self.thokit.tailoAscii2PojAsciiBytes(data))
+
+    def test_errors(self):
+        for command, options in [
+            ("poj-a2u", ["--standard", "xx"]),
+            ("poj-a2u", ["-w", "0"]),
+            ("tailo-a2u", ["--accent-marks", "a", "b"]),
+            ("nope", []),
+        ]:
+            with self.subTest(command=command, options=options):
+                with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit) as context:
+                    self.convert(command, b"a", *options)
+                self.assertEqual(context.exception.code, 2)
+        with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            self.convert("tailo-a2u", b"\xff\xfe")
+
+    def test_module(self):
+        process = subprocess.run(
+            [sys.executable, "-m", "thokit", "tailo-a2u"],
+            input="Tsui2 tsiah8\n".encode("utf-8"),
+            capture_output=True,
+            cwd=ROOT,
+            check=True,
+        )
+        self.assertEqual(process.stdout.decode("utf-8"), "Tsuí tsia̍h\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
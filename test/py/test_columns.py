@@ -0,0 +1,75 @@
+import unittest
+
+from thokit import ThoKit
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+if pd is not None or pa is not None:
+    from thokit import columns
+
+VALUES = ["Tsui2", "tsiah8", "Tsui2", None, "tsa1-boo2", "tsiah8", "TSUI2"]
+
+
+class ColumnsTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.thokit = ThoKit()
+        cls.expected = [None if value is None else cls.thokit.tailoAscii2PojAscii(value) for value in VALUES]
+
+    @unittest.skipIf(pd is None, "愛先裝 pandas")
+    def test_series(self):
+        series = pd.Series(VALUES, index=list("abcdefg"), name="tailo")
+        converted = columns.convert(series, "tailoAscii2PojAscii")
+        self.assertEqual(converted.name, "tailo")
+        self.assertEqual(converted.index.tolist(), list("abcdefg"))
+        self.assertEqual(converted.dtype, series.dtype)
+        self.assertEqual([None if pd.isna(value) else value for value in converted], self.expected)
+
+    @unittest.skipIf(pd is None, "愛先裝 pandas")
+    def test_series_types(self):
+        series = pd.Series(VALUES, dtype="category")
+        converted = columns.convert(series, "tailoAscii2PojAscii")
+        self.assertIsInstance(converted.dtype, pd.CategoricalDtype)
+        self.assertEqual([None if pd.isna(value) else value for value in converted], self.expected)
+        # object 欄位內底毋是字串个值原樣保留
+        series = pd.Series(["tsui2", 3, "tsui2"])
+        self.assertEqual(columns.convert(series, "tailoAscii2Unicode").tolist(), ["tsuí", 3, "tsuí"])
+
+    @unittest.skipIf(pd is None, "愛先裝 pandas")
+    def test_options(self):
+        series = pd.Series(["Tsui2 tsiah8", "tsa1-boo2"] * 3)
+        expected = [self.thokit.pojAscii2Unicode(value, standard="campbell") for value in series]
+        for workers, engine in [(1, "regex"), (2, "table")]:
+            with self.subTest(workers=workers, engine=engine):
+                converted = columns.convert(series, "pojAscii2Unicode", workers, engine, standard="campbell")
+                self.assertEqual(converted.tolist(), expected)
+
+    @unittest.skipIf(pa is None, "愛先裝 PyArrow")
+    def test_arrow(self):
+        array = pa.array(VALUES)
+        converted = columns.convert(array, "tailoAscii2PojAscii")
+        self.assertEqual(converted.type, array.type)
+        self.assertEqual(converted.to_pylist(), self.expected)
+        chunked = pa.chunked_array([VALUES[:3], VALUES[3:]])
+        converted = columns.convert(chunked, "tailoAscii2PojAscii")
+        self.assertEqual([len(chunk) for chunk in converted.chunks], [3, 4])
+        self.assertEqual(converted.to_pylist(), self.expected)
+        dictionary = array.dictionary_encode()
+        converted = columns.convert(dictionary, "tailoAscii2PojAscii")
+        self.assertTrue(pa.types.is_dictionary(converted.type))
+        self.assertEqual(converted.to_pylist(), self.expected)
+
+    @unittest.skipIf(pd is None and pa is None, "愛先裝 pandas 抑是 PyArrow")
+    def test_unsupported(self):
+        with self.assertRaises(AssertionError):
+            columns.convert(VALUES, "tailoAscii2PojAscii")
+
+
+if __name__ == "__main__":
+    unittest.main()
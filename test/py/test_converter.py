@@ -0,0 +1,86 @@
+import os
+import inspect
+import unittest
+
+from thokit import ThoKit
+
+DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data")
+
+# 逐對拼寫个轉換路線：有白話字標準个時 `converter` 愛佮按呢串轉換方法个結果仝款
+CHAINS = {
+    ("tailo-asc", "tailo-uni"): ["tailoAscii2Unicode"],
+    ("tailo-asc", "poj-asc"): ["tailoAscii2PojAscii"],
+    ("tailo-asc", "poj-uni"): ["tailoAscii2PojAscii", "pojAscii2Unicode"],
+    ("tailo-asc", "ipa"): ["tailoAscii2Ipa"],
+    ("tailo-uni", "tailo-asc"): ["tailoUnicode2Ascii"],
+    ("tailo-uni", "poj-asc"): ["tailoUnicode2Ascii", "tailoAscii2PojAscii"],
+    ("tailo-uni", "poj-uni"): ["tailoUnicode2Ascii", "tailoAscii2PojAscii", "pojAscii2Unicode"],
+    ("tailo-uni", "ipa"): ["tailoUnicode2Ascii", "tailoAscii2Ipa"],
+    ("poj-asc", "tailo-asc"): ["pojAscii2TailoAscii"],
+    ("poj-asc", "tailo-uni"): ["pojAscii2TailoAscii", "tailoAscii2Unicode"],
+    ("poj-asc", "poj-uni"): ["pojAscii2Unicode"],
+    ("poj-asc", "ipa"): ["pojAscii2TailoAscii", "tailoAscii2Ipa"],
+    ("poj-uni", "tailo-asc"): ["pojUnicode2Ascii", "pojAscii2TailoAscii"],
+    ("poj-uni", "tailo-uni"): ["pojUnicode2Ascii", "pojAscii2TailoAscii", "tailoAscii2Unicode"],
+    ("poj-uni", "poj-asc"): ["pojUnicode2Ascii"],
+    ("poj-uni", "ipa"): ["pojUnicode2Ascii", "pojAscii2TailoAscii", "tailoAscii2Ipa"],
+    ("ipa", "tailo-asc"): ["ipa2TailoAscii"],
+    ("ipa", "tailo-uni"): ["ipa2TailoAscii", "tailoAscii2Unicode"],
+    ("ipa", "poj-asc"): ["ipa2TailoAscii", "tailoAscii2PojAscii"],
+    ("ipa", "poj-uni"): ["ipa2TailoAscii", "tailoAscii2PojAscii", "pojAscii2Unicode"],
+}
+
+
+def readLines(name, step=1):
+    with open(os.path.join(DATA, name), encoding="utf-8") as f:
+        return f.read().splitlines()[::step]
+
+
+class ConverterRouteTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.thokit = ThoKit()
+        cls.lines = readLines("tailo.asc.txt", 300)
+
+    def chain(self, directions, text, standard):
+        for direction in directions:
+            method = getattr(self.thokit, direction)
+            parameters = inspect.signature(method).parameters
+            options = {name: standard for name in ["standard", "poj_standard"] if name in parameters and standard}
+            text = method(text, **options)
+        return text
+
+    def sources(self, standard):
+        thokit, lines = self.thokit, self.lines
+        poj = [thokit.tailoAscii2PojAscii(line) for line in lines]
+        return {
+            "tailo-asc": lines,
+            "tailo-uni": [thokit.tailoAscii2Unicode(line) for line in lines],
+            "poj-asc": poj,
+            "poj-uni": [thokit.pojAscii2Unicode(line, standard=standard) for line in poj],
+            "ipa": [thokit.tailoAscii2Ipa(line) for line in lines],
+        }
+
+    def test_routes_match_method_chains(self):
+        for standard in [None, *self.thokit.poj_standards]:
+            sources = self.sources(standard)
+            for (src, dst), directions in CHAINS.items():
+                expected = [self.chain(directions, line, standard) for line in sources[src]]
+                for engine in ["regex", "token", "table"]:
+                    with self.subTest(src=src, dst=dst, standard=standard, engine=engine):
+                        convert = self.thokit.converter(src, dst, standard, engine=engine)
+                        self.assertEqual(list(map(convert, sources[src])), expected)
+
+    def test_campbell_spelling(self):
+        convert = self.thokit.converter("tailo-asc", "poj-uni", "campbell")
+        self.assertEqual(convert("Tsui2 tsiah8 tsa1-boo2"), "Tsúi chia̍h tsa-bó͘")
+        convert = self.thokit.converter("tailo-asc", "poj-uni", "campbell", case_spelling=False)
+        self.assertEqual(convert("Tsui2 tsiah8 tsa1-boo2"), "Chúi chia̍h cha-bó͘")
+
+    def test_unused_option(self):
+        with self.assertRaises(AssertionError):
+            self.thokit.converter("tailo-asc", "tailo-uni", case_spelling=False)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import os
+import unittest
+
+from thokit import ThoKit
+
+DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data")
+
+
+def readChunks(name, size=20):
+    """
+    測試資料逐 size 逝鬥做一段
+    """
+    with open(os.path.join(DATA, name), encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    return ["\n".join(lines[i : i + size]) for i in range(0, len(lines), size)]
+
+
+class DetectTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.thokit = ThoKit()
+        cls.poj = readChunks("poj.asc.txt")[::4]
+
+    def test_examples(self):
+        cases = {
+            "Tsuí tsia̍h": ("tailo", "uni", None),
+            "tsui2 tsiah8": ("tailo", "asc", None),
+            "Chúi chia̍h": ("poj", "uni", None),
+            "chui2 chiah8": ("poj", "asc", None),
+            "ho͘hⁿ": ("poj", "uni", "campbell"),
+            "Tsoā": ("poj", "uni", "campbell"),
+            "chiɛn": ("poj", "asc", "douglas"),
+        }
+        for text, expected in cases.items():
+            with self.subTest(text=text):
+                detection = self.thokit.detect(text)
+                self.assertEqual(detection[:3], expected)
+                self.assertTrue(0 < detection.confidence <= 1)
+
+    def test_orthography(self):
+        for name, expected in [
+            ("tailo.asc.txt", ("tailo", "asc")),
+            ("tailo.uni.txt", ("tailo", "uni")),
+            ("poj.asc.txt", ("poj", "asc")),
+            ("poj.uni.txt", ("poj", "uni")),
+        ]:
+            chunks = readChunks(name)
+            correct = sum(self.thokit.detect(chunk)[:2] == expected for chunk in chunks)
+            with self.subTest(name=name):
+                self.assertGreaterEqual(correct / len(chunks), 0.95)
+                if name.startswith("tailo"):
+                    self.assertEqual(correct, len(chunks))
+
+    def test_default_standard(self):
+        for chunk in map(self.thokit.pojAscii2Unicode, self.poj):
+            self.assertIsNone(self.thokit.detect(chunk).standard)
+
+    def test_campbell(self):
+        # 干焦看佮默認標準寫法無仝个段落
+        detected = [
+            self.thokit.detect(campbell).standard
+            for chunk in self.poj
+            for campbell in [self.thokit.pojAscii2Unicode(chunk, standard="campbell")]
+            if campbell != self.thokit.pojAscii2Unicode(chunk)
+        ]
+        self.assertGreaterEqual(detected.count("campbell") / len(detected), 0.9)
+
+    def test_douglas_letters(self):
+        for chunk in self.poj:
+            douglas = self.thokit.pojAscii2Unicode(chunk, standard="douglas")
+            if any(letter in douglas for letter in "ɛɵüƐƟÜ"):
+                self.assertEqual(self.thokit.detect(douglas).standard, "douglas")
+
+    def test_convert_auto(self):
+        self.assertEqual(self.thokit.convertAuto("Chúi chia̍h", "tailo-asc"), "Tsui2 tsiah8")
+        self.assertEqual(self.thokit.convertAuto("Tsui2 tsiah8", "poj-uni"), "Chúi chia̍h")
+        self.assertEqual(self.thokit.convertAuto("tsuí", "tailo-uni"), "tsuí")
+
+
+if __name__ == "__main__":
+    unittest.main()
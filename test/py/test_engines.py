@@ -0,0 +1,62 @@
+import os
+import unittest
+
+from thokit import ThoKit
+
+DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data")
+
+# 轉換方向 => 輸入个測試資料
+SOURCES = {
+    "pojAscii2Unicode": "poj.asc.txt",
+    "pojUnicode2Ascii": "poj.uni.txt",
+    "tailoAscii2Unicode": "tailo.asc.txt",
+    "tailoUnicode2Ascii": "tailo.uni.txt",
+    "pojAscii2TailoAscii": "poj.asc.txt",
+    "tailoAscii2PojAscii": "tailo.asc.txt",
+    "pojUnicode2TailoUnicode": "poj.uni.txt",
+    "tailoUnicode2PojUnicode": "tailo.uni.txt",
+    "tailoAscii2Ipa": "tailo.asc.txt",
+}
+
+
+def readLines(name, step=1):
+    with open(os.path.join(DATA, name), encoding="utf-8") as f:
+        return f.read().splitlines()[::step]
+
+
+class EngineTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.thokit = ThoKit()
+
+    def assertEnginesAgree(self, direction, lines, **options):
+        expected = list(map(self.thokit.compile(direction, **options), lines))
+        for engine in ["token", "table"]:
+            with self.subTest(direction=direction, engine=engine, **options):
+                self.assertEqual(list(map(self.thokit.compile(direction, engine, **options), lines)), expected)
+
+    def test_directions(self):
+        for direction, name in SOURCES.items():
+            self.assertEnginesAgree(direction, readLines(name, 20))
+
+    def test_poj_standards(self):
+        lines = readLines("poj.asc.txt", 50)
+        for standard in self.thokit.poj_standards:
+            self.assertEnginesAgree("pojAscii2Unicode", lines, standard=standard)
+            unicode = list(map(self.thokit.compile("pojAscii2Unicode", standard=standard), lines))
+            self.assertEnginesAgree("pojUnicode2Ascii", unicode, standard=standard)
+
+    def test_ipa(self):
+        lines = list(map(self.thokit.tailoAscii2Ipa, readLines("tailo.asc.txt", 50)))
+        self.assertEnginesAgree("ipa2TailoAscii", lines)
+
+    def test_methods_use_regex_engine(self):
+        for direction, name in SOURCES.items():
+            lines = readLines(name, 100)
+            with self.subTest(direction=direction):
+                method = getattr(self.thokit, direction)
+                self.assertEqual(list(map(method, lines)), list(map(self.thokit.compile(direction), lines)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import random
+import unittest
+
+from thokit import ThoKit
+
+# 轉換方向 => 白話字標準个參數名
+STANDARD_OPTIONS = {
+    "tailoAscii2Unicode": None,
+    "pojUnicode2Ascii": "standard",
+    "pojUnicode2TailoUnicode": "poj_standard",
+    "tailoUnicode2PojUnicode": "poj_standard",
+}
+
+# 隨機編輯用个片段：音節、干焦一个大寫字母个音節、分隔文字
+PIECES = {
+    "tailoAscii2Unicode": ["tsui2", "Tsiah8", "TSA1", "boo2", "a", "oo", " ", "-", "\n", "5", ","],
+    "pojUnicode2Ascii": ["chúi", "Chia̍h", "TSÚI", "O͘", "Ó͘", "á", "lâng", "HO͘Hᴺ", "ⁿ", " ", "-", "\n"],
+    "pojUnicode2TailoUnicode": ["chúi", "O͘", "Ó͘", "Kiâⁿ", "Ɛ", " ", "-", "\n"],
+    "tailoUnicode2PojUnicode": ["tsuí", "Tsia̍h", "ME̋E", "Óo", " ", "-", "\n"],
+}
+
+
+class IncrementalTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.thokit = ThoKit()
+
+    def test_example(self):
+        incremental = self.thokit.incremental("tailoAscii2Unicode", "Tsui2 tsiah8")
+        self.assertEqual(incremental.output, "Tsuí tsia̍h")
+        self.assertEqual(incremental.edit(5, 0, " be7"), (5, 0, "bē "))
+        self.assertEqual(incremental.text, "Tsui2 be7 tsiah8")
+        self.assertEqual(incremental.output, "Tsuí bē tsia̍h")
+        self.assertEqual(incremental.reset("a"), "a")
+
+    def test_random_edits(self):
+        rng = random.Random(0)
+        for direction, pieces in PIECES.items():
+            name = STANDARD_OPTIONS[direction]
+            for standard in [None, *self.thokit.poj_standards] if name else [None]:
+                options = {name: standard} if standard else {}
+                expected = self.thokit.compile(direction, **options)
+                for engine in ["token", "table"]:
+                    incremental = self.thokit.incremental(direction, engine=engine, **options)
+                    for _ in range(300):
+                        text, output = incremental.text, incremental.output
+                        if len(text) > 100:
+                            incremental.reset("")
+                            continue
+                        offset = rng.randint(0, len(text))
+                        deleted = rng.randint(0, min(4, len(text) - offset))
+                        inserted = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 2)))
+                        position, length, new = incremental.edit(offset, deleted, inserted)
+                        message = f"{direction} {standard} {engine}: {incremental.text!r}"
+                        self.assertEqual(incremental.output, expected(incremental.text), message)
+                        self.assertEqual(output[:position] + new + output[position + length :], incremental.output, message)
+
+    def test_bad_edit(self):
+        incremental = self.thokit.incremental("tailoAscii2Unicode", "tsui2")
+        with self.assertRaises(AssertionError):
+            incremental.edit(3, 5, "")
+        with self.assertRaises(AssertionError):
+            self.thokit.incremental("tailoAscii2Unicode", engine="regex")
+
+
+if __name__ == "__main__":
+    unittest.main()
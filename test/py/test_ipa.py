@@ -0,0 +1,55 @@
+import os
+import unittest
+
+from thokit import ThoKit
+
+DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data")
+
+
+def readLines(name, step=1):
+    with open(os.path.join(DATA, name), encoding="utf-8") as f:
+        return f.read().splitlines()[::step]
+
+
+class IpaTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.thokit = ThoKit()
+        cls.lines = readLines("tailo.asc.txt", 20)
+
+    def test_examples(self):
+        thokit = self.thokit
+        self.assertEqual(thokit.tailoAscii2Ipa("tsui2"), "꜂tsui")
+        self.assertEqual(thokit.tailoAscii2Ipa("tsui2", tone_marks="ipa_tone_cateɡory_numbers"), "tsui3")
+        self.assertEqual(thokit.tailoAscii2Ipa("tsui2", tone_marks={2: "˥˧"}), "tsui˥˧")
+        self.assertEqual(thokit.tailoAscii2Ipa("tsir2 ler5", segments={"ir": "i", "er": "e"}), "꜂tsi ꜁le")
+        with self.assertRaises(AssertionError):
+            thokit.tailoAscii2Ipa("tsui2", tone_marks="ipa")
+
+    def test_table_matches_regex(self):
+        # 方法用查表，逐種調符、自定義字母規則攏愛佮正則表達式規則仝款
+        for options in [
+            {},
+            {"tone_marks": "ipa_tone_cateɡory_numbers"},
+            {"tone_marks": tuple("0123456789")},
+            {"segments": {"ir": "i", "er": "e"}},
+        ]:
+            regex = self.thokit.compile("tailoAscii2Ipa", "regex", **options)
+            with self.subTest(**options):
+                self.assertEqual([self.thokit.tailoAscii2Ipa(line, **options) for line in self.lines], list(map(regex, self.lines)))
+
+    def test_round_trip(self):
+        # 國際音標轉轉來：細寫，逐个音節攏有數字調，"-" 變空白
+        for options in [{}, {"tone_marks": "ipa_tone_cateɡory_numbers"}]:
+            for line in self.lines:
+                ipa = self.thokit.tailoAscii2Ipa(line, **options)
+                tailo = self.thokit.ipa2TailoAscii(ipa, **options)
+                self.assertEqual(self.thokit.tailoAscii2Ipa(tailo, **options), ipa, (line, tailo))
+        ipa = self.thokit.tailoAscii2Ipa("Tsui2-tsiah8")
+        self.assertEqual(self.thokit.ipa2TailoAscii(ipa), "tsui2 tsiah8")
+        self.assertEqual(self.thokit.ipa2TailoUnicode(ipa), "tsuí tsia̍h")
+        self.assertEqual(self.thokit.ipa2TailoAscii("水 ꜂tsui!"), "水 tsui2!")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import os
+import tempfile
+import unittest
+
+from thokit import ThoKit
+from thokit import prebuilt
+
+DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data")
+
+
+def readLines(name, step=1):
+    with open(os.path.join(DATA, name), encoding="utf-8") as f:
+        return f.read().splitlines()[::step]
+
+
+class PrebuiltTest(unittest.TestCase):
+    def test_checked_in(self):
+        # `thokit/prebuilt.bin` 佇 git 內底，改轉換規則了後無重建就失敗
+        self.assertTrue(prebuilt.check(), "thokit/prebuilt.bin 過時，愛行 python -m thokit.prebuilt 重建")
+
+    def test_tables_match(self):
+        kit, plain = ThoKit(), ThoKit(prebuilt=False)
+        self.assertIsNotNone(kit._prebuiltTables())
+        lines = readLines("tailo.asc.txt", 50)
+        for src, dst, standard in [
+            ("tailo-asc", "poj-uni", None),
+            ("tailo-asc", "poj-uni", "campbell"),
+            ("tailo-asc", "ipa", None),
+            ("tailo-asc", "tailo-uni", None),
+        ]:
+            with self.subTest(src=src, dst=dst, standard=standard):
+                convert = kit.converter(src, dst, standard, engine="table")
+                expected = plain.converter(src, dst, standard, engine="table")
+                self.assertEqual(list(map(convert, lines)), list(map(expected, lines)))
+
+    def test_stale(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "prebuilt.bin")
+            self.assertFalse(prebuilt.check(path))
+            with open(prebuilt.PATH, "rb") as f:
+                data = f.read()
+            with open(path, "wb") as f:
+                f.write(data[: len(prebuilt._MAGIC) + 20])  # 標頭無完整
+            self.assertFalse(prebuilt.check(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
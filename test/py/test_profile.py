@@ -0,0 +1,26 @@
+import unittest
+
+from thokit import ThoKit
+
+
+class ProfileTest(unittest.TestCase):
+    def test_stages(self):
+        thokit = ThoKit()
+        calls = []
+        with thokit.profile(lambda *arguments: calls.append(arguments)) as profile:
+            self.assertEqual(thokit.pojAscii2Unicode("chui2"), "chúi")
+            thokit.compile("pojAscii2Unicode", "token")("chui2 chiah8")
+        stats = profile.stats
+        self.assertEqual(stats[("pojAscii2Unicode", "*regex")].calls, 1)
+        self.assertEqual(stats[("pojAscii2Unicode", "*token")].calls, 1)
+        stages = [stage for direction, stage in stats if direction == "pojAscii2Unicode" and not stage.startswith("*")]
+        self.assertTrue(stages)
+        self.assertEqual(len(calls), sum(value.calls for value in stats.values()))
+        self.assertIn("pojAscii2Unicode", profile.report())
+        # with 外口無記統計
+        thokit.pojAscii2Unicode("chui2")
+        self.assertEqual(profile.stats[("pojAscii2Unicode", "*regex")].calls, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
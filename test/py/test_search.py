@@ -0,0 +1,96 @@
+import os
+import unittest
+
+from thokit import ThoKit
+
+DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data")
+
+
+def readLines(name, step=1):
+    with open(os.path.join(DATA, name), encoding="utf-8") as f:
+        return f.read().splitlines()[::step]
+
+
+class SearchKeyTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.thokit = ThoKit()
+
+    def test_examples(self):
+        thokit = self.thokit
+        self.assertEqual([thokit.searchKey(text) for text in ["tsuí", "chui2", "TSUI2", "chúi"]], ["tsui2"] * 4)
+        self.assertEqual(thokit.searchKey("Tsiáⁿ-chia̍h", level="plain"), "tsia tsiah")
+        self.assertEqual(thokit.searchKey("Tsiáⁿ-chia̍h", level="toneless"), "tsiann tsiah")
+        self.assertEqual(thokit.searchKey("chhoā hoat-chheng kóe"), thokit.searchKey("tshuā huat-tshing kué"))
+        self.assertEqual(thokit.searchKey("水 tsuí，"), "tsui2")
+        with self.assertRaises(AssertionError):
+            thokit.searchKey("tsuí", level="tones")
+
+    def test_orthographies(self):
+        # 四个測試資料逐逝攏是仝款个音，鍵愛仝款
+        files = [readLines(name, 10) for name in ["tailo.asc.txt", "tailo.uni.txt", "poj.asc.txt", "poj.uni.txt"]]
+        for lines in zip(*files):
+            self.assertEqual(len({self.thokit.searchKey(line) for line in lines}), 1, lines)
+
+    def test_poj_standards(self):
+        for line in readLines("poj.asc.txt", 50):
+            key = self.thokit.searchKey(line)
+            for standard in self.thokit.poj_standards:
+                converted = self.thokit.pojAscii2Unicode(line, standard=standard)
+                self.assertEqual(self.thokit.searchKey(converted), key, (standard, converted))
+
+
+class SearchIndexTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.thokit = ThoKit()
+
+    def test_lookup_and_search(self):
+        index = self.thokit.buildIndex(["Tsuí", "chúi-kóe", "TSIAH8", "kué-tsí tsuí"])
+        self.assertEqual(index.lookup("chui2"), [0])
+        self.assertEqual(index.lookup("tsui2 kue2"), [1])
+        self.assertEqual(index.search("tsui2"), [0, 1, 3])
+        self.assertEqual(index.search("kue2 tsui2"), [1, 3])
+        self.assertEqual(index.search("tsia̍h"), [2])
+        self.assertEqual(index.search("bo5"), [])
+        self.assertEqual(index.search(""), [])
+
+    def test_levels(self):
+        entries = ["tsuí", "tsúi", "tsuì", "tsuinn"]
+        self.assertEqual(self.thokit.buildIndex(entries).search("tsui2"), [0, 1])
+        self.assertEqual(self.thokit.buildIndex(entries, "toneless").search("tsui"), [0, 1, 2])
+        self.assertEqual(self.thokit.buildIndex(entries, "plain").search("tsui"), [0, 1, 2, 3])
+
+
+class PrefixIndexTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.thokit = ThoKit()
+
+    def test_complete(self):
+        index = self.thokit.buildPrefixIndex(["chui2", "chui2-kui2", "chiah8"])
+        self.assertEqual(len(index), 3)
+        self.assertEqual(index.complete("chui2-k"), ["chúi-kúi"])
+        self.assertEqual(index.complete("chui"), ["chúi", "chúi-kúi"])
+        self.assertEqual(index.complete("CHUI2 "), ["chúi-kúi"])
+        self.assertEqual(index.complete(""), ["chia̍h", "chúi", "chúi-kúi"])
+        self.assertEqual(index.complete("c", limit=1), ["chia̍h"])
+        self.assertEqual(index.complete("ts"), [])
+        self.assertEqual(index.span("chi"), (0, 1))
+
+    def test_options(self):
+        index = self.thokit.buildPrefixIndex(["chui2", "chui2-kui2", "chiah8"], standard="campbell", tone_numbers=False)
+        self.assertEqual(index.complete("chui ku"), ["tsúi-kúi"])
+        index = self.thokit.buildPrefixIndex(["tsui2", "tsiah8"], method="tailoAscii2Unicode", engine="regex")
+        self.assertEqual(index.complete("ts"), ["tsia̍h", "tsuí"])
+
+    def test_lexicon(self):
+        lines = readLines("poj.asc.txt", 100)
+        index = self.thokit.buildPrefixIndex(lines)
+        self.assertEqual(index.keys, sorted(index.keys))
+        for line in lines[:50]:
+            self.assertIn(self.thokit.pojAscii2Unicode(line), index.complete(line))
+
+
+if __name__ == "__main__":
+    unittest.main()
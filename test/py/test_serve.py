@@ -0,0 +1,86 @@
+import json
+import asyncio
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from thokit import ThoKit
+from thokit import serve
+
+
+class ServeTest(unittest.TestCase):
+    def request(self, payloads):
+        """
+        啟動服務（一个執行緒个工作池），逐个 payload 用一个連線仝時間送出去，返回 (狀態碼, JSON)
+        """
+
+        async def post(port, payload):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            body = payload if isinstance(payload, bytes) else json.dumps(payload).encode("utf-8")
+            writer.write(b"POST /convert HTTP/1.1\r\nConnection: close\r\nContent-Length: %d\r\n\r\n" % len(body) + body)
+            await writer.drain()
+            response = await reader.read()
+            writer.close()
+            head, _, body = response.partition(b"\r\n\r\n")
+            return int(head.split()[1]), json.loads(body)
+
+        async def run():
+            executor = ThreadPoolExecutor(1, initializer=serve._initWorker, initargs=(4096,))
+            batcher = serve.MicroBatcher(executor, 1)
+            batcher.start()
+            server = await asyncio.start_server(lambda r, w: serve._handle(batcher, r, w), "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            try:
+                return await asyncio.gather(*(post(port, payload) for payload in payloads))
+            finally:
+                server.close()
+                await batcher.stop()
+                executor.shutdown()
+
+        return asyncio.run(run())
+
+    def test_convert(self):
+        thokit = ThoKit()
+        texts = ["Tsui2 tsiah8", "tsa1-boo2", "Tai5-uan5"]
+        responses = self.request(
+            [
+                {"method": "tailoAscii2Unicode", "text": texts[0]},
+                {"method": "tailoAscii2Unicode", "texts": texts},
+                {"src": "tailo-asc", "dst": "poj-uni", "options": {"standard": "campbell"}, "texts": texts},
+                {"method": "tailoAscii2Ipa", "options": {"tone_marks": {"2": "˥˧"}}, "text": "tsui2"},
+            ]
+        )
+        self.assertEqual(responses[0], (200, {"text": thokit.tailoAscii2Unicode(texts[0])}))
+        self.assertEqual(responses[1], (200, {"texts": [thokit.tailoAscii2Unicode(text) for text in texts]}))
+        campbell = thokit.converter("tailo-asc", "poj-uni", "campbell")
+        self.assertEqual(responses[2], (200, {"texts": [campbell(text) for text in texts]}))
+        self.assertEqual(responses[3], (200, {"text": "tsui˥˧"}))
+
+    def test_client_errors(self):
+        payloads = [
+            b"{",
+            {"method": "pojAscii2Unicode", "options": {"standard": "xx"}, "text": "a"},
+            {"method": "tailoAscii2Ipa", "options": {"tone_marks": ["a", "b"]}, "text": "tsui2"},
+            {"method": "pojAscii2Unicode", "options": {"case_spelling": "no"}, "text": "a"},
+            {"src": "tailo-asc", "dst": "ipa", "options": {"standard": "campbell", "bogus": 1}, "text": "a"},
+            {"method": "nope", "text": "a"},
+            {"method": "tailoAscii2Unicode", "texts": ["a", 1]},
+        ]
+        for payload, (status, response) in zip(payloads, self.request(payloads)):
+            with self.subTest(payload=payload):
+                self.assertEqual(status, 400)
+                self.assertTrue(response["error"])
+
+    def test_bad_request_beside_good_one(self):
+        # 仝時間來个請求，一个參數毋着，別个請求照常轉換
+        responses = self.request(
+            [
+                {"method": "tailoAscii2Unicode", "text": "tsui2"},
+                {"method": "tailoAscii2Unicode", "options": {"normalization": "NFKC"}, "text": "tsui2"},
+            ]
+        )
+        self.assertEqual(responses[0], (200, {"text": "tsuí"}))
+        self.assertEqual(responses[1][0], 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
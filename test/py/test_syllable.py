@@ -0,0 +1,65 @@
+import pickle
+import unittest
+
+from thokit import Syllable, ThoKit
+
+ORTHOGRAPHIES = ["tailo-asc", "tailo-uni", "poj-asc", "poj-uni", "ipa"]
+
+
+class SyllableTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.thokit = ThoKit()
+        cls.inventory = cls.thokit.syllableInventory()[::7]
+
+    def test_fields(self):
+        syllable = Syllable.parse("Tshiánn", "tailo-uni")
+        fields = (syllable.initial, syllable.medial, syllable.nucleus, syllable.coda, syllable.nasal, syllable.tone)
+        self.assertEqual(fields, ("tsh", "i", "a", "", True, 2))
+        self.assertEqual(syllable.case, 1)
+        self.assertEqual(syllable.final, "iann")
+        self.assertFalse(syllable.entering)
+        self.assertTrue(Syllable.parse("tsiah8").entering)
+        self.assertEqual(syllable.render("poj-uni"), "Chhiáⁿ")
+        self.assertEqual(repr(syllable), "Syllable('Tshiann2')")
+
+    def test_interned(self):
+        syllable = Syllable.parse("tsiah8")
+        self.assertIs(Syllable.parse("tsia̍h", "tailo-uni"), syllable)
+        self.assertIs(Syllable.parse("chiah8", "poj-asc"), syllable)
+        self.assertIs(pickle.loads(pickle.dumps(syllable)), syllable)
+        self.assertEqual({syllable: 1}[Syllable("ts", "i", "a", "h", False, 8)], 1)
+        with self.assertRaises(AttributeError):
+            syllable.tone = 4
+
+    def test_invalid(self):
+        for text in ["xyz", "tsui2 tsui2", "", "tsui10"]:
+            with self.subTest(text=text):
+                self.assertIsNone(Syllable.parse(text))
+
+    def test_inventory_round_trip(self):
+        for orthography in ORTHOGRAPHIES:
+            convert = self.thokit.converter("tailo-asc", orthography) if orthography != "tailo-asc" else str
+            for text in self.inventory:
+                for variant in (text, text.capitalize(), text.upper()):
+                    syllable = Syllable.parse(variant)
+                    rendered = syllable.render(orthography)
+                    with self.subTest(orthography=orthography, text=variant):
+                        self.assertEqual(syllable.tailoAscii(), variant)
+                        self.assertEqual(rendered, convert(variant))
+                        if orthography != "ipa":
+                            # Unicode 無寫調符个音節拆做陰平、陰入，寫轉去仝款
+                            self.assertEqual(Syllable.parse(rendered, orthography).render(orthography), rendered)
+
+    def test_render_options(self):
+        syllable = Syllable.parse("TSIAH8")
+        self.assertEqual(syllable.render("poj-uni", "campbell"), "CHIA̍H")
+        self.assertEqual(Syllable.parse("tsuann7").render("poj-uni", "campbell"), "tsōaⁿ")
+        self.assertEqual(
+            syllable.render("poj-uni", "campbell", case_spelling=False),
+            self.thokit.converter("tailo-asc", "poj-uni", "campbell", case_spelling=False)("TSIAH8"),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
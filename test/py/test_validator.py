@@ -0,0 +1,66 @@
+import os
+import unicodedata
+import unittest
+
+from thokit import ThoKit
+
+DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data")
+
+
+def readLines(name, step=1):
+    with open(os.path.join(DATA, name), encoding="utf-8") as f:
+        return f.read().splitlines()[::step]
+
+
+class ValidatorTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.thokit = ThoKit()
+
+    def test_spans(self):
+        validator = self.thokit.validator("tailo-asc")
+        self.assertEqual(validator.invalidSpans("Tsui2 tsiah2 mann5"), [(6, 12), (13, 18)])
+        self.assertEqual(validator.invalidSpans("tsui2 12, tsiah4"), [])
+        validator = self.thokit.validator("tailo-uni")
+        self.assertEqual(validator.invalidSpans("tsuí tsui2 -- tsia̍h"), [(5, 10)])
+
+    def test_syllables(self):
+        validator = self.thokit.validator("tailo-asc")
+        for syllable in ["tsui2", "Tsui2", "TSUI2", "tsiah", "tsiah4", "mng5"]:
+            with self.subTest(syllable=syllable):
+                self.assertTrue(validator.isValid(syllable))
+        for syllable in ["tSui2", "tsiah2", "mann5", "tsui10", "tsu2i"]:
+            with self.subTest(syllable=syllable):
+                self.assertFalse(validator.isValid(syllable))
+
+    def test_unicode_forms(self):
+        validator = self.thokit.validator("tailo-uni")
+        self.assertTrue(validator.isValid("tsuí"))
+        self.assertTrue(validator.isValid(unicodedata.normalize("NFD", "tsuí")))
+        self.assertTrue(self.thokit.validator("ipa").isValid(self.thokit.tailoAscii2Ipa("tsui2")))
+
+    def test_poj_standards(self):
+        for standard in self.thokit.poj_standards:
+            validator = self.thokit.validator("poj-uni", standard)
+            lines = [self.thokit.pojAscii2Unicode(line, standard=standard) for line in readLines("poj.asc.txt", 10)]
+            with self.subTest(standard=standard):
+                self.assertEqual(list(validator.invalidLines(lines)), [])
+        douglas = self.thokit.pojAscii2Unicode("bee5", standard="douglas")
+        self.assertTrue(self.thokit.validator("poj-uni", "douglas").isValid(douglas))
+        self.assertFalse(self.thokit.validator("poj-uni").isValid(douglas))
+
+    def test_corpus(self):
+        for orthography, name in [
+            ("tailo-asc", "tailo.asc.txt"),
+            ("tailo-uni", "tailo.uni.txt"),
+            ("poj-asc", "poj.asc.txt"),
+            ("poj-uni", "poj.uni.txt"),
+        ]:
+            with self.subTest(orthography=orthography):
+                self.assertEqual(list(self.thokit.validator(orthography).invalidLines(readLines(name, 10))), [])
+        lines = ["tsui2", "tsiah2", "", "mann5 a"]
+        self.assertEqual(list(self.thokit.validator().invalidLines(lines, start=0)), [1, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()
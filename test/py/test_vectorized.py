@@ -0,0 +1,78 @@
+import os
+import unittest
+
+from thokit import ThoKit
+
+try:
+    import numpy as np
+    from thokit import vectorized
+except ImportError:
+    vectorized = None
+
+DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data")
+
+FILES = {
+    "tailo-asc": "tailo.asc.txt",
+    "tailo-uni": "tailo.uni.txt",
+    "poj-asc": "poj.asc.txt",
+    "poj-uni": "poj.uni.txt",
+}
+ORTHOGRAPHIES = ["tailo-asc", "tailo-uni", "poj-asc", "poj-uni", "ipa"]
+
+
+def readLines(name, step=1):
+    with open(os.path.join(DATA, name), encoding="utf-8") as f:
+        return f.read().splitlines()[::step]
+
+
+@unittest.skipIf(vectorized is None, "愛先裝 NumPy")
+class VectorizedTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.thokit = ThoKit()
+        cls.lines = {orthography: readLines(name, 40) for orthography, name in FILES.items()}
+
+    def test_matches_converter(self):
+        for source, lines in self.lines.items():
+            encoded = vectorized.encode(lines, source)
+            self.assertEqual(len(encoded.offsets), len(lines) + 1)
+            for target in ORTHOGRAPHIES:
+                expected = lines if source == target else list(map(self.thokit.converter(source, target), lines))
+                with self.subTest(source=source, target=target):
+                    self.assertEqual(vectorized.decode(*encoded, target=target), expected)
+
+    def test_case(self):
+        lines = ["O͘ Ó͘", "Ó͘ ê", "Ó͘ Ê", "CHÚI", "Chúi", "Ó͘"]
+        encoded = vectorized.encode(lines, "poj-uni")
+        self.assertEqual(vectorized.decode(*encoded, target="poj-asc"), list(map(self.thokit.pojUnicode2Ascii, lines)))
+
+    def test_tones(self):
+        encoded = vectorized.encode(["Tsuí tsia̍h, tsa-bóo"], "tailo-uni")
+        stripped = vectorized.stripTones(encoded.ids)
+        self.assertEqual(vectorized.decode(stripped, encoded.offsets, encoded.pieces), ["Tsui tsiah, tsa-boo"])
+        mapped = vectorized.mapTones(encoded.ids, {2: 3, 8: 4})
+        self.assertEqual(vectorized.decode(mapped, encoded.offsets, encoded.pieces), ["Tsui3 tsiah4, tsa1-boo3"])
+        with self.assertRaises(AssertionError):
+            vectorized.mapTones(encoded.ids, {10: 1})
+
+    def test_fields(self):
+        encoded = vectorized.encode(["Tsui2 a", "TSIAH8"])
+        initials, finals, tones, cases = vectorized.fields(encoded.ids)
+        self.assertEqual(tones.tolist(), [2, -1, 0, 8])
+        self.assertEqual(cases.tolist(), [1, -1, 0, 2])
+        self.assertEqual(self.thokit.tailo_finals[finals[3]], "iah")
+        ids = vectorized.compose(initials, finals, tones, cases)
+        syllables = encoded.ids >= 0
+        self.assertTrue(np.array_equal(ids[syllables], encoded.ids[syllables]))
+
+    def test_standard(self):
+        lines = self.lines["tailo-asc"]
+        encoded = vectorized.encode(lines)
+        for standard in self.thokit.poj_standards:
+            with self.subTest(standard=standard):
+                expected = list(map(self.thokit.converter("tailo-asc", "poj-uni", standard), lines))
+                self.assertEqual(vectorized.decode(*encoded, target="poj-uni", standard=standard), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,3283 @@
+import os
+import re
+import time
+import inspect
+import threading
+import unicodedata
+from bisect import bisect_left, bisect_right
+from collections import deque, namedtuple
+from contextlib import contextmanager
+from difflib import SequenceMatcher
+from functools import lru_cache, partial
+from itertools import islice, product
+from types import MappingProxyType
+from typing import Callable, Iterable, Iterator, List, Tuple, Union, Dict
+
+_TONE_NUMBER_TO_END = re.compile(r"(\d)([a-z]+)([^a-z]|$)", flags=re.IGNORECASE)
+_SEGMENTAL_SYLLABLE = re.compile(r"([a-zA-Z]+)([^\da-zA-Z]|$)")
+_NUMBERED_SYLLABLE = re.compile(r"[a-zA-Z]+\d")
+_TONE_NUMBER = re.compile(r"([aeioumn])(\d)", flags=re.IGNORECASE)
+_ACCENT_TO_END = re.compile(r"([\u0300-\u030f])([a-z]+)([^a-z]|$)", flags=re.IGNORECASE)
+_ACCENTED_SYLLABLE = re.compile(r"[a-zA-Z]+[\u0300-\u030f]")
+_VOWEL = re.compile(r"[aeiou]", flags=re.IGNORECASE)
+
+# 白話字特殊字母
+_POJ_SPECIAL_LETTER_UNICODE = re.compile(r"[ⁿᴺ\u0358\u0308ɵƟɛƐ]")
+_DOUGLAS_OE_UNICODE = re.compile(r"o([\u0300-\u030f]?)\u0308")
+_DOUGLAS_UI_UNICODE = re.compile(r"u([\u0300-\u030f]?)\u0308")
+_DOUGLAS_Y_UNICODE = re.compile(r"i\u0308")
+_POJ_SPECIAL_LETTER_ASCII = re.compile(r"o[\u0300-\u030f]?o|nn", flags=re.IGNORECASE)
+_DOUGLAS_SPECIAL_LETTER_ASCII = re.compile(
+    r"o[\u0300-\u030f]?[o\u0358]|nn|[ie][\u0300-\u030f]?r|e[\u0300-\u030f]?e|y", flags=re.IGNORECASE
+)
+_POJ_OO_ASCII = re.compile(r"(o)([\u0300-\u030f]?)(o)")
+_POJ_NN_ASCII = re.compile(r"nn(h)?([^g\u0300-\u030f]|$)")
+_DOUGLAS_OO_ASCII = re.compile(r"o([\u0300-\u030f]?\u0358)")
+_DOUGLAS_IR_ASCII = re.compile(r"i([\u0300-\u030f]?)(r)")
+_DOUGLAS_ER_ASCII = re.compile(r"e([\u0300-\u030f]?)(r)")
+_DOUGLAS_EE_ASCII = re.compile(r"e([\u0300-\u030f]?)(e)")
+_DOUGLAS_Y_ASCII = re.compile(r"y([oh\d])")
+_POJ_H_NASAL = re.compile(r"(h)(ⁿ|ᴺ)", flags=re.IGNORECASE)
+_POJ_NASAL_H = re.compile(r"(ⁿ|ᴺ)(h)", flags=re.IGNORECASE)
+
+# 白話字、臺羅字母互轉
+# 元音換掉，後壁个字母照原本；規段全細寫換做細寫，其他大小寫組合換做大寫，參考 `_asciiRewrites`
+_POJ_OA = re.compile(r"o(?=([ae]))", flags=re.IGNORECASE)
+_POJ_ENG = re.compile(r"e(?=(ng|k))", flags=re.IGNORECASE)
+_TAILO_UA = re.compile(r"u(?=([ae]))", flags=re.IGNORECASE)
+_TAILO_ING = re.compile(r"i(?=(ng|k))", flags=re.IGNORECASE)
+
+# 白話字標準
+_POJ_SUPPORT_N = re.compile(r"([aeiou])N")
+_POJ_ONN = re.compile(r"([^o])onn")
+_POJ_NOO = re.compile(r"(n)(oo)([^n])")
+_POJ_MOONN = re.compile(r"(m|ng)(oo)(nn)")
+_POJ_CH_TS = re.compile(r"ch([^eih])")
+_POJ_TS_CH = re.compile(r"ts([eih])")
+_POJ_IAN = re.compile(r"(i)a([nt])([^ng]|$)")
+_POJ_IEN = re.compile(r"(i)e([nt])([^ng]|$)")
+_CAMPBELL_MOONN_ASCII = re.compile(r"(m|n|ng)(oo)(nn)")
+_CAMPBELL_OONN_ASCII = re.compile(r"(o)(o)(nn)")
+_CAMPBELL_HNN = re.compile(r"(h)(nn)", flags=re.IGNORECASE)
+_CAMPBELL_MOONN = re.compile(
+    r"(m|n|ng)(o)([\u0300-\u030f]?)(o)(nn)", flags=re.IGNORECASE
+)
+_CAMPBELL_OONN = re.compile(r"(o)([\u0300-\u030f]?)(o)(nn)", flags=re.IGNORECASE)
+
+# 數字調、調符徙位
+_TAILO_TONE_NUMBER_VOWEL = re.compile(
+    r"([aeiou])(r?m?n*h?g?p?t?k?)(\d)", flags=re.IGNORECASE
+)
+_TAILO_TONE_NUMBER_DIPHTHONG = re.compile(r"([aeo])([iueo])(\d)", flags=re.IGNORECASE)
+_TONE_NUMBER_NG = re.compile(r"(n)(gh?)(\d)", flags=re.IGNORECASE)
+_TONE_NUMBER_M = re.compile(r"(m)(h?)(\d)", flags=re.IGNORECASE)
+_POJ_TONE_NUMBER_AE = re.compile(r"([ae])([a-z]*)(\d)", flags=re.IGNORECASE)
+_POJ_TONE_NUMBER_O = re.compile(r"(o)([a-z]*)(\d)", flags=re.IGNORECASE)
+_POJ_TONE_NUMBER_U = re.compile(r"(u)([a-z]*)(\d)", flags=re.IGNORECASE)
+_POJ_TONE_NUMBER_I = re.compile(r"(i)([a-z]*)(\d)", flags=re.IGNORECASE)
+_CAMPBELL_TONE_NUMBER_OA = re.compile(
+    r"([a-z])(o)([ae])(\d)(nn)?([^a-z]|$)", flags=re.IGNORECASE
+)
+_CAMPBELL_TONE_NUMBER_AINNH = re.compile(r"(a)(8)(i)(nnh)", flags=re.IGNORECASE)
+_DOUGLAS_TONE_NUMBER_OE = re.compile(r"(o)(e)(\d)", flags=re.IGNORECASE)
+_DOUGLAS_TONE_NUMBER_AINN = re.compile(r"(a)(\d)(i)(nn)", flags=re.IGNORECASE)
+_BARCLAY_TONE_NUMBER_OA = re.compile(
+    r"([a-z])(o)(a)(\d)(nn)?([^a-z]|$)", flags=re.IGNORECASE
+)
+_POJ_TONE_NUMBER_OA = re.compile(r"(o)([ae])(\d)(nn)?([^a-z]|$)", flags=re.IGNORECASE)
+_TAILO_TONE_ACCENT_VOWEL = re.compile(
+    r"([aeiou])(r?m?n*h?g?p?t?k?)([\u0300-\u030f])", flags=re.IGNORECASE
+)
+_TAILO_TONE_ACCENT_DIPHTHONG = re.compile(
+    r"([aeo])([iueo])([\u0300-\u030f])", flags=re.IGNORECASE
+)
+_TONE_ACCENT_NG = re.compile(r"(n)(gh?)([\u0300-\u030f])", flags=re.IGNORECASE)
+_TONE_ACCENT_M = re.compile(r"(m)(h?)([\u0300-\u030f])", flags=re.IGNORECASE)
+_POJ_TONE_ACCENT_AE = re.compile(r"([ae])([a-z]*)([\u0300-\u030f])", flags=re.IGNORECASE)
+_POJ_TONE_ACCENT_O = re.compile(r"(o)([a-z]*)([\u0300-\u030f])", flags=re.IGNORECASE)
+_POJ_TONE_ACCENT_U = re.compile(r"(u)([a-z]*)([\u0300-\u030f])", flags=re.IGNORECASE)
+_POJ_TONE_ACCENT_I = re.compile(r"(i)([a-z]*)([\u0300-\u030f])", flags=re.IGNORECASE)
+_CAMPBELL_TONE_ACCENT_OA = re.compile(
+    r"([a-z])(o)([ae])([\u0300-\u030f])(nn)?([^a-z]|$)", flags=re.IGNORECASE
+)
+_POJ_TONE_ACCENT_OA = re.compile(
+    r"(o)([ae])([\u0300-\u030f])(nn)?([^a-z]|$)", flags=re.IGNORECASE
+)
+
+# 國際音標
+_IPA_NASAL_VOWEL = re.compile(r"([aeiou])(r?)(\u0303)", flags=re.IGNORECASE)
+_IPA_NASAL_DIPHTHONG = re.compile(r"([aeo])([iueo])(\u0303)", flags=re.IGNORECASE)
+_IPA_SEGMENTAL_SYLLABLE = re.compile(r"([a-z]+)([^\da-z]|$)")
+_IPA_NUMBERED_SYLLABLE = re.compile(r"([a-z]+)(\d)")
+_IPA_NN = re.compile(r"([aeiou]r?)nn")
+_IPA_NASAL_SYLLABLE = re.compile(r"([a-z]+)\u0303")
+_IPA_ASPIRATED = re.compile(r"([ptks])h")
+_IPA_OPEN_O = re.compile(r"o([nŋk])")
+
+# 臺羅韻母拆做介音、主要元音、韻尾、鼻化；喉塞 h 算韻尾，寫佇 nn 後壁
+_TAILO_FINAL = re.compile(
+    r"(?P<medial>[iu](?=[aeiou]))?(?P<nucleus>oo|ere|ir|er|or|ee|[aeiou]|ng|m)"
+    r"(?P<coda>[iu]?(?:ng|[mnptk])?)(?P<nasal>nn)?(?P<glottal>h)?"
+)
+_TAILO_SYLLABLE = re.compile(r"([a-z]+)(\d?)")
+
+# 音節切分：連續个拉丁字母、數字、調符、ⁿ/ᴺ 等算一个音節，其他攏算分隔文字
+_TOKEN = re.compile(
+    r"([0-9A-Za-z\u00c0-\u00d6\u00d8-\u00f6\u00f8-\u036f"
+    r"\u1d00-\u1eff\u2070-\u209f\u212a\ua700-\ua71f]+)"
+)
+# 漢字：毋是字母、數字，無大小寫，Unicode 正則化嘛袂變，轉換規則袂改着伊
+_HAN = re.compile(
+    r"[\u3001-\u3003\u3005-\u3011\u3014-\u301b\u3400-\u4dbf\u4e00-\u9fff"
+    r"\U00020000-\U0002a6df\U0002a700-\U0002ebef\U00030000-\U0003134f]+"
+)
+# `_HAN` 个字攏佇 U+3001 以後，檢查文本敢有漢字用即个較緊，有才用 `_HAN` 切
+_HAN_CANDIDATE = re.compile(r"[\u3001-\U0003134f]")
+_HAN_PLACEHOLDER = "漢"
+"""
+轉換个時代替規段漢字个字，伊本身嘛是漢字，轉換規則看起來佮原本个漢字仝款
+"""
+# 頭尾音節敢會受上下文影響（包括 ou => oo、N => nn、ts => ch 等較早个階段）
+_CONTEXT_START_ONN = re.compile(r"on", flags=re.IGNORECASE)
+_CONTEXT_END_NOO_CH = re.compile(r"(no[ou]|ch|ts)\Z", flags=re.IGNORECASE)
+_CONTEXT_ANY = re.compile("")
+_SOURCE_ORTHOGRAPHIES = {
+    "tailoAscii2Unicode": "tailo-asc",
+    "tailoUnicode2Ascii": "tailo-uni",
+    "pojAscii2Unicode": "poj-asc",
+    "pojUnicode2Ascii": "poj-uni",
+    "pojAscii2TailoAscii": "poj-asc",
+    "tailoAscii2PojAscii": "tailo-asc",
+    "pojUnicode2TailoUnicode": "poj-uni",
+    "tailoUnicode2PojUnicode": "tailo-uni",
+    "tailoAscii2Ipa": "tailo-asc",
+    "ipa2TailoAscii": "ipa",
+}
+"""
+逐个轉換方向个輸入拼寫
+"""
+_ORTHOGRAPHY_GRAPH = {
+    "tailo-asc": {
+        "tailo-uni": "tailoAscii2Unicode",
+        "poj-asc": "tailoAscii2PojAscii",
+        "ipa": "tailoAscii2Ipa",
+    },
+    "tailo-uni": {"tailo-asc": "tailoUnicode2Ascii", "poj-uni": "tailoUnicode2PojUnicode"},
+    "poj-asc": {"poj-uni": "pojAscii2Unicode", "tailo-asc": "pojAscii2TailoAscii"},
+    "poj-uni": {"poj-asc": "pojUnicode2Ascii", "tailo-uni": "pojUnicode2TailoUnicode"},
+    "ipa": {"tailo-asc": "ipa2TailoAscii"},
+}
+"""
+拼寫之間有直接轉換个方向：輸入拼寫 => {輸出拼寫: 轉換方向}
+"""
+_POJ_UNICODE_DIRECT_DIRECTIONS = ["tailoUnicode2PojUnicode", "pojUnicode2TailoUnicode"]
+"""
+臺羅、白話字 Unicode 直接轉換个方向，白話字標準个拼寫規則（甘爲霖 ts/ch、杜嘉德 ian/ien 等）無齊，
+大寫字母嘛無仝款，`ThoKit.converter` 無行即兩个方向，經過白話字 ASCII
+"""
+_CASE_SENSITIVE_DIRECTIONS = ["pojUnicode2Ascii", "pojUnicode2TailoUnicode"]
+"""
+干焦一个大寫字母个音節（譬論講 `O͘`），轉換結果愛看隔壁音節大小寫个轉換方向（參考 `_eitherCase`）
+"""
+_SEPARATOR_FUNCTIONS = {"tailoAscii2Ipa": lambda text: text.lower().replace("-", " ")}
+"""
+分隔文字个轉換，無佇即度个轉換方向分隔文字攏原樣保留
+"""
+_DETECT_LETTER_CUES = {
+    # 臺羅
+    "tsh": "tailo",
+    "tsi": "tailo",
+    "tse": "tailo",
+    "ua": "tailo",
+    "ue": "tailo",
+    "ing": "tailo",
+    "ik": "tailo",
+    # 白話字
+    "ch": "poj",
+    "oa": "poj",
+    "oe": "poj",
+    "eng": "poj",
+    "ek": "poj",
+    # ASCII 个鼻化、o͘
+    "nn": "ascii",
+    "oo": "ascii",
+    # 白話字標準：現代寫 cha，甘爲霖、杜嘉德、巴克禮寫 tsa；巴克禮、杜嘉德寫 ien
+    "ien": "barclay",
+    "cha": "default",
+    "tsa": "classic",
+    "tso": "classic",
+    "tsu": "classic",
+}
+"""
+`ThoKit.detect` 看个字母組合（細寫，干焦算仝一个音節內底）=> 特徵
+"""
+_DETECT_MARK_CUES = {
+    "\u0358": "poj",  # o͘
+    "\u030b": "tailo",  # 臺羅第九調 a̋
+    "\u0306": "poj",  # 白話字第九調 ă
+    "\u0308": "douglas",  # 杜嘉德 ö、ü
+}
+"""
+`ThoKit.detect` 看个調符、附加符號 => 特徵
+"""
+_DETECT_DOUGLAS_LETTERS = "ɛɵƐƟ"
+
+Detection = namedtuple("Detection", ["orthography", "encoding", "standard", "confidence"])
+"""
+`ThoKit.detect` 个結果：拼寫（"tailo"、"poj"）、編碼（"asc" 數字調、"uni" 調符）、
+白話字標準（None 是默認標準）、信心（0～1）
+"""
+
+
+@lru_cache(maxsize=None)
+def _detectSymbols() -> Dict[str, str]:
+    """
+    `ThoKit.detect` 逐字拆做字母佮附加符號（NFD）个對照表，ᴺ 當做 ⁿ
+    """
+    symbols = {"ᴺ": "ⁿ"}
+    for code in [*range(0xC0, 0x250), *range(0x1E00, 0x1F00)]:
+        char = chr(code)
+        decomposed = unicodedata.normalize("NFD", char)
+        if decomposed != char:
+            symbols[char] = decomposed
+    return symbols
+
+
+_ORAL_NASAL_INITIALS = {"m", "n", "ng", "b", "l", "g"}
+"""
+`ThoKit.validator` 袂使配鼻化韻母个聲母：鼻音聲母本身就鼻化，濁音聲母配鼻化韻母會變做鼻音聲母
+"""
+
+_SEARCH_LEVELS = ("tone", "toneless", "plain")
+"""
+`ThoKit.searchKey` 个層級：保留聲調、無聲調、無聲調閣無鼻化
+"""
+_SEARCH_LETTERS = {ord("ⁿ"): "nn", ord("ᴺ"): "nn", ord("\u0358"): "o", ord("ɵ"): "o", ord("ɛ"): "ee"}
+_SEARCH_NASAL_H = re.compile(r"hnn$")
+_SEARCH_NASAL_INITIAL_ONN = re.compile(r"^(m|ng|n)o{1,2}nn")
+_SEARCH_NASAL = re.compile(r"(?<=[aeiou])nn(?=h?$)")
+
+
+def _isStableSeparator(separator: str) -> bool:
+    """
+    分隔文字佇 Unicode 正則化个時敢袂佮邊仔个音節鬥做伙
+    """
+    return separator.isascii() or (
+        unicodedata.combining(separator[0]) == 0
+        and unicodedata.is_normalized("NFC", separator)
+        and unicodedata.is_normalized("NFD", separator)
+        and not any(char.isdecimal() for char in separator)  # 正則表達式 \d 嘛算全形、阿拉伯數字
+    )
+
+
+_CASE_LOWER, _CASE_TITLE, _CASE_UPPER, _CASE_EITHER = range(4)
+"""
+音節个大小寫：細寫、首字母大寫、全大寫，`_CASE_EITHER` 是干焦一个字母大寫（首字母大寫、全大寫攏是）
+"""
+
+
+@lru_cache(maxsize=4096)
+def _caseMask(token: str) -> Union[int, None]:
+    """
+    音節个大小寫（ᴺ 是 ⁿ 个大寫），大細寫濫做伙就返回 None
+    """
+    lower = token.lower().replace("ᴺ", "ⁿ")
+    if lower == token:
+        return _CASE_LOWER
+    title = lower[:1].upper() + lower[1:]
+    if token.upper().replace("ⁿ", "ᴺ") == token:  # 因爲 ᴺ 个緣故，袂使用 token.isupper()
+        return _CASE_EITHER if title == token else _CASE_UPPER
+    return _CASE_TITLE if title == token else None
+
+
+def _applyCaseMask(token: str, mask: int) -> str:
+    """
+    共細寫个轉換結果改做 `_caseMask` 記落來个大小寫，`_CASE_EITHER` 當做全大寫
+    """
+    if mask == _CASE_TITLE:
+        return token[:1].upper() + token[1:]
+    if mask in (_CASE_UPPER, _CASE_EITHER):
+        return token.upper().replace("ⁿ", "ᴺ")
+    return token
+
+
+def _eitherCase(pieces: List[str], i: int, single: Union[int, None] = _CASE_UPPER) -> Union[int, None]:
+    """
+    干焦一个大寫字母个音節（`_CASE_EITHER`，譬論講 `O͘`）看隔壁个音節：
+    隔壁攏是大寫个時當做全大寫，隔壁有細寫个時當做首字母大寫，孤一个音節个時是 single
+
+    參數：
+        pieces (List[str]): `_TOKEN.split` 个片段，音節佇奇數个位置
+        i (int): 音節个位置
+        single (Union[int, None]，可選): 孤一个音節（隔壁無音節）个時返回个值，默認 `_CASE_UPPER`
+    返回：
+        Union[int, None]: `_CASE_UPPER`、`_CASE_TITLE` 抑是 single
+    """
+    neighbors = [pieces[j] for j in (i - 2, i + 2) if 0 < j < len(pieces)]
+    if not neighbors:
+        return single
+    if all(_caseMask(neighbor) in (_CASE_UPPER, _CASE_EITHER) for neighbor in neighbors):
+        return _CASE_UPPER
+    return _CASE_TITLE
+
+
+@lru_cache(maxsize=4096)
+def _transferCase(token: str, converted: str) -> str:
+    """
+    大細寫濫做伙个音節：細寫个轉換結果佮原本个音節（NFD）對齊，逐段照原本个字改大小寫，
+    換掉、加入个字照頭前上近个字母（譬論講 `tÖ` => `tER`、`Chiaᴺ` => `ChiaNN`）
+    """
+    source = unicodedata.normalize("NFD", token)
+    lower = source.lower().replace("ᴺ", "ⁿ")
+    if len(lower) != len(source):
+        return converted
+    cases, upper = [], False
+    for char, low in zip(source, lower):
+        if char.upper().replace("ⁿ", "ᴺ") != low:  # 干焦字母有大小寫，附加符號綴頭前个字母
+            upper = char != low
+        cases.append(upper)
+    result = []
+    for tag, i1, i2, j1, j2 in SequenceMatcher(None, lower, converted, autojunk=False).get_opcodes():
+        if tag == "equal":
+            result += [char.upper() if up else char for char, up in zip(converted[j1:j2], cases[i1:i2])]
+        elif any(cases[i1:i2]) or (i1 == i2 and i1 and cases[i1 - 1]):
+            result.append(converted[j1:j2].upper().replace("ⁿ", "ᴺ"))
+        else:
+            result.append(converted[j1:j2])
+    return "".join(result)
+
+
+def _foldCase(function: Callable[[str], str], text: str, single: int = _CASE_UPPER) -> str:
+    """
+    干焦寫細寫規則个轉換：逐个音節先記大小寫（`_caseMask`、`_eitherCase`，single 參考 `_eitherCase`）閣轉細寫，
+    規个文本一擺轉換了後才照記落來个大小寫改倒轉去。大細寫濫做伙个音節參考 `_transferCase`。
+    """
+    lower = text.lower().replace("ᴺ", "ⁿ")
+    if lower == text:
+        return function(text)
+    pieces, lowers = _TOKEN.split(text), _TOKEN.split(lower)
+    if len(lowers) != len(pieces):
+        return function(text)
+    if pieces[::2] != lowers[::2]:  # 分隔文字有大小寫（譬論講希臘字母），原樣保留
+        lowers[::2] = pieces[::2]
+        lower = "".join(lowers)
+    masks, mixed = {}, {}
+    for i in [i for i in range(1, len(pieces), 2) if pieces[i] != lowers[i]]:
+        mask = _caseMask(pieces[i])
+        if mask is None:
+            mixed[i] = pieces[i]
+        elif mask:
+            masks[i] = _eitherCase(pieces, i, single) if mask == _CASE_EITHER else mask
+    converted = _TOKEN.split(function(lower))
+    if len(converted) != len(pieces):
+        return function(text)
+    for i, mask in masks.items():
+        converted[i] = _applyCaseMask(converted[i], mask)
+    for i, token in mixed.items():
+        converted[i] = _transferCase(token, converted[i])
+    return "".join(converted)
+
+
+def _replaceCased(new: str, match: "re.Match") -> str:
+    """
+    `_POJ_OA` 等規則个替換：原本全細寫換做細寫，其他大小寫組合換做大寫
+    """
+    return new if (match.group(0) + match.group(1)).islower() else new.upper()
+
+
+def _caseSharedCache(function: Callable[[str], str], maxsize: int) -> Callable[[str], str]:
+    """
+    音節函數个 LRU 快取：首字母大寫、全大寫个音節轉細寫查快取，結果才改倒轉去，
+    `Tsui2`、`TSUI2` 佮 `tsui2` 共用一个快取項目。大細寫濫做伙个音節原樣查。
+    返回个函數有 `cache_info`、`cache_clear`，佮 `functools.lru_cache` 仝款
+    """
+    cached = lru_cache(maxsize=maxsize)(function)
+
+    def convert(syllable: str) -> str:
+        if syllable.islower():
+            return cached(syllable)
+        mask = _caseMask(syllable)
+        if mask is None:
+            return cached(syllable)
+        return _applyCaseMask(cached(syllable.lower()), mask)
+
+    convert.cache_info = cached.cache_info
+    convert.cache_clear = cached.cache_clear
+    return convert
+
+
+def _replacePojSpecialLetters(text: str, standard: str) -> str:
+    """
+    `ThoKit.pojSpecialLetterUnicode2Ascii` 个轉換規則，干焦細寫，大小寫由 `_foldCase` 處理
+    """
+    text = text.replace("ⁿ", "nn").replace("͘", "o")
+    if standard == "douglas":
+        text = text.replace("ɵ", "o")
+        text = _DOUGLAS_OE_UNICODE.sub(r"e\1r", text)
+        text = _DOUGLAS_UI_UNICODE.sub(r"i\1r", text)
+        text = text.replace("ɛ", "ee")
+        text = _DOUGLAS_Y_UNICODE.sub(r"y", text)
+    return text
+
+
+def _replacePojSpecialLettersAscii(text: str, standard: str) -> str:
+    """
+    `ThoKit.pojSpecialLetterAscii2Unicode` 个轉換規則，干焦細寫，大小寫由 `_foldCase` 處理
+    """
+    text = _POJ_OO_ASCII.sub("\\1\\2\u0358", text)  # oo => o͘
+    text = _POJ_NN_ASCII.sub(r"ⁿ\1\2", text)  # nn => ⁿ
+    if standard == "douglas":
+        text = _DOUGLAS_OO_ASCII.sub(r"ɵ\1", text)
+        text = _DOUGLAS_IR_ASCII.sub("u\\1\u0308", text)
+        text = _DOUGLAS_ER_ASCII.sub("o\\1\u0308", text)
+        text = _DOUGLAS_EE_ASCII.sub("ɛ\\1", text)
+        text = _DOUGLAS_Y_ASCII.sub("i\u0308\\1", text)
+    return text
+
+
+def _convertSyllables(
+    convert: Callable[[str], str], syllables: List[str]
+) -> Union[List[str], None]:
+    """
+    共音節用空白連做伙一擺轉換，若轉換結果對袂齊，抑是有音節袂轉換得（譬論講自定義調符無齊），就返回 None
+    """
+    try:
+        converted = convert(" ".join(syllables)).split(" ")
+    except (KeyError, IndexError):
+        return None
+    return converted if len(converted) == len(syllables) else None
+
+
+def _freeze(value):
+    """
+    共參數轉做會使做字典鍵（key）个形式
+    """
+    if isinstance(value, list):
+        return tuple(value)
+    if isinstance(value, dict):
+        return frozenset(value.items())
+    return value
+
+
+def _asciiRewrites(letters: List[Tuple[str, str]], vowels: List[Tuple[str, str, List[str]]]) -> Tuple[Tuple[bytes, bytes], ...]:
+    """
+    ASCII 字母个轉換規則展開做 bytes 个字串替換，結果佮 `tailoLetters2Poj`、`pojLetters2Tailo` 仝款
+
+    參數：
+        letters (List[Tuple[str, str]]): (舊, 新)，大小寫照原本替換
+        vowels (List[Tuple[str, str, List[str]]]): (舊元音, 新元音, 後壁會使接个字母)，
+            全細寫換做細寫，其他大小寫組合換做大寫，參考 `_TAILO_UA`、`_replaceCased`
+    """
+    rewrites = [(old.encode("ascii"), new.encode("ascii")) for old, new in letters]
+    for old, new, follows in vowels:
+        for follow in follows:
+            for variant in map("".join, product(*((char, char.upper()) for char in old + follow))):
+                replacement = (new if variant.islower() else new.upper()) + variant[1:]
+                rewrites.append((variant.encode("ascii"), replacement.encode("ascii")))
+    return tuple(rewrites)
+
+
+_ASCII_BYTES_REWRITES = {
+    "pojAscii2TailoAscii": _asciiRewrites(
+        [("ch", "ts"), ("Ch", "Ts"), ("CH", "TS")], [("o", "u", ["a", "e"]), ("e", "i", ["ng", "k"])]
+    ),
+    "tailoAscii2PojAscii": _asciiRewrites(
+        [("ts", "ch"), ("Ts", "Ch"), ("TS", "CH")], [("u", "o", ["a", "e"]), ("i", "e", ["ng", "k"])]
+    ),
+}
+"""
+干焦 ASCII 个轉換方向 => bytes 个字串替換，照順序替換（`bytes.replace` 比 bytes 正則表達式較緊）
+"""
+
+
+def _convertAsciiBytes(direction: str, data: Union[bytes, bytearray, memoryview]) -> bytes:
+    """
+    規个緩衝區一擺轉換，毋免 UTF-8 解碼；非 ASCII 个 byte（譬論講 UTF-8 个漢字）原樣保留
+    """
+    if not isinstance(data, bytes):
+        data = bytes(data)
+    for old, new in _ASCII_BYTES_REWRITES[direction]:
+        data = data.replace(old, new)
+    return data
+
+
+@lru_cache(maxsize=None)
+def _prebuiltTables():
+    """
+    預先建好个音節表檔案，頭一擺用着个時才讀；檔案無抑是轉換規則有改就是 None
+    """
+    from thokit import prebuilt
+
+    return prebuilt.load()
+
+
+_worker_converter = None
+"""
+工作進程个轉換器，由 `_initWorker` 建立
+"""
+
+
+def _initWorker(cache_size: int, direction: str, engine: str, options: dict) -> None:
+    """
+    工作進程開始个時建立 `ThoKit` 佮轉換器，後擺逐塊文本直接用
+    """
+    global _worker_converter
+    _worker_converter = ThoKit(cache_size).compile(direction, engine, **options)
+
+
+def _convertChunk(lines: List[str]) -> List[str]:
+    """
+    工作進程轉換一塊文本
+    """
+    return list(map(_worker_converter, lines))
+
+
+def _chunks(lines: Iterable[str], chunksize: int) -> Iterator[List[str]]:
+    """
+    共文本逐 chunksize 逝切做一塊
+    """
+    iterator = iter(lines)
+    while chunk := list(islice(iterator, chunksize)):
+        yield chunk
+
+
+class Converter:
+    """
+    編譯好个轉換器，由 `ThoKit.compile` 產生
+
+    轉換器內底存規條流水線（pipeline）个階段（stage），每一个階段攏是 `str => str` 个函數，
+    正則表達式、調符數組、標調徙位函數攏佇編譯个時陣就決定好勢，呼叫个時免閣判斷參數。
+    漢羅文本內底个漢字原樣保留，流水線干焦行過羅馬字个部份。
+    轉換器建立了後袂使改。
+
+    ``` python
+    >>> convert = ThoKit().compile("pojAscii2Unicode", standard="campbell")
+    >>> convert("Tsui2 chiah8 tsa1-bo2")
+    'Tsúi chia̍h tsa-bó'
+    ```
+    """
+
+    __slots__ = ("direction", "options", "stages")
+
+    def __init__(
+        self,
+        direction: str,
+        options: Dict[str, object],
+        stages: List[Tuple[str, Callable[[str], str]]],
+    ) -> None:
+        object.__setattr__(self, "direction", direction)
+        object.__setattr__(self, "options", MappingProxyType(dict(options)))
+        object.__setattr__(self, "stages", tuple(stages))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} 建立了後袂使改")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} 建立了後袂使改")
+
+    def __repr__(self) -> str:
+        options = ", ".join(f"{key}={value!r}" for key, value in self.options.items())
+        return f"<{type(self).__name__} {self.direction}({options})>"
+
+    def __call__(self, text: str) -> str:
+        if text.isascii() or not _HAN_CANDIDATE.search(text):
+            return self._convertText(text)
+        hans = _HAN.findall(text)
+        if not hans:
+            return self._convertText(text)
+        # 漢字原樣保留，一段漢字干焦用一个字代替，正則表達式免行過規段漢字
+        converted = self._convertText(_HAN.sub(_HAN_PLACEHOLDER, text))
+        pieces = converted.split(_HAN_PLACEHOLDER)
+        if len(pieces) != len(hans) + 1:
+            return self._convertText(text)
+        for i, han in enumerate(hans):
+            pieces[i] += han
+        return "".join(pieces)
+
+    def _convertText(self, text: str) -> str:
+        for _, stage in self.stages:
+            text = stage(text)
+        return text
+
+
+class TokenConverter(Converter):
+    """
+    逐音節轉換个轉換器，由 `ThoKit.compile(direction, engine="token")` 產生
+
+    文本干焦切一擺音節佮分隔文字，新个音節規批用空白連做伙，用正則表達式个轉換規則轉換一擺了後記落來，
+    上尾一擺連做伙，長文本佮短文本个成本攏綴文本長度線性增加。
+    若轉換規則有看文本開始、結束，頭尾个音節照伊佇上下文內底轉換；
+    干焦一个大寫字母个音節（譬論講 `O͘`）若愛看隔壁个音節（參考 `_eitherCase`），逐擺照隔壁个音節轉換，無入表。
+    分隔文字有可能佮音節鬥做伙个時，規个文本退轉去正則表達式轉換，
+    所以轉換結果佮 `Converter` 一模一樣。
+    """
+
+    __slots__ = ("table", "case_sensitive", "contexts", "separator", "cache_size", "_memo", "_learned")
+
+    def __init__(
+        self,
+        converter: Converter,
+        table: Dict[str, str] = {},
+        case_sensitive: bool = False,
+        contexts: Dict[str, "re.Pattern"] = {},
+        separator: Callable[[str], str] = None,
+        cache_size: int = 4096,
+    ) -> None:
+        """
+        參數：
+            converter (Converter): 正則表達式个轉換器
+            table (Dict[str, str]，可選): 預先算好个音節表
+            case_sensitive (bool): 干焦一个大寫字母个音節，轉換結果敢愛看隔壁音節个大小寫
+            contexts (Dict[str, re.Pattern]): 轉換規則有看个上下文，
+                "start" 文本開始，"end" 文本結束，值是會受影響个音節个正則表達式
+            separator (Callable[[str], str]，可選): 分隔文字个轉換，默認原樣保留
+            cache_size (int，可選): 音節快取个大細
+        """
+        super().__init__(converter.direction, converter.options, converter.stages)
+        object.__setattr__(self, "table", table)
+        object.__setattr__(self, "case_sensitive", case_sensitive)
+        object.__setattr__(self, "contexts", MappingProxyType(dict(contexts)))
+        object.__setattr__(self, "separator", separator)
+        object.__setattr__(self, "cache_size", cache_size)
+        object.__setattr__(
+            self, "_memo", lru_cache(maxsize=cache_size)(self._convertInContext)
+        )
+        object.__setattr__(self, "_learned", {})
+
+    def _convertInContext(self, token: str, left: str, right: str) -> Union[str, None]:
+        """
+        用正則表達式轉換單一音節，`left`/`right` 是假造个上下文：
+        "" 表示文本開始/結束，"\n" 表示文本尾个換逝，" " 表示一般分隔文字
+        """
+        prefix, suffix = left, right
+        converted = Converter._convertText(self, prefix + token + suffix)
+        if self.separator:
+            prefix, suffix = self.separator(prefix), self.separator(suffix)
+        if not (converted.startswith(prefix) and converted.endswith(suffix)):
+            return None
+        return converted[len(prefix) : len(converted) - len(suffix)]
+
+    def _convertToken(self, pieces: List[str], i: int, left: str, right: str) -> Union[str, None]:
+        """
+        照上下文轉換 `pieces[i]` 个音節
+
+        干焦一个大寫字母个音節看隔壁个音節（`_eitherCase`）：隔壁攏是大寫个時佮家己連做伙轉換，
+        隔壁有細寫个時佮家己个細寫連做伙轉換，提對應个一半；孤一个音節个時家己轉換，
+        按怎算照轉換方向个規則（參考 `pojSpecialLetterUnicode2Ascii`）。
+        """
+        token = pieces[i]
+        if not self.case_sensitive or _caseMask(token) != _CASE_EITHER:
+            return self._memo(token, left, right)
+        case = _eitherCase(pieces, i, None)
+        if case is None:
+            return self._memo(token, left, right)
+        partner = token if case == _CASE_UPPER else token.lower()
+        # 頭前个一半看 left，後壁个一半看 right：上尾个音節放後壁，其他音節放頭前
+        paired = partner + " " + token if right != " " else token + " " + partner
+        converted = self._memo(paired, left, right)
+        if converted is None:
+            return None
+        halves = converted.split(self.separator(" ") if self.separator else " ")
+        if len(halves) != 2:
+            return None
+        return halves[1] if right != " " else halves[0]
+
+    def _learn(self, tokens: List[str]) -> None:
+        """
+        共新个音節用空白連做伙一擺轉換，記入 `_learned`；對袂齊就逐个用 `_memo` 轉換
+        """
+        learned = self._learned
+        if len(learned) + len(tokens) > self.cache_size:
+            learned.clear()
+        prefix, suffix = " ", " "
+        converted = Converter._convertText(self, prefix + " ".join(tokens) + suffix)
+        if self.separator:
+            prefix, suffix = self.separator(prefix), self.separator(suffix)
+        if converted.startswith(prefix) and converted.endswith(suffix):
+            converted = converted[len(prefix) : len(converted) - len(suffix)].split(" ")
+            if len(converted) == len(tokens):
+                learned.update(zip(tokens, converted))
+                return
+        for token in tokens:
+            learned[token] = self._memo(token, " ", " ")
+
+    def _convertUnknown(self, pieces: List[str], unknown: List[int], outputs: List[str]) -> bool:
+        """
+        轉換音節表、`_learned` 攏無个音節，寫入 outputs；有音節袂轉換得就返回 False
+
+        干焦一个大寫字母个音節愛看隔壁个音節，逐个用 `_convertToken` 轉換，無記入 `_learned`。
+        """
+        if self.case_sensitive:
+            rest = []
+            for i in unknown:
+                if _caseMask(pieces[i]) != _CASE_EITHER:
+                    rest.append(i)
+                    continue
+                converted = self._convertToken(pieces, i, " ", " ")
+                if converted is None:
+                    return False
+                outputs[i] = converted
+            unknown = rest
+        if unknown:
+            # 別个執行緒 `_learn` 个時有可能共 learned 清掉，提無着就返回 False，規个文本用正則表達式轉換，結果仝款
+            learned = self._learned
+            self._learn(list(dict.fromkeys(pieces[i] for i in unknown)))
+            for i in unknown:
+                converted = learned.get(pieces[i])
+                if converted is None:
+                    return False
+                outputs[i] = converted
+        return True
+
+    def __call__(self, text: str) -> str:
+        pieces = _TOKEN.split(text)
+        last = len(pieces) - 2
+        if last < 1:
+            return Converter.__call__(self, text)
+        for i in range(0, last + 2, 2):
+            if not _isStableSeparator(pieces[i]):
+                return Converter.__call__(self, text)
+        table, learned = self.table, self._learned
+        outputs = list(pieces)
+        left = "" if not pieces[0] else " "
+        right = pieces[-1] if pieces[-1] in ["", "\n"] else " "
+        contexts = self.contexts
+        start = not left and "start" in contexts and contexts["start"].match(pieces[1])
+        end = right != " " and "end" in contexts and contexts["end"].search(pieces[last])
+        unknown = []
+        for i in range(1, last + 1, 2):
+            if (i == 1 and start) or (i == last and end):
+                converted = self._convertToken(pieces, i, left if i == 1 else " ", right if i == last else " ")
+                if converted is None:
+                    return Converter.__call__(self, text)
+                outputs[i] = converted
+                continue
+            converted = table.get(pieces[i])
+            if converted is None:
+                converted = learned.get(pieces[i])
+                if converted is None:
+                    unknown.append(i)
+                    continue
+            outputs[i] = converted
+        if unknown and not self._convertUnknown(pieces, unknown, outputs):
+            return Converter.__call__(self, text)
+        if self.separator:
+            for i in range(0, last + 2, 2):
+                outputs[i] = self.separator(pieces[i])
+        return "".join(outputs)
+
+    def cacheInfo(self):
+        """
+        音節快取个統計
+        """
+        return self._memo.cache_info()
+
+
+class TableConverter(TokenConverter):
+    """
+    查音節表个轉換器，由 `ThoKit.compile(direction, engine="table")` 產生
+
+    佮 `TokenConverter` 仝款，毋過音節先查音節表（用 `ThoKit.syllableInventory`
+    佮正則表達式个轉換規則預先算好），表無个音節才逐个轉換閣記佇 LRU 快取。
+    """
+
+    __slots__ = ()
+
+
+def _diff(old: str, new: str) -> Tuple[int, int, str]:
+    """
+    兩个文本个差：(位置, 刣掉个長度, 加入个文本)
+    """
+    start, limit = 0, min(len(old), len(new))
+    while start < limit and old[start] == new[start]:
+        start += 1
+    old_end, new_end = len(old), len(new)
+    while old_end > start and new_end > start and old[old_end - 1] == new[new_end - 1]:
+        old_end -= 1
+        new_end -= 1
+    return start, old_end - start, new[start:new_end]
+
+
+class IncrementalConverter:
+    """
+    增量轉換器：記牢頂一擺个輸入、輸出佮音節對齊，編輯了後干焦重轉換有改着个音節
+
+    適合編輯器、輸入法个即時預覽，逐擺按鍵个成本綴編輯个大小，毋是綴文本長度。
+    結果佮 `converter(text)` 一模一樣：文本開始、結束个音節照上下文規則閣轉換一擺，
+    干焦一个大寫字母个音節若愛看隔壁个音節，編輯範圍邊仔个音節嘛閣轉換一擺，
+    有分隔文字可能佮音節鬥做伙个時，規个文本閣轉換。
+
+    ``` python
+    >>> incremental = ThoKit().incremental("tailoAscii2Unicode", "Tsui2 tsiah8")
+    >>> incremental.edit(5, 0, " be7")
+    (5, 0, 'bē ')
+    >>> incremental.output
+    'Tsuí bē tsia̍h'
+    ```
+
+    參數：
+        converter (TokenConverter): 逐音節个轉換器，`compile(direction, engine="token")` 抑是 "table"
+        text (str，可選): 開始个文本
+    """
+
+    def __init__(self, converter: TokenConverter, text: str = "") -> None:
+        assert isinstance(converter, TokenConverter), "增量轉換愛用 token 抑是 table 引擎个轉換器"
+        self.converter = converter
+        self.reset(text)
+
+    @property
+    def text(self) -> str:
+        """
+        這馬个輸入文本
+        """
+        return self._text
+
+    @property
+    def output(self) -> str:
+        """
+        這馬个輸出文本
+        """
+        if self._output is None:
+            self._output = "".join(self._outputs)
+        return self._output
+
+    def reset(self, text: str) -> str:
+        """
+        換一个文本，規个轉換
+
+        參數：
+            text (str): 新个文本
+        返回：
+            str: 轉換了个文本
+        """
+        self._text = text
+        self._convertAll()
+        return self.output
+
+    def edit(self, offset: int, deleted: int, inserted: str) -> Tuple[int, int, str]:
+        """
+        編輯輸入文本，干焦重轉換有改着个音節
+
+        參數：
+            offset (int): 編輯个位置
+            deleted (int): 刣掉幾字
+            inserted (str): 加入个文本
+        返回：
+            Tuple[int, int, str]: 輸出个補丁 (位置, 刣掉个長度, 加入个文本)，套佇頂一擺个輸出
+        """
+        text = self._text
+        assert 0 <= offset and 0 <= deleted and offset + deleted <= len(text), "編輯範圍超出文本"
+        self._text = text[:offset] + inserted + text[offset + deleted :]
+        if self._outputs is None:
+            return self._replaceAll(self.output)
+
+        pieces, outputs = self._pieces, self._outputs
+        last = len(pieces) - 1
+        e = self._pieceAt(offset + deleted)
+        s = bisect_left(self._input_ends, offset)
+        s -= s % 2
+        e += e % 2
+        while True:
+            # 範圍頭尾愛是分隔文字，若分隔文字刣了了，邊仔个音節會鬥做伙，範圍愛閣放闊
+            ends = self._inputEnds(e)
+            start = ends[s - 1] if s else 0
+            new = _TOKEN.split(text[start:offset] + inserted + text[offset + deleted : ends[e]])
+            if s > 0 and not new[0]:
+                s -= 2
+            elif e < last and not new[-1]:
+                e += 2
+            else:
+                break
+
+        delta = len(new) - (e - s + 1)
+        stability = sum(not _isStableSeparator(piece) for piece in new[::2])
+        self._unstable += stability - sum(not _isStableSeparator(piece) for piece in pieces[s : e + 1 : 2])
+        old_outputs = outputs[s : e + 1]
+        old_edges = self._edges
+        pieces[s : e + 1] = new
+        outputs[s : e + 1] = new
+        del self._input_ends[s:]
+        self._output = None
+        end = s + len(new)
+        if self._unstable or len(pieces) < 3:
+            return self._replaceAll("".join(outputs[:s] + old_outputs + outputs[end:]))
+
+        edges = self._edgeIndices()
+        moved = {i if i < s else i + delta for i in old_edges if not s <= i <= e}
+        if self.converter.case_sensitive:
+            # 干焦一个大寫字母个音節看隔壁个音節，編輯範圍邊仔个音節嘛愛閣轉換
+            moved |= {i for i in (s - 1, end) if 0 < i < len(pieces)}
+        extra = (moved | edges) - set(range(s, end))
+        previous = {i: outputs[i] for i in extra}
+        if not self._convert(
+            [i for i in range(s + 1, end, 2) if i not in edges] + [i for i in moved - edges if i in extra],
+            edges,
+            range(s, end, 2),
+        ):
+            before = [previous.get(i, outputs[i]) for i in range(s)]
+            after = [previous.get(i, outputs[i]) for i in range(end, len(outputs))]
+            return self._replaceAll("".join(before + old_outputs + after))
+        lo, hi = s, end - 1
+        for i, value in previous.items():
+            if outputs[i] != value:
+                lo, hi = min(lo, i), max(hi, i)
+        old = [previous.get(i, outputs[i]) for i in range(lo, s)] + old_outputs
+        old += [previous.get(i, outputs[i]) for i in range(end, hi + 1)]
+        del self._output_ends[lo:]
+        position, old_length, new = _diff("".join(old), "".join(outputs[lo : hi + 1]))
+        if lo:
+            position += self._outputEnds(lo - 1)[lo - 1]
+        return position, old_length, new
+
+    def _convertAll(self) -> None:
+        """
+        規个文本重切音節、重轉換；袂當逐音節轉換个時用規个文本轉換
+        """
+        text = self._text
+        self._pieces = _TOKEN.split(text)
+        self._outputs = list(self._pieces)
+        self._input_ends, self._output_ends = [], []
+        self._output = None
+        self._unstable = sum(not _isStableSeparator(piece) for piece in self._pieces[::2])
+        self._edges = set()
+        if not self._unstable and len(self._pieces) >= 3:
+            edges = self._edgeIndices()
+            tokens = [i for i in range(1, len(self._pieces), 2) if i not in edges]
+            if self._convert(tokens, edges, range(0, len(self._pieces), 2)):
+                return
+        self._outputs = None
+        self._output = self.converter(text)
+
+    def _replaceAll(self, old: str) -> Tuple[int, int, str]:
+        """
+        規个文本重轉換，返回佮頂一擺輸出 old 个補丁
+        """
+        self._convertAll()
+        return _diff(old, self.output)
+
+    def _edgeIndices(self) -> set:
+        """
+        愛照上下文轉換个音節（文本開始、結束），參考 `TokenConverter.__call__`
+        """
+        pieces, contexts = self._pieces, self.converter.contexts
+        last = len(pieces) - 2
+        left = "" if not pieces[0] else " "
+        right = pieces[-1] if pieces[-1] in ["", "\n"] else " "
+        start = not left and "start" in contexts and contexts["start"].match(pieces[1])
+        end = right != " " and "end" in contexts and contexts["end"].search(pieces[last])
+        return {i for i, edge in [(1, start), (last, end)] if edge}
+
+    def _convert(self, tokens: List[int], edges: set, separators: Iterable[int]) -> bool:
+        """
+        轉換指定个音節、文本頭尾个音節佮分隔文字，寫入 `_outputs`；有音節袂轉換得就返回 False
+        """
+        converter, pieces, outputs = self.converter, self._pieces, self._outputs
+        last = len(pieces) - 2
+        left = "" if not pieces[0] else " "
+        right = pieces[-1] if pieces[-1] in ["", "\n"] else " "
+        for i in edges:
+            converted = converter._convertToken(pieces, i, left if i == 1 else " ", right if i == last else " ")
+            if converted is None:
+                return False
+            outputs[i] = converted
+        table, learned = converter.table, converter._learned
+        unknown = []
+        for i in tokens:
+            converted = table.get(pieces[i])
+            if converted is None:
+                converted = learned.get(pieces[i])
+                if converted is None:
+                    unknown.append(i)
+                    continue
+            outputs[i] = converted
+        if unknown and not converter._convertUnknown(pieces, unknown, outputs):
+            return False
+        if converter.separator:
+            for i in separators:
+                outputs[i] = converter.separator(pieces[i])
+        self._edges = edges
+        return True
+
+    def _pieceAt(self, position: int) -> int:
+        """
+        包含 position 个片段（音節抑是分隔文字）个索引
+        """
+        ends = self._input_ends
+        while (not ends or ends[-1] <= position) and len(ends) < len(self._pieces):
+            ends.append((ends[-1] if ends else 0) + len(self._pieces[len(ends)]))
+        return min(bisect_right(ends, position), len(self._pieces) - 1)
+
+    def _inputEnds(self, index: int) -> List[int]:
+        """
+        輸入片段个結束位置，算到 index 爲止（頂一擺編輯以前个部份免閣算）
+        """
+        ends, pieces = self._input_ends, self._pieces
+        while len(ends) <= index:
+            ends.append((ends[-1] if ends else 0) + len(pieces[len(ends)]))
+        return ends
+
+    def _outputEnds(self, index: int) -> List[int]:
+        """
+        輸出片段个結束位置，算到 index 爲止
+        """
+        ends, outputs = self._output_ends, self._outputs
+        while len(ends) <= index:
+            ends.append((ends[-1] if ends else 0) + len(outputs[len(ends)]))
+        return ends
+
+
+def _compileAutomaton(forms: Iterable[str]) -> Dict[str, object]:
+    """
+    共字串編譯做最小化个確定有限自動機：先建字典樹，後綴仝款个節點鬥做伙，
+    逐个節點是 {字: 下一个節點}，"" 是會使佇遮結束
+    """
+    start = {}
+    for form in forms:
+        node = start
+        for char in form:
+            node = node.setdefault(char, {})
+        node[""] = True
+    register = {}
+
+    def minimize(node: Dict[str, object]) -> Dict[str, object]:
+        for char, child in node.items():
+            if char:
+                node[char] = minimize(child)
+        signature = tuple(sorted((char, id(child)) for char, child in node.items()))
+        return register.setdefault(signature, node)
+
+    return minimize(start)
+
+
+class SyllableValidator:
+    """
+    音節合法性檢查，由 `ThoKit.validator` 產生
+
+    合法个音節編譯做一个確定有限自動機（DFA），逐个音節對頭到尾行一擺，時間佮音節長度成正比，
+    毋免轉換，嘛毋免正則表達式。檢查：聲母佮韻母个組合（鼻音聲母、濁音聲母無配鼻化韻母）、
+    第四、八聲干焦配入聲韻尾（`ThoKit.entering_endings`）、鼻化佮入聲韻尾个位置（照白話字標準）、
+    調符佮數字調个位置、大小寫（細寫、首字母大寫、全大寫）。
+
+    ``` python
+    >>> validator = thokit.validator('tailo-asc')
+    >>> validator.invalidSpans('Tsui2 tsiah2 mann5')
+    [(6, 12), (13, 18)]
+    ```
+
+    參數：
+        orthography (str): 拼寫
+        standard (str): 白話字標準
+        forms (Iterable[str]): 合法音節个寫法
+    """
+
+    __slots__ = ("orthography", "standard", "_start")
+
+    def __init__(self, orthography: str, standard: str, forms: Iterable[str]) -> None:
+        self.orthography = orthography
+        self.standard = standard
+        self._start = _compileAutomaton(forms)
+
+    def __repr__(self) -> str:
+        return f"SyllableValidator({self.orthography!r}, {self.standard!r})"
+
+    def isValid(self, syllable: str) -> bool:
+        """
+        一个音節敢合法；Unicode 个 NFC、NFD 攏會使
+
+        參數：
+            syllable (str): 音節
+        返回：
+            bool: 合法
+        """
+        if self._accepts(syllable):
+            return True
+        return not syllable.isascii() and self._accepts(unicodedata.normalize("NFC", syllable))
+
+    def _accepts(self, syllable: str) -> bool:
+        node = self._start
+        for char in syllable:
+            node = node.get(char)
+            if node is None:
+                return False
+        return "" in node
+
+    def invalidSpans(self, text: str) -> List[Tuple[int, int]]:
+        """
+        文本內底無合法个音節个位置；音節用 `-`、空白、標點等等分開，干焦數字个片段無算
+
+        參數：
+            text (str): 文本
+        返回：
+            List[Tuple[int, int]]: (開始, 結束)
+        """
+        return [
+            match.span()
+            for match in _TOKEN.finditer(text)
+            if not self.isValid(match.group()) and not match.group().isdigit()
+        ]
+
+    def invalidLines(self, lines: Iterable[str], start: int = 1) -> Iterator[int]:
+        """
+        批量檢查，一逝一逝返回有無合法音節个逝號，毋免轉換；會使直接用檔案
+
+        ``` python
+        with open('corpus.txt', encoding='utf-8') as f:
+            bad = list(validator.invalidLines(f))
+        ```
+
+        參數：
+            lines (Iterable[str]): 一逝一逝个文本
+            start (int，可選): 頭一逝个逝號，默認 1
+        返回：
+            Iterator[int]: 有無合法音節个逝號
+        """
+        is_valid, finditer = self.isValid, _TOKEN.finditer
+        for number, line in enumerate(lines, start):
+            for match in finditer(line):
+                token = match.group()
+                if not is_valid(token) and not token.isdigit():
+                    yield number
+                    break
+
+
+class SearchIndex:
+    """
+    搜揣用个倒排索引（音節 => 詞目編號），由 `ThoKit.buildIndex` 產生
+
+    詞目佮查詢攏用 `ThoKit.searchKey` 轉做仝一款个鍵，查个時干焦查字典，免閣轉換。
+    詞目編號是詞目佇 `entries` 內底个順序（對 0 算起），返回个編號攏是細个排頭前。
+
+    ``` python
+    >>> index = thokit.buildIndex(['Tsuí', 'chúi-kóe', 'TSIAH8'])
+    >>> index.lookup('chui2'), index.search('tsui2')
+    ([0], [0, 1])
+    ```
+
+    參數：
+        level (str): 鍵个層級，參考 `ThoKit.searchKey`
+        syllables (Dict[str, Tuple[int, ...]]): 音節个鍵 => 有即个音節个詞目編號
+        entries (Dict[str, Tuple[int, ...]]): 規个詞目个鍵 => 詞目編號
+        key (Callable[[str], List[str]]): 文本轉做音節个鍵
+    """
+
+    __slots__ = ("level", "syllables", "entries", "_key")
+
+    def __init__(
+        self,
+        level: str,
+        syllables: Dict[str, Tuple[int, ...]],
+        entries: Dict[str, Tuple[int, ...]],
+        key: Callable[[str], List[str]],
+    ) -> None:
+        self.level = level
+        self.syllables = syllables
+        self.entries = entries
+        self._key = key
+
+    def __repr__(self) -> str:
+        return f"<SearchIndex {self.level}: {len(self.syllables)} syllables, {len(self.entries)} keys>"
+
+    def lookup(self, query: str) -> List[int]:
+        """
+        規个詞目佮查詢仝款（拼寫、大小寫、分隔文字攏無要緊）个詞目編號
+
+        參數：
+            query (str): 查詢
+        返回：
+            List[int]: 詞目編號
+        """
+        return list(self.entries.get(" ".join(self._key(query)), ()))
+
+    def search(self, query: str) -> List[int]:
+        """
+        查詢个音節攏有个詞目編號，音節个順序無要緊
+
+        參數：
+            query (str): 查詢
+        返回：
+            List[int]: 詞目編號
+        """
+        keys = dict.fromkeys(self._key(query))
+        if not keys:
+            return []
+        postings = sorted((self.syllables.get(key, ()) for key in keys), key=len)
+        candidates = postings[0]
+        for posting in postings[1:]:
+            if not candidates:
+                break
+            # 編號攏排好矣，用二分法查，候選毋免轉做集合
+            candidates = [i for i in candidates if _contains(posting, i)]
+        return list(candidates)
+
+
+class PrefixIndex:
+    """
+    輸入法用个前綴索引，由 `ThoKit.buildPrefixIndex` 產生
+
+    詞目个 ASCII 鍵（細寫，音節用空白分開，會使提掉數字調）排好做一个陣列，
+    逐个鍵攏有預先轉換好个 Unicode 寫法。查前綴干焦二分法揣範圍（`bisect`），查个時免轉換。
+
+    ``` python
+    >>> index = thokit.buildPrefixIndex(['chui2', 'chui2-kui2', 'chiah8'])
+    >>> index.complete('chui2-k')
+    ['chúi-kúi']
+    ```
+
+    參數：
+        tone_numbers (bool): 鍵敢有數字調
+        keys (List[str]): 排好个鍵
+        forms (List[str]): 仝一个位置个鍵个 Unicode 寫法
+    """
+
+    __slots__ = ("tone_numbers", "keys", "forms")
+
+    def __init__(self, tone_numbers: bool, keys: List[str], forms: List[str]) -> None:
+        self.tone_numbers = tone_numbers
+        self.keys = keys
+        self.forms = forms
+
+    def __repr__(self) -> str:
+        return f"<PrefixIndex {len(self.keys)} entries, tone_numbers={self.tone_numbers}>"
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def span(self, prefix: str) -> Tuple[int, int]:
+        """
+        前綴个範圍：`keys[start:end]` 攏是即个前綴開頭
+
+        參數：
+            prefix (str): 拍个 ASCII 前綴；`-`、空白攏算音節个分隔，尾仔有分隔就是頂一个音節拍煞矣
+        返回：
+            Tuple[int, int]: (開始, 結束)
+        """
+        key = _prefixKey(prefix, self.tone_numbers)
+        if key and not _TOKEN.match(prefix[-1]):
+            key += " "
+        start = bisect_left(self.keys, key)
+        return start, bisect_left(self.keys, key + "\x7f", start)  # 鍵攏是 ASCII，\x7f 比所有个字較大
+
+    def complete(self, prefix: str, limit: int = None) -> List[str]:
+        """
+        前綴个候選，照鍵个順序
+
+        參數：
+            prefix (str): 拍个 ASCII 前綴，參考 `span`
+            limit (int，可選): 上濟幾个，默認全部
+        返回：
+            List[str]: 候選个 Unicode 寫法
+        """
+        start, end = self.span(prefix)
+        if limit is not None:
+            end = min(end, start + limit)
+        return self.forms[start:end]
+
+
+def _prefixKey(text: str, tone_numbers: bool = True) -> str:
+    """
+    `PrefixIndex` 个鍵：細寫，音節用一个空白分開，`tone_numbers` 是 False 就提掉數字調
+    """
+    key = " ".join(_TOKEN.findall(text.lower()))
+    return key if tone_numbers else key.translate(_DIGITS_DELETION)
+
+
+_DIGITS_DELETION = str.maketrans("", "", "0123456789")
+
+
+def _contains(sorted_ids: Tuple[int, ...], i: int) -> bool:
+    """
+    排好个編號內底敢有 i
+    """
+    position = bisect_left(sorted_ids, i)
+    return position < len(sorted_ids) and sorted_ids[position] == i
+
+
+StageStats = namedtuple("StageStats", ["calls", "seconds", "chars_in", "chars_out"])
+"""
+一个階段个統計：呼叫次數、累計時間（秒）、輸入字數、輸出字數
+"""
+
+
+class Profile:
+    """
+    轉換流水線逐个階段个統計，由 `ThoKit.profile` 產生
+
+    統計个鍵是（轉換方向, 階段名），"*regex"、"*token"、"*table" 是用該引擎个規个轉換，
+    仝一个轉換方向用無仝引擎个統計分開記。查表、逐音節引擎干焦有規个轉換个統計。
+
+    ``` python
+    >>> with thokit.profile() as profile:
+    ...     thokit.pojUnicode2Ascii(text)
+    >>> print(profile.report())
+    ```
+    """
+
+    def __init__(self, callback: Callable[[str, str, float, int, int], None] = None) -> None:
+        """
+        參數：
+            callback (Callable，可選): 逐擺階段行了就呼叫
+                `callback(direction, stage, seconds, chars_in, chars_out)`
+        """
+        self.callback = callback
+        self._stats = {}
+        self._converters = {}
+        self._lock = threading.Lock()  # 幾若个執行緒仝時記統計个時，加數袂拍損去
+
+    @property
+    def stats(self) -> Dict[Tuple[str, str], StageStats]:
+        return {key: StageStats(*value) for key, value in self._stats.items()}
+
+    def record(
+        self, direction: str, stage: str, seconds: float, chars_in: int, chars_out: int
+    ) -> None:
+        with self._lock:
+            value = self._stats.get((direction, stage))
+            if value is None:
+                self._stats[(direction, stage)] = [1, seconds, chars_in, chars_out]
+            else:
+                value[0] += 1
+                value[1] += seconds
+                value[2] += chars_in
+                value[3] += chars_out
+        if self.callback is not None:
+            self.callback(direction, stage, seconds, chars_in, chars_out)
+
+    def _timed(self, direction: str, name: str, stage: Callable[[str], str]):
+        clock = time.perf_counter
+
+        def run(text: str) -> str:
+            start = clock()
+            converted = stage(text)
+            self.record(direction, name, clock() - start, len(text), len(converted))
+            return converted
+
+        return run
+
+    def wrap(self, converter: Converter) -> Converter:
+        """
+        返回會記統計个轉換器，結果佮原本个仝款
+        """
+        profiled = self._converters.get(converter)
+        if profiled is None:
+            direction = converter.direction
+            if isinstance(converter, TableConverter):
+                whole = "*table"
+            elif isinstance(converter, TokenConverter):
+                whole = "*token"
+            else:
+                whole = "*regex"
+            names = [whole]
+            inner = converter
+            if not isinstance(converter, TokenConverter):
+                names += [name for name, _ in converter.stages]
+                inner = Converter(
+                    direction,
+                    converter.options,
+                    [(name, self._timed(direction, name, stage)) for name, stage in converter.stages],
+                )
+            profiled = Converter(
+                direction, converter.options, [(whole, self._timed(direction, whole, inner))]
+            )
+            for name in names:  # 統計照流水線个順序
+                self._stats.setdefault((direction, name), [0, 0.0, 0, 0])
+            profiled = self._converters.setdefault(converter, profiled)
+        return profiled
+
+    def report(self) -> str:
+        """
+        統計表，照轉換方向、流水線个順序排
+        """
+        lines = ["%-28s %-32s %10s %12s %14s %14s" % ("direction", "stage", "calls", "seconds", "chars_in", "chars_out")]
+        for (direction, stage), (calls, seconds, chars_in, chars_out) in self._stats.items():
+            if calls:
+                lines.append("%-28s %-32s %10d %12.6f %14d %14d" % (direction, stage, calls, seconds, chars_in, chars_out))
+        return "\n".join(lines)
+
+
+class ThoKit:
+    def __init__(self, cache_size: int = 4096, prebuilt: bool = True) -> None:
+        """
+        一个 ThoKit 會使予幾若个執行緒共用：調符、聲母、韻母等等个表攏是 tuple，袂使改；
+        編譯好个轉換器建立了後袂使改；快取（轉換器、音節表、LRU 快取）干焦用單一个字典操作讀寫，
+        兩个執行緒仝時建仝一个轉換器，後來攏用先存入去个彼个，查快取个時免鎖。
+        干焦 `profile` 是規个 ThoKit 共用个設定。
+
+        參數：
+            cache_size (int，可選): 逐个音節快取（LRU）會使記幾个音節，默認 4096；
+                `None` 無限制，`0` 無快取
+            prebuilt (bool，可選): 查表引擎敢用預先建好个音節表（`thokit.prebuilt`），默認 True
+        """
+        self.tailo_accent_marks = (
+            "",
+            "",
+            "\u0301",
+            "\u0300",
+            "",
+            "\u0302",
+            "\u030c",
+            "\u0304",
+            "\u030d",
+            "\u030b",
+        )
+        """
+        臺羅（Tâi-lô）調符列表，其中引歷（index）0 元素放空，紲落來是九個聲調（含高升調）个調符
+        """
+        self.poj_accent_marks = (
+            "",
+            "",
+            "\u0301",
+            "\u0300",
+            "",
+            "\u0302",
+            "\u030c",
+            "\u0304",
+            "\u030d",
+            "\u0306",
+        )
+        """
+        白話字（Pe̍h-ōe-jī）調符列表，其中引歷（index）0 元素放空，紲落來是九個聲調（含高升調）个調符
+
+        着注意，傳統白話字本身無定義陽上調、高升調（「第九調」）符
+        """
+        self.ipa_tone_cateɡory_symbols = (
+            "",
+            "꜀",
+            "꜂",
+            "꜄",
+            "꜆",
+            "꜁",
+            "꜃",
+            "꜅",
+            "꜇",
+            "",
+        )
+        """
+        國際音標調類符號
+        """
+        self.ipa_tone_cateɡory_numbers = (
+            "",
+            "1",
+            "3",
+            "5",
+            "7",
+            "2",
+            "4",
+            "6",
+            "8",
+            "9",
+        )
+        """
+        國際音標調類數字
+        """
+        self.entering_endings = "ptkhPTKH"
+        """
+        入聲塞音韻尾
+        """
+        self.normalization_forms = ("NFC", "NFD")
+        """
+        Unicode 个[正則化形式](https://unicode.org/reports/tr15/#Norm_Forms)
+
+        - NFD (Normalization Form D)：規範分解（Decomposition），調符佮字母各佔一个 Unicode 碼位
+        - NFC (Normalization Form C)：規範組合（Composition），調符佮字母儘可能鬥做伙
+
+        ``` python
+        >>> import unicodedata
+        >>> syllable = unicodedata.normalize('NFD', 'á'); [char for char in syllable], [hex(ord(char)) for char in syllable], len(syllable)
+        (['a', '́'], ['0x61', '0x301'], 2) # 'á' (U+00E1) => 'a' (U+0061) + '́' (U+0301)
+        >>> syllable = unicodedata.normalize('NFC', 'a'+'\u0301'); syllable, hex(ord(syllable)), len(syllable)
+        ('á', 1) # 'a' (U+0061) + '́' (U+0301) => 'á' (U+00E1)
+        >>> len(unicodedata.normalize('NFC', 'a̍h'))
+        3 # 陽入符組合式無獨立碼位，NFC 之後猶原不變
+        ```
+
+        無建議用兼容式个 NFKC、NFKD，因爲這解共 POJ 个 ⁿ/ᴺ 轉換做 n/N
+        """
+        self.poj_standards = ("campbell", "douglas", "barclay")
+        self.tailo_initials = (
+            "",
+            "p",
+            "ph",
+            "b",
+            "m",
+            "t",
+            "th",
+            "n",
+            "l",
+            "k",
+            "kh",
+            "g",
+            "ng",
+            "h",
+            "ts",
+            "tsh",
+            "s",
+            "j",
+        )
+        """
+        臺羅聲母，頭一个是零聲母
+        """
+        self.tailo_finals = (
+            # 元音韻
+            "a", "ai", "au", "e", "i", "ia", "iau", "io", "iu", "o", "oo", "u",
+            "ua", "uai", "ue", "ui", "ir", "er", "ee", "ere",
+            "or", "ior", "ioo", "ie", "iai", "oi", "uee",
+            # 鼻化韻
+            "ann", "ainn", "aunn", "enn", "inn", "iann", "iaunn", "iunn", "ionn",
+            "onn", "uann", "uainn", "uinn", "irinn", "uenn",
+            # 鼻音韻、成音節鼻音
+            "am", "an", "ang", "im", "in", "ing", "iam", "ian", "iang", "iong",
+            "om", "ong", "un", "uan", "uang", "irm", "irn", "irng", "erm", "m", "ng",
+            # 入聲韻
+            "ah", "aih", "auh", "eh", "ih", "iah", "iauh", "ioh", "iuh", "oh",
+            "ooh", "uh", "uah", "uaih", "ueh", "uih", "irh", "erh", "eeh", "ereh",
+            "orh", "iorh", "iooh", "iaih", "oih",
+            "annh", "ainnh", "aunnh", "ennh", "innh", "iannh", "iaunnh", "iunnh", "ionnh",
+            "onnh", "uannh", "uainnh", "uennh", "uinnh", "mh", "ngh",
+            "ap", "at", "ak", "ip", "it", "ik", "iap", "iat", "iak", "iok",
+            "op", "ok", "ut", "uat", "uak", "iut", "irp", "irt", "irk",
+        )  # fmt: skip
+        """
+        臺羅韻母，包括老泉腔、漳腔等方音个韻母
+        """
+        self._converters = {}
+        """
+        已經編譯个轉換器，鍵是（轉換方向, 參數...）
+        """
+        self.cache_size = cache_size
+        self.prebuilt = prebuilt
+        self._syllable_caches = {}
+        """
+        音節標調徙位个快取，鍵是（函數名, 白話字標準）
+        """
+        self._inventory_forms = {}
+        """
+        音節表佇各種拼寫个形式，鍵是（拼寫, 白話字標準）
+        """
+        self._validators = {}
+        """
+        音節合法性檢查个自動機，鍵是（拼寫, 白話字標準）
+        """
+        self._profile = None
+        """
+        `profile` 當咧記个統計，無咧記就是 None
+        """
+
+    def compile(self, direction: str, engine: str = "regex", **options) -> Converter:
+        """
+        編譯轉換器
+
+        共一个轉換方向佮伊个參數（白話字標準、調符數組、正則化形式等）事先處理好，
+        返回一个袂使改个 `Converter`。仝款个參數干焦編譯一擺，後擺直接提來用。
+
+        參數：
+            direction (str): 轉換方向，就是 `ThoKit` 个轉換方法名，
+                譬論講 "pojAscii2Unicode"、"tailoUnicode2Ascii"
+            engine (str，可選): 轉換引擎
+                - "regex"：默認，逐條正則表達式規則行過規个文本
+                - "table"：音節查表（`TableConverter`），適合大量文本，頭一擺用个時陣愛建表
+                - "token"：切一擺音節，逐音節轉換閣記落來（`TokenConverter`），毋免建表
+            **options: 佮該方法仝款个參數（無包括 text）
+        返回：
+            Converter: 編譯好个轉換器，用 `converter(text)` 轉換
+        """
+        assert engine in ["regex", "table", "token"], f"無支持个轉換引擎：{engine}"
+        return self._converter(direction, *self._bindOptions(direction, options), engine=engine)
+
+    def incremental(self, direction: str, text: str = "", engine: str = "token", **options) -> IncrementalConverter:
+        """
+        增量轉換器，編輯器、輸入法逐擺按鍵干焦重轉換有改着个音節，參考 `IncrementalConverter`
+
+        參數：
+            direction (str): 轉換方向，參考 `compile`
+            text (str，可選): 開始个文本
+            engine (str，可選): "token" 抑是 "table"，默認 "token"
+            **options: 佮該方法仝款个參數（無包括 text）
+        返回：
+            IncrementalConverter: 增量轉換器，用 `edit(offset, deleted, inserted)` 編輯
+        """
+        assert engine in ["table", "token"], f"增量轉換無支持个轉換引擎：{engine}"
+        converter = self._compiledConverter(direction, *self._bindOptions(direction, options), engine=engine)
+        return IncrementalConverter(converter, text)
+
+    def validator(self, orthography: str = "tailo-asc", standard: str = None) -> SyllableValidator:
+        """
+        音節合法性檢查，清理語料个時先揀出拼毋着个音節，參考 `SyllableValidator`
+
+        合法音節是 `syllableInventory` 閣提掉鼻音聲母（m、n、ng）、濁音聲母（b、l、g）配鼻化韻母个組合。
+
+        參數：
+            orthography (str，可選): 拼寫，"tailo-asc"、"tailo-uni"、"poj-asc"、"poj-uni"、"ipa"，默認 "tailo-asc"
+            standard (str，可選): 白話字標準，干焦 "poj-uni" 有差
+        返回：
+            SyllableValidator: 音節合法性檢查
+        """
+        assert orthography in _ORTHOGRAPHY_GRAPH, f"無支持个拼寫：{orthography}"
+        assert standard is None or standard in self.poj_standards, f"無支持个白話字標準：{standard}"
+        key = (orthography, standard if orthography == "poj-uni" else None)
+        validator = self._validators.get(key)
+        if validator is None:
+            illegal = {initial + final for initial in _ORAL_NASAL_INITIALS for final in self.tailo_finals if "nn" in final}
+            syllables = [syllable for syllable in self.syllableInventory() if syllable.rstrip("0123456789") not in illegal]
+            forms = self._syllableForms(syllables, *key)
+            if orthography == "poj-uni":
+                # onn 佇文本頭前个時 o 無加點（參考 `_ruleContexts`），嘛算合法
+                convert = partial(self.pojAscii2Unicode, standard=standard)
+                for syllable in syllables:
+                    if _CONTEXT_START_ONN.match(syllable):
+                        for variant in (syllable, syllable.capitalize(), syllable.upper()):
+                            form = convert(self.tailoAscii2PojAscii(variant))
+                            forms += [form, unicodedata.normalize("NFD", form)]
+            validator = self._validators.setdefault(key, SyllableValidator(*key, forms))
+        return validator
+
+    def searchKey(self, text: str, level: str = "tone") -> str:
+        """
+        搜揣用个鍵：臺羅、白話字（包括各種白話字標準）、ASCII、Unicode、大小寫攏轉做仝一款
+
+        逐个音節干焦行一擺，轉做細寫个臺羅數字式音節，用空白連做伙；分隔文字（`-`、空白、標點）佮漢字無算。
+        音節个鍵有快取，大量詞目、查詢重複个音節干焦查字典。
+
+        ``` python
+        >>> [thokit.searchKey(text) for text in ['tsuí', 'chui2', 'TSUI2', 'chúi']]
+        ['tsui2', 'tsui2', 'tsui2', 'tsui2']
+        >>> thokit.searchKey('Tsiáⁿ-chia̍h', level='plain')
+        'tsia tsiah'
+        ```
+
+        參數：
+            text (str): 文本
+            level (str，可選): 層級，"tone" 保留聲調（默認），"toneless" 無聲調，"plain" 無聲調閣無鼻化
+        返回：
+            str: 搜揣用个鍵
+        """
+        return " ".join(self._searchKeys(text, level))
+
+    def _searchKeys(self, text: str, level: str = "tone") -> List[str]:
+        """
+        文本逐个音節个鍵，參考 `searchKey`
+        """
+        key = self._syllable_caches.get(("searchKey", level))
+        if key is None:
+            assert level in _SEARCH_LEVELS, f"無支持个層級：{level}"
+            tones = {mark: str(tone) for marks in (self.tailo_accent_marks, self.poj_accent_marks) for tone, mark in enumerate(marks) if mark}
+            key = self._syllable_caches.setdefault(
+                ("searchKey", level), lru_cache(maxsize=self.cache_size)(partial(self._syllableSearchKey, tones=tones, level=level))
+            )
+        return [key(token) for token in _TOKEN.findall(text)]
+
+    def _syllableSearchKey(self, syllable: str, tones: Dict[str, str], level: str) -> str:
+        """
+        一个音節个鍵：調符、數字調提出來，特殊字母轉 ASCII，白話字字母轉臺羅，無寫个聲調補陰平、陰入
+        """
+        letters, tone = [], ""
+        for char in unicodedata.normalize("NFD", syllable.lower()):
+            if char in tones:
+                tone = tones[char]
+            elif char.isdigit():
+                tone = char
+            else:
+                letters.append(char)
+        letters = "".join(letters).translate(_SEARCH_LETTERS)
+        if not letters:
+            return syllable
+        # 杜嘉德標準个 ö、ü、ï
+        letters = letters.replace("ö", "er").replace("ü", "ir").replace("̈", "")
+        # 甘爲霖、杜嘉德標準个 hⁿ、o͘ⁿ（鼻音聲母後壁是 o͘），白話字 ASCII 个 ou
+        letters = _SEARCH_NASAL_H.sub("nnh", letters).replace("ou", "oo")
+        letters = _SEARCH_NASAL_INITIAL_ONN.sub(r"\1oo", letters).replace("oonn", "onn")
+        letters = _POJ_IEN.sub(r"\1a\2\3", letters)
+        letters = letters.replace("ch", "ts")
+        letters = _POJ_ENG.sub("i", _POJ_OA.sub("u", letters))
+        if level == "tone":
+            return letters + (tone or self.addDefaultToneNumber(letters)[-1])
+        if level == "plain":
+            return _SEARCH_NASAL.sub("", letters)
+        return letters
+
+    def buildIndex(self, entries: Iterable[str], level: str = "tone") -> SearchIndex:
+        """
+        建搜揣用个倒排索引，詞目拼寫無仝、大小寫無仝攏查會着，參考 `SearchIndex`
+
+        ``` python
+        with open('lexicon.txt', encoding='utf-8') as f:
+            index = thokit.buildIndex(f)  # 一逝一个詞目，換逝無算
+        index.search('chúi')  # 有「水」即个音節个詞目編號
+        ```
+
+        參數：
+            entries (Iterable[str]): 詞目，編號是順序（對 0 算起）
+            level (str，可選): 鍵个層級，參考 `searchKey`，默認 "tone"
+        返回：
+            SearchIndex: 倒排索引
+        """
+        keys = partial(self._searchKeys, level=level)
+        keys("")  # 先檢查層級
+        syllables: Dict[str, List[int]] = {}
+        whole: Dict[str, List[int]] = {}
+        for i, entry in enumerate(entries):
+            entry_keys = keys(entry)
+            whole.setdefault(" ".join(entry_keys), []).append(i)
+            for key in dict.fromkeys(entry_keys):
+                syllables.setdefault(key, []).append(i)
+        return SearchIndex(
+            level,
+            {key: tuple(ids) for key, ids in syllables.items()},
+            {key: tuple(ids) for key, ids in whole.items()},
+            keys,
+        )
+
+    def buildPrefixIndex(
+        self,
+        entries: Iterable[str],
+        method: str = "pojAscii2Unicode",
+        tone_numbers: bool = True,
+        engine: str = "table",
+        **options,
+    ) -> PrefixIndex:
+        """
+        建輸入法用个前綴索引：詞目个 ASCII 寫法做鍵，預先轉換做 Unicode，參考 `PrefixIndex`
+
+        ``` python
+        index = thokit.buildPrefixIndex(lexicon, standard='campbell', tone_numbers=False)
+        index.complete('chui ku', limit=10)
+        ```
+
+        參數：
+            entries (Iterable[str]): 詞目个 ASCII 寫法（帶數字調）
+            method (str，可選): 轉換方法，默認 "pojAscii2Unicode"
+            tone_numbers (bool，可選): 鍵敢保留數字調，默認 True；False 个時拍無數字調嘛查會着
+            engine (str，可選): 轉換引擎，參考 `compile`，默認 "table"
+            **options: 佮該方法仝款个參數（無包括 text），譬論講 standard
+        返回：
+            PrefixIndex: 前綴索引
+        """
+        convert = self.compile(method, engine, **options)
+        pairs = dict.fromkeys((_prefixKey(entry, tone_numbers), convert(entry)) for entry in entries)
+        pairs = sorted(pairs, key=lambda pair: pair[0])  # 仝款个鍵照原本个順序
+        return PrefixIndex(tone_numbers, [key for key, _ in pairs], [form for _, form in pairs])
+
+    def _bindOptions(self, direction: str, options: Dict[str, object]) -> Tuple:
+        """
+        共參數照轉換方法个順序排好，補默認值，轉做會使做鍵个形式
+        """
+        builder = getattr(self, f"_{direction}Stages", None)
+        assert builder is not None, f"無支持个轉換方向：{direction}"
+        arguments = inspect.signature(builder).bind(**options)
+        arguments.apply_defaults()
+        return tuple(map(_freeze, arguments.args))
+
+    def _converter(self, direction: str, *args, engine: str = "regex") -> Converter:
+        # 公開轉換方法逐擺呼叫攏行即搭，編譯過个轉換器直接提，省一層函數呼叫
+        converter = self._converters.get((direction, *args) if engine == "regex" else (direction, *args, engine))
+        if converter is None:
+            converter = self._compiledConverter(direction, *args, engine=engine)
+        if self._profile is not None:
+            return self._profile.wrap(converter)
+        return converter
+
+    def _compiledConverter(self, direction: str, *args, engine: str = "regex") -> Converter:
+        key = (direction, *args) if engine == "regex" else (direction, *args, engine)
+        converter = self._converters.get(key)
+        if converter is None:
+            if engine == "table":
+                converter = self._tableConverter(self._compiledConverter(direction, *args))
+            elif engine == "token":
+                converter = self._tokenConverter(self._compiledConverter(direction, *args))
+            else:
+                builder = getattr(self, f"_{direction}Stages")
+                arguments = inspect.signature(builder).bind(*args)
+                arguments.apply_defaults()
+                stages = builder(*args)
+                converter = Converter(direction, arguments.arguments, stages)
+            converter = self._converters.setdefault(key, converter)
+        return converter
+
+    def converter(
+        self, src: str, dst: str, standard: str = None, engine: str = "token", **options
+    ) -> Converter:
+        """
+        任意兩種拼寫之間个轉換器
+
+        照拼寫之間个直接轉換方向揣上短个路線，逐段个轉換器串做伙。
+        白話字 Unicode 一定經過白話字 ASCII 轉換（`pojAscii2Unicode`、`pojUnicode2Ascii` 有白話字標準个拼寫規則），
+        路線固定，結果佮按呢串轉換方法仝款，譬論講 tailo-asc => poj-uni 是
+        `pojAscii2Unicode(tailoAscii2PojAscii(text), standard)`。
+        用 "token"、"table" 引擎个時，文本干焦切一擺音節，逐个音節規條路線行透，
+        上尾一擺連做伙，中途袂產生規个文本个字串。
+
+        參數：
+            src (str): 輸入拼寫，"tailo-asc"、"tailo-uni"、"poj-asc"、"poj-uni"、"ipa"
+            dst (str): 輸出拼寫，"tailo-asc"、"tailo-uni"、"poj-asc"、"poj-uni"、"ipa"
+            standard (str，可選): 白話字標準，用佇有白話字个每一段
+            engine (str，可選): 轉換引擎，參考 `compile`，默認 "token"
+            **options: 逐段轉換方法个其他參數，干焦傳予有即个參數个方法
+        返回：
+            Converter: 轉換器，用 `converter(text)` 轉換
+        """
+        assert engine in ["regex", "table", "token"], f"無支持个轉換引擎：{engine}"
+        path = self._orthographyPath(src, dst, _POJ_UNICODE_DIRECT_DIRECTIONS)
+        hops, used = [], set()
+        for direction in path:
+            parameters = inspect.signature(getattr(self, f"_{direction}Stages")).parameters
+            hop_options = {key: value for key, value in options.items() if key in parameters}
+            if standard is not None:
+                for name in ["standard", "poj_standard"]:
+                    if name in parameters:
+                        hop_options[name] = standard
+            used.update(hop_options)
+            hops.append((direction, self._bindOptions(direction, hop_options)))
+        assert set(options) <= used, f"無路線用着个參數：{sorted(set(options) - used)}"
+        if len(hops) == 1:
+            return self._converter(hops[0][0], *hops[0][1], engine=engine)
+        hops = [self._compiledConverter(direction, *args) for direction, args in hops]
+        key = (src, dst, *hops, engine)
+        converter = self._converters.get(key)
+        if converter is None:
+            options = {"src": src, "dst": dst, "standard": standard, **options}
+            converter = Converter(f"{src} => {dst}", options, [(hop.direction, hop) for hop in hops])
+            if engine == "table":
+                converter = self._tableConverter(converter, hops)
+            elif engine == "token":
+                converter = self._tokenConverter(converter, hops)
+            converter = self._converters.setdefault(key, converter)
+        if self._profile is not None:
+            return self._profile.wrap(converter)
+        return converter
+
+    def detect(self, text: str) -> Detection:
+        """
+        判斷文本个拼寫、編碼佮白話字標準
+
+        干焦對文本逐字看一擺，算特徵个分數：`ts`/`ch`、`ua`/`oa`、`ing`/`eng`、
+        `nn`/`ⁿ`、`oo`/`o͘`、`̋`/`̆`、數字調、`hⁿ`/`ⁿh`、杜嘉德个 `ɵ`/`ɛ`/`ü` 等等。
+        白話字標準：`tsa`、`hⁿ` 是舊个標準，`ien` 是巴克禮，`oā`、`o͘ⁿ` 是甘爲霖，
+        `ɵ`、`ɛ`、`ü` 是杜嘉德；攏無看着就當做默認標準。
+
+        參數：
+            text (str): 文本
+        返回：
+            Detection: (拼寫, 編碼, 白話字標準, 信心)，信心是拼寫佮編碼兩項个信心相乘
+        """
+        symbols = _detectSymbols()
+        scores = dict.fromkeys(
+            ["tailo", "poj", "ascii", "asc", "uni", "default", "classic", "campbell", "barclay", "douglas"], 0
+        )
+        # marked_a：頂一个調符標佇 oa、oe 个 a、e 頂懸，等看音節敢佇遮結束
+        letters, previous, marked_a = "", "", False
+        for char in text:
+            for symbol in symbols.get(char, char):
+                if marked_a and not ("\u0300" <= symbol <= "\u036f"):
+                    # oā、oē 後壁若閣有字母（oān、oat、oah）逐種標準仝款，干焦音節結束个時算
+                    if not symbol.isalpha():
+                        scores["campbell"] += 1
+                    marked_a = False
+                if symbol.isalpha() and symbol != "ⁿ":
+                    lower = symbol.lower()
+                    if lower == "h" and previous == "ⁿ":
+                        scores["default"] += 2
+                    if symbol in _DETECT_DOUGLAS_LETTERS:
+                        scores["douglas"] += 3
+                        scores["poj"] += 2
+                    letters = (letters + lower)[-3:]
+                    for cue in (letters[-2:], letters) if len(letters) == 3 else (letters,):
+                        feature = _DETECT_LETTER_CUES.get(cue)
+                        if feature is not None:
+                            scores[feature] += 2 if cue in ("tsh", "ch") else 1
+                elif "\u0300" <= symbol <= "\u036f":
+                    if letters:
+                        scores["uni"] += 1
+                        feature = _DETECT_MARK_CUES.get(symbol)
+                        if feature is not None:
+                            scores[feature] += 2
+                            if feature == "douglas":
+                                scores["poj"] += 1
+                        marked_a = letters[-2:] in ("oa", "oe")
+                elif symbol == "ⁿ":
+                    scores["poj"] += 2
+                    scores["uni"] += 2
+                    if previous == "h":
+                        scores["classic"] += 2
+                    elif previous == "\u0358":
+                        scores["campbell"] += 2
+                elif symbol.isdigit():
+                    if letters:
+                        scores["asc"] += 2
+                    letters = ""
+                else:
+                    letters = ""
+                previous = symbol
+        if marked_a:
+            scores["campbell"] += 1
+
+        def vote(a: str, b: str, a_score: int, b_score: int) -> Tuple[str, float]:
+            winner = b if b_score > a_score else a
+            return winner, (max(a_score, b_score) + 1) / (a_score + b_score + 2)
+
+        orthography, orthography_confidence = vote("tailo", "poj", scores["tailo"], scores["poj"])
+        asc = scores["asc"] + (scores["ascii"] if orthography == "poj" else 0)
+        encoding, encoding_confidence = vote("asc", "uni", asc, scores["uni"])
+        standard = None
+        if orthography == "poj":
+            if scores["douglas"]:
+                standard = "douglas"
+            elif scores["classic"] + scores["campbell"] + scores["barclay"] > scores["default"]:
+                standard = "barclay" if scores["barclay"] > scores["campbell"] else "campbell"
+        return Detection(orthography, encoding, standard, orthography_confidence * encoding_confidence)
+
+    def convertAuto(self, text: str, target: str, engine: str = "token", **options) -> str:
+        """
+        先用 `detect` 判斷文本个拼寫，才直接轉換做目標拼寫
+
+        參數：
+            text (str): 文本
+            target (str): 目標拼寫，"tailo-asc"、"tailo-uni"、"poj-asc"、"poj-uni"、"ipa"
+            engine (str，可選): 轉換引擎，參考 `converter`，默認 "token"
+            **options: 逐段轉換方法个其他參數，參考 `converter`
+        返回：
+            str: 轉換了个文本
+        """
+        detection = self.detect(text)
+        source = f"{detection.orthography}-{detection.encoding}"
+        if source == target:
+            return text
+        return self.converter(source, target, detection.standard, engine, **options)(text)
+
+    def _orthographyPath(self, src: str, dst: str, excluded: Iterable[str] = ()) -> List[str]:
+        """
+        兩種拼寫之間上短个轉換路線（廣度優先搜索），返回逐段个轉換方向
+
+        參數：
+            src (str): 輸入拼寫
+            dst (str): 輸出拼寫
+            excluded (Iterable[str]，可選): 袂使行个轉換方向
+        返回：
+            List[str]: 逐段个轉換方向
+        """
+        assert src in _ORTHOGRAPHY_GRAPH, f"無支持个拼寫：{src}"
+        assert dst in _ORTHOGRAPHY_GRAPH, f"無支持个拼寫：{dst}"
+        assert src != dst, f"輸入、輸出拼寫仝款：{src}"
+        paths = {src: []}
+        queue = deque([src])
+        while queue:
+            orthography = queue.popleft()
+            for target, direction in _ORTHOGRAPHY_GRAPH[orthography].items():
+                if target not in paths and direction not in excluded:
+                    paths[target] = paths[orthography] + [direction]
+                    queue.append(target)
+        assert dst in paths, f"無 {src} => {dst} 个轉換路線"
+        return paths[dst]
+
+    @contextmanager
+    def profile(self, callback: Callable[[str, str, float, int, int], None] = None):
+        """
+        記轉換流水線逐个階段个時間、呼叫次數佮輸入輸出字數
+
+        干焦 with 內底呼叫个轉換方法，抑是 with 內底 `compile` 个轉換器會記統計；
+        無咧記个時陣轉換器無任何改變。
+
+        參數：
+            callback (Callable，可選): 參考 `Profile`
+        返回：
+            Profile: 統計
+        """
+        previous = self._profile
+        self._profile = Profile(callback)
+        try:
+            yield self._profile
+        finally:
+            self._profile = previous
+
+    def convertBatch(
+        self,
+        lines: Iterable[str],
+        method: str,
+        workers: int = None,
+        chunksize: int = 1024,
+        engine: str = "regex",
+        **options,
+    ) -> List[str]:
+        """
+        多進程批量轉換
+
+        文本切做一塊一塊分予進程池，逐个工作進程開始个時就先編譯好轉換器。
+
+        參數：
+            lines (Iterable[str]): 欲轉換个文本
+            method (str): 轉換方法名，譬論講 "pojAscii2Unicode"
+            workers (int，可選): 工作進程數，默認是 CPU 核數；1 就佇本進程轉換
+            chunksize (int，可選): 逐塊个逝數，默認 1024
+            engine (str，可選): 轉換引擎，參考 `compile`
+            **options: 佮該方法仝款个參數（無包括 text）
+        返回：
+            List[str]: 轉換結果，順序佮輸入仝款
+        """
+        return list(
+            self.imapBatch(lines, method, workers, chunksize, engine, **options)
+        )
+
+    def imapBatch(
+        self,
+        lines: Iterable[str],
+        method: str,
+        workers: int = None,
+        chunksize: int = 1024,
+        engine: str = "regex",
+        **options,
+    ) -> Iterator[str]:
+        """
+        多進程批量轉換，照輸入个順序一逝一逝返回
+
+        參數佮 `convertBatch` 仝款。
+        """
+        converter = self.compile(method, engine, **options)
+        assert chunksize > 0, f"chunksize 愛大過 0：{chunksize}"
+        if workers == 1:
+            yield from map(converter, lines)
+            return
+        # 同時上濟幾塊佇進程池，免得規个輸入攏讀入記憶體
+        window = 2 * (workers or os.cpu_count() or 1)
+        initargs = (self.cache_size, method, engine, options)
+        import multiprocessing  # 干焦多進程轉換用着，import 个時較緊
+
+        with multiprocessing.Pool(workers, _initWorker, initargs) as pool:
+            pending = deque()
+            for chunk in _chunks(lines, chunksize):
+                pending.append(pool.apply_async(_convertChunk, (chunk,)))
+                if len(pending) >= window:
+                    yield from pending.popleft().get()
+            while pending:
+                yield from pending.popleft().get()
+
+    def convertBatchThreaded(
+        self,
+        lines: Iterable[str],
+        method: str,
+        max_workers: int = None,
+        chunksize: int = 1024,
+        engine: str = "regex",
+        **options,
+    ) -> List[str]:
+        """
+        多執行緒批量轉換
+
+        逐个執行緒共用仝一个編譯好个轉換器佮快取，文本佮結果免 pickle，工作嘛免閣編譯轉換器。
+        無 GIL 个 Python（free-threaded，3.13+）通過量綴執行緒數增加；有 GIL 个 Python 用 `convertBatch` 較緊。
+
+        參數：
+            lines (Iterable[str]): 欲轉換个文本
+            method (str): 轉換方法名，譬論講 "pojAscii2Unicode"
+            max_workers (int，可選): 執行緒數，默認是 CPU 核數；1 就佇本執行緒轉換
+            chunksize (int，可選): 逐塊个逝數，默認 1024
+            engine (str，可選): 轉換引擎，參考 `compile`
+            **options: 佮該方法仝款个參數（無包括 text）
+        返回：
+            List[str]: 轉換結果，順序佮輸入仝款
+        """
+        converter = self.compile(method, engine, **options)
+        assert chunksize > 0, f"chunksize 愛大過 0：{chunksize}"
+        if max_workers == 1:
+            return list(map(converter, lines))
+        max_workers = max_workers or os.cpu_count() or 1
+        from concurrent.futures import ThreadPoolExecutor  # 干焦多執行緒轉換用着，import 个時較緊
+
+        results = []
+        with ThreadPoolExecutor(max_workers) as executor:
+            # 同時上濟幾塊咧轉換，免得規个輸入攏讀入記憶體
+            pending = deque()
+            for chunk in _chunks(lines, chunksize):
+                pending.append(executor.submit(list, map(converter, chunk)))
+                if len(pending) >= 2 * max_workers:
+                    results += pending.popleft().result()
+            while pending:
+                results += pending.popleft().result()
+        return results
+
+    def syllableInventory(self) -> List[str]:
+        """
+        臺羅 ASCII 音節表
+
+        聲母 × 韻母 × 聲調，逐个音節攏有數字調；陰平、陰入另外閣加一个無寫數字調个。
+        即个表干焦照拼寫組合，無檢查實際有這个音無。
+
+        返回：
+            List[str]: 細寫个臺羅 ASCII 音節
+        """
+        syllables = []
+        for initial in self.tailo_initials:
+            for final in self.tailo_finals:
+                segmental_syllable = initial + final
+                tones = "48" if final[-1] in self.entering_endings else "1235679"
+                syllables.append(segmental_syllable)
+                syllables += [segmental_syllable + tone for tone in tones]
+        return syllables
+
+    def _inventoryForms(self, orthography: str, standard: str = None) -> List[str]:
+        """
+        音節表佇某種拼寫个形式（細寫、首字母大寫、全大寫；Unicode 包括 NFC 佮 NFD）
+        """
+        key = (orthography, standard)
+        forms = self._inventory_forms.get(key)
+        if forms is not None:
+            return forms
+        tables = self._prebuiltTables()
+        forms = tables and tables.forms(orthography, standard)
+        if forms:
+            return self._inventory_forms.setdefault(key, forms)
+        forms = self._syllableForms(self.syllableInventory(), orthography, standard)
+        return self._inventory_forms.setdefault(key, forms)
+
+    def _syllableForms(self, syllables: List[str], orthography: str, standard: str = None) -> List[str]:
+        """
+        細寫个臺羅 ASCII 音節佇某種拼寫个形式，參考 `_inventoryForms`
+        """
+        if orthography == "ipa":
+            forms = _convertSyllables(self.tailoAscii2Ipa, syllables) or []
+            forms += [unicodedata.normalize("NFC", form) for form in forms]
+            return list(dict.fromkeys(forms))
+        syllables = syllables + [syllable.capitalize() for syllable in syllables] + [
+            syllable.upper() for syllable in syllables
+        ]
+        if orthography == "tailo-asc":
+            forms = syllables
+        elif orthography == "poj-asc":
+            forms = _convertSyllables(self.tailoAscii2PojAscii, syllables) or []
+        else:
+            if orthography == "tailo-uni":
+                forms = _convertSyllables(self.tailoAscii2Unicode, syllables) or []
+            else:
+                forms = _convertSyllables(
+                    partial(self.pojAscii2Unicode, standard=standard),
+                    _convertSyllables(self.tailoAscii2PojAscii, syllables) or [],
+                ) or []
+            forms += [unicodedata.normalize("NFD", form) for form in forms]
+        return list(dict.fromkeys(forms))
+
+    def _prebuiltTables(self):
+        """
+        預先建好个音節表檔案（`thokit.prebuilt`）；無用、檔案袂用得抑是音節表、調符表有改就返回 None
+        """
+        if not self.prebuilt:
+            return None
+        tables = _prebuiltTables()
+        if tables is None:
+            return None
+        from thokit import prebuilt
+
+        # 音節表抑是調符表有改个實例，檔案內底个表對袂着
+        if tables.inventory != prebuilt.inventoryKey(self):
+            return None
+        return tables
+
+    def _tableConverter(
+        self, converter: Converter, hops: List[Converter] = None
+    ) -> TableConverter:
+        """
+        用音節表建查表个轉換器
+
+        參數：
+            converter (Converter): 正則表達式个轉換器
+            hops (List[Converter]，可選): `converter` 是串做伙个轉換器个時，逐段个轉換器
+        """
+        hops = hops or [converter]
+        orthography = _SOURCE_ORTHOGRAPHIES[hops[0].direction]
+        standard = None
+        if orthography == "poj-uni":
+            standard = hops[0].options.get("standard", hops[0].options.get("poj_standard"))
+        forms = self._inventoryForms(orthography, standard)
+        arguments = self._tokenArguments(hops)
+        if arguments["case_sensitive"]:
+            # 干焦一个大寫字母个音節愛看隔壁个音節，袂使入表
+            forms = [form for form in forms if _caseMask(form) != _CASE_EITHER]
+        tables = self._prebuiltTables()
+        values = tables and tables.table(hops, len(forms))
+        table = dict(zip(forms, values or _convertSyllables(converter, forms) or []))
+        return TableConverter(converter, table, cache_size=self.cache_size, **arguments)
+
+    def _tokenConverter(
+        self, converter: Converter, hops: List[Converter] = None
+    ) -> TokenConverter:
+        """
+        建逐音節轉換个轉換器，參數參考 `_tableConverter`
+        """
+        arguments = self._tokenArguments(hops or [converter])
+        return TokenConverter(converter, cache_size=self.cache_size, **arguments)
+
+    def _tokenArguments(self, hops: List[Converter]) -> Dict[str, object]:
+        """
+        逐音節轉換愛个參數：敢愛看隔壁音節个大小寫、上下文、分隔文字个轉換
+
+        串做伙个轉換器，第二段以後个上下文無法度對原本个音節判斷，所有音節攏當做會受影響。
+        """
+        directions = [hop.direction for hop in hops]
+        contexts = dict(self._ruleContexts(hops[0]))
+        for hop in hops[1:]:
+            contexts.update(dict.fromkeys(self._ruleContexts(hop), _CONTEXT_ANY))
+        separators = [_SEPARATOR_FUNCTIONS[d] for d in directions if d in _SEPARATOR_FUNCTIONS]
+        separator = None
+        if separators:
+            separator = separators[0]
+            for function in separators[1:]:
+                separator = lambda text, f=separator, g=function: g(f(text))
+        return {
+            "case_sensitive": any(d in _CASE_SENSITIVE_DIRECTIONS for d in directions),
+            "contexts": contexts,
+            "separator": separator,
+        }
+
+    def _ruleContexts(self, converter: Converter) -> Dict[str, "re.Pattern"]:
+        """
+        轉換規則有看个上下文，查表个時頭尾音節若受影響愛另外處理
+
+        - "start"：`([^o])onn` 愛頭前有字
+        - "end"：`(n)(oo)([^n])`、`ch([^eih])` 愛後壁有字
+        """
+        options = converter.options
+        if converter.direction == "pojAscii2Unicode" and options["case_spelling"]:
+            if options["standard"] == "campbell":
+                return {"start": _CONTEXT_START_ONN, "end": _CONTEXT_END_NOO_CH}
+            if options["standard"] in ["douglas", "barclay"]:
+                return {"end": _CONTEXT_END_NOO_CH}
+        return {}
+
+    def _syllableCache(self, name: str, standard: str = None) -> Callable[[str], str]:
+        """
+        提着音節函數（標調徙位）个快取版本，逐个白話字標準各用一个 LRU 快取，
+        大小寫無仝个音節共用細寫个快取（參考 `_caseSharedCache`）
+        """
+        key = (name, standard)
+        cache = self._syllable_caches.get(key)
+        if cache is None:
+            function = getattr(self, name)
+            if name in ["movePojToneNumber", "movePojToneAccent"]:
+                function = partial(function, standard=standard)
+            cache = self._syllable_caches.setdefault(
+                key, _caseSharedCache(function, self.cache_size)
+            )
+        return cache
+
+    def cacheInfo(self) -> Dict[Tuple[str, str], object]:
+        """
+        音節快取个統計
+
+        返回：
+            Dict[Tuple[str, str], CacheInfo]: 鍵是（函數名, 白話字標準），
+                值是 `functools` 个 `CacheInfo(hits, misses, maxsize, currsize)`
+
+        ``` python
+        >>> thokit.tailoAscii2Unicode("tsa1-bo2 tsa1-bo2")
+        'tsa-bó tsa-bó'
+        >>> thokit.cacheInfo()
+        {('moveTailoToneNumber', None): CacheInfo(hits=2, misses=2, maxsize=4096, currsize=2)}
+        ```
+        """
+        return {key: cache.cache_info() for key, cache in self._syllable_caches.items()}
+
+    def cacheClear(self) -> None:
+        """
+        清掉所有音節快取佮統計
+        """
+        for cache in self._syllable_caches.values():
+            cache.cache_clear()
+
+    def addDefaultToneNumber(self, segmental_syllable: str) -> str:
+        """
+        陰平佮陰入音節添數字調（默認免寫出來）
+        """
+        return segmental_syllable + (
+            "4" if segmental_syllable[-1] in self.entering_endings else "1"
+        )
+
+    def _addDefaultToneNumberMatch(self, match: re.Match) -> str:
+        return self.addDefaultToneNumber(match.group(1)) + match.group(2)
+
+    def replaceAccents(self, text: str, accent_marks: list) -> str:
+        """
+        調符分解，然後轉數字調
+        """
+        text = unicodedata.normalize("NFD", text)
+        for idx, accent in enumerate(accent_marks):
+            if accent and accent in text:
+                text = text.replace(accent, str(idx))
+        return text
+
+    def tailoUnicode2Ascii(self, text: str, accent_marks: Tuple[str, ...] = ()) -> str:
+        """
+        臺羅 Unicode 轉 ASCII
+
+        參數：
+            text (str): 輸入个臺羅 Unicode 文本，帶 Unicode 調符
+            accent_marks (Tuple[str, ...]): 調符數組
+        返回：
+            str: 轉換後个臺羅 ASCII 文本，帶數字調
+        """
+        return self._converter("tailoUnicode2Ascii", tuple(accent_marks))(text)
+
+    def _tailoUnicode2AsciiStages(self, accent_marks: Tuple[str, ...] = ()):
+        if not accent_marks:
+            accent_marks = self.tailo_accent_marks
+        return [
+            ("replaceAccents", partial(self.replaceAccents, accent_marks=tuple(accent_marks))),
+            ("moveToneNumber", partial(_TONE_NUMBER_TO_END.sub, r"\2\1\3")),  # 數字調放後壁
+            (
+                "addDefaultToneNumber",
+                partial(_SEGMENTAL_SYLLABLE.sub, self._addDefaultToneNumberMatch),
+            ),  # 添陰平、陰入數字調
+        ]
+
+    def pojSpecialLetterUnicode2Ascii(self, text: str, standard: str, single_upper: bool = False) -> str:
+        """
+        白話字特殊字母（o͘、ⁿ，杜嘉德標準閣有 ö、ü、ɛ、ï）轉 ASCII 字母
+
+        轉換規則干焦寫細寫：逐个音節先記大小寫（細寫、首字母大寫、全大寫）閣轉細寫，
+        規个文本一擺轉換了後才照記落來个大小寫改倒轉去。干焦一个大寫字母个音節（譬論講 `O͘`），
+        隔壁攏是大寫个時當做全大寫，隔壁有細寫个時當做首字母大寫（參考 `_eitherCase`）；
+        孤一个音節默認當做首字母大寫（`Ó͘` => `Óo`），`pojUnicode2Ascii` 當做全大寫（`Ó͘` => `OO2`）。
+        大細寫濫做伙个音節嘛轉細寫轉換，逐字个大小寫參考 `_transferCase`。
+
+        參數：
+            text (str): 白話字 Unicode 文本（NFD）
+            standard (str): 白話字標準
+            single_upper (bool，可選): 孤一个音節敢當做全大寫，默認 False
+        返回：
+            str: 轉換了个文本
+        """
+        if not _POJ_SPECIAL_LETTER_UNICODE.search(text):
+            return text
+        single = _CASE_UPPER if single_upper else _CASE_TITLE
+        return _foldCase(partial(_replacePojSpecialLetters, standard=standard), text, single)
+
+    def pojUnicode2Ascii(
+        self, text: str, standard: str = None, accent_marks: Tuple[str, ...] = ()
+    ) -> str:
+        """
+        白話字 Unicode 轉 ASCII
+
+        參數：
+            text (str): 輸入个白話字 Unicode 文本，帶 Unicode 調符
+            accent_marks (Tuple[str, ...]): 調符數組
+        返回：
+            str: 轉換後个白話字 ASCII 文本，帶數字調
+
+        請注意，即个函數着考慮一對多映射，譬論講：
+        `O͘ => (OO|Oo)`（全大寫 | 首字母大寫）个轉換結果不唯一。
+        大小寫逐个音節看：轉換規則干焦寫細寫，音節先轉細寫，轉換了後才照原本个大小寫改倒轉去。
+        干焦一个大寫字母个音節（`O͘`、`Ó͘`）隔壁攏是大寫抑是孤一个音節个時轉換做頭一種，
+        隔壁有細寫个時轉換做後一種，參考 `pojSpecialLetterUnicode2Ascii`。
+        """
+        return self._converter("pojUnicode2Ascii", standard, tuple(accent_marks))(text)
+
+    def _pojUnicode2AsciiStages(
+        self, standard: str = None, accent_marks: Tuple[str, ...] = ()
+    ):
+        if standard:
+            assert standard in self.poj_standards, f"無支持个白話字標準：{standard}"
+        if not accent_marks:
+            accent_marks = self.poj_accent_marks
+        stages = [("normalize", partial(unicodedata.normalize, "NFD"))]
+        if standard in ["campbell", "barclay", "douglas"]:
+            stages.append(("moveNasalH", partial(_POJ_H_NASAL.sub, r"\2\1")))
+        stages += [
+            (
+                "pojSpecialLetterUnicode2Ascii",
+                partial(self.pojSpecialLetterUnicode2Ascii, standard=standard, single_upper=True),
+            ),
+            ("replaceAccents", partial(self.replaceAccents, accent_marks=tuple(accent_marks))),
+            ("moveToneNumber", partial(_TONE_NUMBER_TO_END.sub, r"\2\1\3")),  # 數字調放後壁
+            (
+                "addDefaultToneNumber",
+                partial(_SEGMENTAL_SYLLABLE.sub, self._addDefaultToneNumberMatch),
+            ),  # 添陰平、陰入數字調
+        ]
+        if standard == "campbell":
+
+            def campbellLetters(text: str) -> str:
+                text = _CAMPBELL_MOONN_ASCII.sub(r"\1\2", text)
+                return _CAMPBELL_OONN_ASCII.sub(r"\1\3", text)
+
+            stages.append(("standardLetters", partial(_foldCase, campbellLetters)))
+        elif standard in ["douglas", "barclay"]:
+
+            def douglasLetters(text: str) -> str:
+                text = _POJ_IEN.sub(r"\1a\2\3", text)
+                return text.replace("oo", "ou").replace("ts", "ch").replace("nnh", "hnn")
+
+            stages.append(("standardLetters", partial(_foldCase, douglasLetters)))
+        return stages
+
+    def pojAscii2TailoAscii(self, text: str) -> str:
+        """
+        白話字 ASCII 轉臺羅 ASCII
+
+        參數：
+            text (str): 輸入个白話字 ASCII 文本，帶數字調
+        返回：
+            str: 轉換後个臺羅 ASCII 文本，帶數字調
+        """
+        return self._converter("pojAscii2TailoAscii")(text)
+
+    def _pojAscii2TailoAsciiStages(self):
+        def pojLetters2Tailo(text: str) -> str:
+            text = text.replace("ch", "ts").replace("Ch", "Ts").replace("CH", "TS")
+            text = _POJ_OA.sub(partial(_replaceCased, "u"), text)
+            return _POJ_ENG.sub(partial(_replaceCased, "i"), text)
+
+        return [("pojLetters2Tailo", pojLetters2Tailo)]
+
+    def pojAscii2TailoAsciiBytes(self, data: Union[bytes, bytearray, memoryview]) -> bytes:
+        """
+        白話字 ASCII 轉臺羅 ASCII，bytes 版本
+
+        毋免 UTF-8 解碼佮逐逝建字串，規个緩衝區一擺轉換，適合大檔案；結果佮 `pojAscii2TailoAscii` 仝款，
+        非 ASCII 个 byte（譬論講 UTF-8 个漢字）原樣保留
+
+        參數：
+            data (Union[bytes, bytearray, memoryview]): 輸入个白話字 ASCII 文本，帶數字調
+        返回：
+            bytes: 轉換後个臺羅 ASCII 文本，帶數字調
+        """
+        return _convertAsciiBytes("pojAscii2TailoAscii", data)
+
+    def tailoAscii2PojAscii(self, text: str) -> str:
+        """
+        臺羅 ASCII 轉白話字 ASCII
+
+        參數：
+            text (str): 輸入个臺羅 ASCII 文本，帶數字調
+        返回：
+            str: 轉換後个白話字 ASCII 文本，帶數字調
+        """
+        return self._converter("tailoAscii2PojAscii")(text)
+
+    def _tailoAscii2PojAsciiStages(self):
+        def tailoLetters2Poj(text: str) -> str:
+            text = text.replace("ts", "ch").replace("Ts", "Ch").replace("TS", "CH")
+            text = _TAILO_UA.sub(partial(_replaceCased, "o"), text)
+            return _TAILO_ING.sub(partial(_replaceCased, "e"), text)
+
+        return [("tailoLetters2Poj", tailoLetters2Poj)]
+
+    def tailoAscii2PojAsciiBytes(self, data: Union[bytes, bytearray, memoryview]) -> bytes:
+        """
+        臺羅 ASCII 轉白話字 ASCII，bytes 版本，參考 `pojAscii2TailoAsciiBytes`
+
+        參數：
+            data (Union[bytes, bytearray, memoryview]): 輸入个臺羅 ASCII 文本，帶數字調
+        返回：
+            bytes: 轉換後个白話字 ASCII 文本，帶數字調
+        """
+        return _convertAsciiBytes("tailoAscii2PojAscii", data)
+
+    def moveTailoToneNumber(self, syllable: str) -> str:
+        """
+        臺羅數字標調徙位
+        """
+        if _VOWEL.search(syllable):
+            syllable = _TAILO_TONE_NUMBER_VOWEL.sub(r"\1\3\2", syllable, count=1)
+            return _TAILO_TONE_NUMBER_DIPHTHONG.sub(r"\1\3\2", syllable, count=1)
+        syllable = _TONE_NUMBER_NG.sub(r"\1\3\2", syllable, count=1)
+        syllable = _TONE_NUMBER_M.sub(r"\1\3\2", syllable, count=1)
+        return syllable
+
+    def tailoAscii2Unicode(
+        self,
+        text: str,
+        support_poj_letters: bool = False,
+        accent_marks: Tuple[str, ...] = (),
+        normalization: str = "NFC",
+    ) -> str:
+        """
+        臺羅 ASCII 轉 Unicode
+
+        參數：
+            text (str): 輸入个臺羅 ASCII 文本，帶數字調
+            accent_marks (Tuple[str, ...]): 調符數組
+            normalization (str，可選): Unicode 正則化形式，默認做 "NFC"
+        返回：
+            str: 轉換後个臺羅 Unicode 文本，帶 Unicode 調符
+        """
+        return self._converter(
+            "tailoAscii2Unicode", support_poj_letters, tuple(accent_marks), normalization
+        )(text)
+
+    def _tailoAscii2UnicodeStages(
+        self,
+        support_poj_letters: bool = False,
+        accent_marks: Tuple[str, ...] = (),
+        normalization: str = "NFC",
+    ):
+        stages = []
+        move = self._syllableCache("moveTailoToneNumber")
+        if support_poj_letters:
+            stages += self._pojAscii2TailoAsciiStages()
+        if not accent_marks:
+            accent_marks = self.tailo_accent_marks
+        accent_marks = tuple(accent_marks)
+        assert normalization in self.normalization_forms
+        stages += [
+            (
+                "moveToneNumber",
+                partial(
+                    _NUMBERED_SYLLABLE.sub,
+                    lambda x: move(x.group(0)),
+                ),
+            ),  # 數字調徙位
+            (
+                "addAccents",
+                partial(
+                    _TONE_NUMBER.sub,
+                    lambda x: x.group(1) + accent_marks[int(x.group(2))],
+                ),
+            ),  # 數字調轉 Unicode 調符
+            ("normalize", partial(unicodedata.normalize, normalization)),
+        ]
+        return stages
+
+    def _movePojToneNumber(self, syllable: str) -> str:
+        """
+        白話字數字標調徙位（無處理 o 介音）
+        """
+        if "a" in syllable or "e" in syllable or "A" in syllable or "E" in syllable:
+            return _POJ_TONE_NUMBER_AE.sub(r"\1\3\2", syllable, count=1)
+        elif "o" in syllable or "O" in syllable:
+            return _POJ_TONE_NUMBER_O.sub(r"\1\3\2", syllable, count=1)
+        elif "u" in syllable or "U" in syllable:
+            return _POJ_TONE_NUMBER_U.sub(r"\1\3\2", syllable, count=1)
+        elif "i" in syllable or "I" in syllable:
+            return _POJ_TONE_NUMBER_I.sub(r"\1\3\2", syllable, count=1)
+        syllable = _TONE_NUMBER_NG.sub(r"\1\3\2", syllable, count=1)
+        syllable = _TONE_NUMBER_M.sub(r"\1\3\2", syllable, count=1)
+        return syllable
+
+    def movePojToneNumber(self, syllable, standard: str = None):
+        """
+        白話字數字標調徙位
+        """
+        syllable = self._movePojToneNumber(syllable)
+        if standard == "campbell":
+            """
+            甘爲霖白話字標調特殊規則
+                介音 o：([a-z])o([ae])\d 或者 ([a-z])o([ae])(nn)\d，標 o；若無標 a、e
+                ainnh8：標 i
+            """
+            syllable = _CAMPBELL_TONE_NUMBER_OA.sub(r"\1\2\4\3\5\6", syllable, count=1)
+            syllable = _CAMPBELL_TONE_NUMBER_AINNH.sub(r"\1\3\2\4", syllable, count=1)
+        elif standard == "douglas":
+            """
+            杜嘉德《廈英大辭典》白話字標調一般規則
+                介音 o：oe/oee，標 o
+                ainn/ainnh：標 i
+            """
+            syllable = _DOUGLAS_TONE_NUMBER_OE.sub(r"\1\3\2", syllable, count=1)
+            syllable = _DOUGLAS_TONE_NUMBER_AINN.sub(r"\1\3\2\4", syllable, count=1)
+        elif standard == "barclay":
+            """
+            巴克禮《增補廈英大辭典》白話字標調一般規則
+                介音 o：
+                  - ([a-z])o(a)\d 或者 ([a-z])o(a)(nn)\d，標 o；若無標 a
+                  - oe，標 o
+
+                按：若嚴格依《增補廈英大辭典》
+                - 非零聲母+oa(h?)(ⁿ?)，多數標 o，少數標 a；
+                - 非零聲母+oan/oat，標 o 或 a 兩可（b-/t-/kh-/g-/ts-/chh-/h-/l- 多標 o，k-/s- 多標 a）；
+                - 非零聲母+oai，標 o 或 a 兩可（h- 多標 o，k- 多標 a， kh- 五五開）
+                - 非零聲母+oaiⁿ，標 o 或 a 兩可（s- 標 o，k-/h- 多標 a）
+                - 零聲母+oa(.*)，多數標 a，少數標 o；
+                - oe，多數標 o，少數標 e
+            """
+            syllable = _DOUGLAS_TONE_NUMBER_OE.sub(r"\1\3\2", syllable, count=1)
+            syllable = _BARCLAY_TONE_NUMBER_OA.sub(r"\1\2\4\3\5\6", syllable, count=1)
+        else:
+            """
+            現代白話字標調特殊規則
+                介音 o：oa, oe, oaⁿ, oeⁿ（不論是否零聲母）, 標 o；否則標 a、e
+            """
+            syllable = _POJ_TONE_NUMBER_OA.sub(r"\1\3\2\4\5", syllable, count=1)
+        return syllable
+
+    def pojSpecialLetterAscii2Unicode(self, text, standard: str = None) -> str:
+        """
+        白話字 ASCII 字母（oo、nn，杜嘉德標準閣有 ee、ir、er、y）轉特殊字母
+
+        轉換規則干焦寫細寫，逐个音節个大小寫參考 `pojSpecialLetterUnicode2Ascii`。
+        """
+        letters = _DOUGLAS_SPECIAL_LETTER_ASCII if standard == "douglas" else _POJ_SPECIAL_LETTER_ASCII
+        if not letters.search(text):
+            return text
+        return _foldCase(partial(_replacePojSpecialLettersAscii, standard=standard), text)
+
+    def pojAscii2Unicode(
+        self,
+        text: str,
+        standard: str = None,
+        case_spelling: bool = True,
+        support_tailo_letters=False,
+        support_N=False,
+        accent_marks: Tuple[str, ...] = (),
+        normalization: str = "NFC",
+    ) -> str:
+        """
+        白話字 ASCII 轉 Unicode
+
+        參數：
+            text (str): 輸入个白話字 ASCII 文本，帶數字調
+            standard（str，可選）：白話字標準
+            support_N（bool，可選）：敢支持 -N 轉做 -nn，默認無（解佮大寫 -NN 衝突）
+            accent_marks (Tuple[str, ...]): 調符數組
+            normalization (str，可選): Unicode 正則化形式，默認做 "NFC"
+        返回：
+            str: 轉換後个白話字 Unicode 文本，帶 Unicode 調符
+        """
+        return self._converter(
+            "pojAscii2Unicode",
+            standard,
+            case_spelling,
+            support_tailo_letters,
+            support_N,
+            tuple(accent_marks),
+            normalization,
+        )(text)
+
+    def _pojAscii2UnicodeStages(
+        self,
+        standard: str = None,
+        case_spelling: bool = True,
+        support_tailo_letters=False,
+        support_N=False,
+        accent_marks: Tuple[str, ...] = (),
+        normalization: str = "NFC",
+    ):
+        if standard:
+            assert standard in self.poj_standards, f"無支持个白話字標準：{standard}"
+        stages = []
+        move = self._syllableCache("movePojToneNumber", standard)
+        if support_tailo_letters:
+            stages += self._tailoAscii2PojAsciiStages()
+        if not accent_marks:
+            accent_marks = self.poj_accent_marks
+        accent_marks = tuple(accent_marks)
+        assert normalization in self.normalization_forms
+        stages.append(
+            (
+                "replaceLetters",
+                lambda text: text.replace("ou", "oo")
+                .replace("Ou", "Oo")
+                .replace("OU", "OO")
+                .replace("hnn", "nnh")
+                .replace("HNN", "NNH"),
+            )
+        )
+        if support_N:  # 支持大寫 N 轉換做 nn
+            stages.append(("supportN", partial(_POJ_SUPPORT_N.sub, r"\1nn")))
+        if standard == "campbell" and case_spelling:
+
+            def campbellSpelling(text: str) -> str:
+                """
+                臺羅 vs 甘爲霖白話字
+                    tsh => chh
+                    ts([^ie]) => ts
+                    ts([ie]) => ch
+                    onn => o͘ⁿ
+                    moo/ngoo => mo͘/ngo͘
+                    noo => no͘ⁿ
+                """
+                text = _POJ_ONN.sub(r"\1oonn", text)
+                text = _POJ_NOO.sub(r"\1\2nn\3", text)
+                text = _POJ_MOONN.sub(r"\1\2", text)
+                text = _POJ_CH_TS.sub(r"ts\1", text)
+                return _POJ_TS_CH.sub(r"ch\1", text)
+
+            stages.append(("caseSpelling", partial(_foldCase, campbellSpelling)))
+        elif standard in ["douglas", "barclay"] and case_spelling:
+
+            def douglasSpelling(text: str) -> str:
+                """
+                臺羅 vs 甘爲霖/巴克禮白話字
+                    tsh => chh
+                    ts([^ie]) => ts
+                    ts([ie]) => ch
+                    onn => o͘ⁿ
+                    另 m/n/ng 後韻母是否加 ⁿ 兩可，故不予強制轉換
+                """
+                text = _POJ_CH_TS.sub(r"ts\1", text)
+                text = _POJ_TS_CH.sub(r"ch\1", text)
+                return _POJ_IAN.sub(r"\1e\2\3", text)
+
+            stages.append(("caseSpelling", partial(_foldCase, douglasSpelling)))
+        stages += [
+            (
+                "moveToneNumber",
+                partial(
+                    _NUMBERED_SYLLABLE.sub,
+                    lambda x: move(x.group(0)),
+                ),
+            ),
+            (
+                "addAccents",
+                partial(
+                    _TONE_NUMBER.sub,
+                    lambda x: x.group(1) + accent_marks[int(x.group(2))],
+                ),
+            ),
+            (
+                "pojSpecialLetterAscii2Unicode",
+                partial(self.pojSpecialLetterAscii2Unicode, standard=standard),
+            ),
+        ]
+        if standard in ["campbell", "barclay", "douglas"]:
+            stages.append(("moveNasalH", partial(_POJ_NASAL_H.sub, r"\2\1")))
+        stages.append(("normalize", partial(unicodedata.normalize, normalization)))
+        return stages
+
+    def moveTailoToneAccent(self, syllable: str) -> str:
+        """
+        臺羅調符徙位
+        """
+        if _VOWEL.search(syllable):
+            syllable = _TAILO_TONE_ACCENT_VOWEL.sub(r"\1\3\2", syllable, count=1)
+            return _TAILO_TONE_ACCENT_DIPHTHONG.sub(r"\1\3\2", syllable, count=1)
+        syllable = _TONE_ACCENT_NG.sub(r"\1\3\2", syllable, count=1)
+        syllable = _TONE_ACCENT_M.sub(r"\1\3\2", syllable, count=1)
+        return syllable
+
+    def pojUnicode2TailoUnicode(
+        self, text: str, poj_standard: str = None, normalization: str = "NFC"
+    ) -> str:
+        """
+        白話字 Unicode 轉臺羅 Unicode
+
+        參數:
+            text (str): 輸入个白話字 Unicode 文本
+            standard（str，可選）：白話字標準
+            normalization (str，可選): Unicode 正則化形式，默認做 "NFC"
+        返回：
+            str: 轉換後个臺羅 Unicode 文本
+        """
+        return self._converter("pojUnicode2TailoUnicode", poj_standard, normalization)(
+            text
+        )
+
+    def _pojUnicode2TailoUnicodeStages(
+        self, poj_standard: str = None, normalization: str = "NFC"
+    ):
+        move = self._syllableCache("moveTailoToneAccent")
+        stages = [
+            (
+                "normalize",
+                lambda text: unicodedata.normalize("NFD", text).replace("\u0306", "\u030b"),
+            ),
+            (
+                "pojSpecialLetterUnicode2Ascii",
+                partial(self.pojSpecialLetterUnicode2Ascii, standard=poj_standard),
+            ),
+        ]
+        if poj_standard == "campbell":
+
+            def campbellLetters(text: str) -> str:
+                text = _CAMPBELL_HNN.sub(r"\2\1", text)
+                text = _CAMPBELL_MOONN.sub(r"\1\2\3\4", text)
+                return _CAMPBELL_OONN.sub(r"\1\2\4", text)
+
+            stages.append(("standardLetters", campbellLetters))
+        stages.append(("moveAccentToEnd", partial(_ACCENT_TO_END.sub, r"\2\1\3")))
+        stages += self._pojAscii2TailoAsciiStages()
+        stages += [
+            (
+                "moveToneAccent",
+                partial(
+                    _ACCENTED_SYLLABLE.sub,
+                    lambda match: move(match.group(0)),
+                ),
+            ),
+            ("normalize", partial(unicodedata.normalize, normalization)),
+        ]
+        return stages
+
+    def pojUnicode2TailoUnicodeCascade(
+        self, text: str, poj_standard: str = None, normalization: str = "NFC"
+    ) -> str:
+        """
+        白話字 Unicode 轉臺羅 Unicode（級聯版，效率較下）
+
+        參數:
+            text (str): 輸入个白話字 Unicode 文本
+            standard（str，可選）：白話字標準
+            normalization (str，可選): Unicode 正則化形式，默認做 "NFC"
+        返回：
+            str: 轉換後个臺羅 Unicode 文本
+        """
+        text = self.pojUnicode2Ascii(text, standard=poj_standard)
+        text = self.pojAscii2TailoAscii(text)
+        return self.tailoAscii2Unicode(text, normalization)
+
+    def _movePojToneAccent(self, syllable: str) -> str:
+        """
+        白話字調符徙位（無處理 o 介音）
+        """
+        if "a" in syllable or "e" in syllable or "A" in syllable or "E" in syllable:
+            return _POJ_TONE_ACCENT_AE.sub(r"\1\3\2", syllable, count=1)
+        elif "o" in syllable or "O" in syllable:
+            return _POJ_TONE_ACCENT_O.sub(r"\1\3\2", syllable, count=1)
+        elif "u" in syllable or "U" in syllable:
+            return _POJ_TONE_ACCENT_U.sub(r"\1\3\2", syllable, count=1)
+        elif "i" in syllable or "I" in syllable:
+            return _POJ_TONE_ACCENT_I.sub(r"\1\3\2", syllable, count=1)
+        syllable = _TONE_ACCENT_NG.sub(r"\1\3\2", syllable, count=1)
+        syllable = _TONE_ACCENT_M.sub(r"\1\3\2", syllable, count=1)
+        return syllable
+
+    def movePojToneAccent(self, syllable, standard: str = None):
+        """
+        白話字調符徙位
+        """
+        syllable = self._movePojToneAccent(syllable)
+        if standard == "campbell":
+            """
+            甘爲霖白話字標調規則
+                介音 o：([a-z])o([ae])\d 或者 ([a-z])o([ae])(nn)\d，標 o；若無標 a、e
+                ainnh8：標 i
+            """
+            syllable = _CAMPBELL_TONE_ACCENT_OA.sub(r"\1\2\4\3\5\6", syllable, count=1)
+            syllable = _CAMPBELL_TONE_NUMBER_AINNH.sub(r"\1\3\2\4", syllable, count=1)
+        else:
+            syllable = _POJ_TONE_ACCENT_OA.sub(r"\1\3\2\4\5", syllable, count=1)
+        return syllable
+
+    def tailoUnicode2PojUnicode(
+        self, text: str, poj_standard: str = None, normalization: str = "NFC"
+    ) -> str:
+        """
+        臺羅 Unicode 轉白話字 Unicode
+
+        參數:
+            text (str): 輸入个臺羅 Unicode 文本
+            standard（str，可選）：白話字標準
+            normalization (str，可選): Unicode 正則化形式，默認做 "NFC"
+        返回：
+            str: 轉換後个白話字 Unicode 文本
+        """
+        return self._converter("tailoUnicode2PojUnicode", poj_standard, normalization)(
+            text
+        )
+
+    def _tailoUnicode2PojUnicodeStages(
+        self, poj_standard: str = None, normalization: str = "NFC"
+    ):
+        move = self._syllableCache("movePojToneAccent", poj_standard)
+        stages = [
+            (
+                "normalize",
+                lambda text: unicodedata.normalize("NFD", text).replace("\u030b", "\u0306"),
+            ),
+            ("moveAccentToEnd", partial(_ACCENT_TO_END.sub, r"\2\1\3")),  # 調符放後壁
+        ]
+        stages += self._tailoAscii2PojAsciiStages()
+        stages += [
+            (
+                "moveToneAccent",
+                partial(
+                    _ACCENTED_SYLLABLE.sub,
+                    lambda match: move(match.group(0)),
+                ),
+            ),
+            (
+                "pojSpecialLetterAscii2Unicode",
+                partial(self.pojSpecialLetterAscii2Unicode, standard=poj_standard),
+            ),
+            ("normalize", partial(unicodedata.normalize, normalization)),
+        ]
+        return stages
+
+    def tailoUnicode2PojUnicodeCascade(
+        self, text: str, poj_standard: str = None, normalization: str = "NFC"
+    ) -> str:
+        """
+        臺羅 Unicode 轉白話字 Unicode（級聯版，效率較下）
+
+        參數:
+            text (str): 輸入个臺羅 Unicode 文本
+            standard（str，可選）：白話字標準
+            normalization (str，可選): Unicode 正則化形式，默認做 "NFC"
+        返回：
+            str: 轉換後个白話字 Unicode 文本
+        """
+        text = self.tailoUnicode2Ascii(text)
+        text = self.tailoAscii2PojAscii(text)
+        return self.pojAscii2Unicode(text, poj_standard, normalization=normalization)
+
+    def moveIpaNasal(self, syllable: str) -> str:
+        """
+        國際音標鼻化標誌徙位
+        """
+        if "\u0303" in syllable and _VOWEL.search(syllable):
+            syllable = _IPA_NASAL_VOWEL.sub(r"\1\3\2", syllable, count=1)
+            return _IPA_NASAL_DIPHTHONG.sub(r"\1\3\2", syllable, count=1)
+        return syllable
+
+    def addIpaToneMarks(
+        self, segmental_syllable: str, tone: int, tone_marks: Union[str, List[str]]
+    ) -> str:
+        if not tone_marks:
+            tone_marks = "ipa_tone_cateɡory_symbols"
+        if type(tone_marks) == str:
+            assert tone_marks in [
+                "ipa_tone_cateɡory_symbols",
+                "ipa_tone_cateɡory_numbers",
+            ]
+            if tone_marks == "ipa_tone_cateɡory_symbols":
+                return (
+                    self.ipa_tone_cateɡory_symbols[tone] + segmental_syllable
+                    if tone in [1, 2, 5, 6]
+                    else segmental_syllable + self.ipa_tone_cateɡory_symbols[tone]
+                )
+            else:
+                return segmental_syllable + getattr(self, tone_marks)[tone]
+        else:
+            return segmental_syllable + tone_marks[tone]
+
+    def tailoAscii2Ipa(
+        self,
+        text: str,
+        tone_marks: Union[str, List[str], Dict[int, str]] = None,
+        segments: Dict[str, str] = None,
+    ) -> str:
+        """
+        臺羅 ASCII 轉寬式國際音標
+        聲調干焦處理做調類
+        無處理「第九調」
+        [TODO] 輕聲處理
+
+        調符佮自定義字母規則（`tone_marks`、`segments`）个組合，頭一擺用个時陣
+        共音節表逐个音節、聲調个國際音標攏算好，後擺直接查表。
+
+        參數：
+            text (str): 臺羅 ASCII 文本
+            tone_marks (Union[str, List[str], Dict[int, str]]，可選): 調符，
+                "ipa_tone_cateɡory_symbols"（默認）、"ipa_tone_cateɡory_numbers"，
+                抑是數字調 => 調符个列表、字典
+            segments (Dict[str, str]，可選): 自定義字母規則，臺羅字母 => 國際音標，
+                佇默認个字母規則進前換（鼻化、調符已經處理好），
+                譬論講無 ir、er 个腔口：{"ir": "i", "er": "e"}
+        返回：
+            str: 國際音標文本
+        """
+        return self._converter(
+            "tailoAscii2Ipa", _freeze(tone_marks), _freeze(segments), engine="table"
+        )(text)
+
+    def _tailoAscii2IpaStages(
+        self,
+        tone_marks: Union[str, Tuple[str, ...], Dict[int, str]] = None,
+        segments: Dict[str, str] = None,
+    ):
+        if isinstance(tone_marks, frozenset):
+            tone_marks = dict(tone_marks)
+        if isinstance(tone_marks, str):
+            assert tone_marks in [
+                "ipa_tone_cateɡory_symbols",
+                "ipa_tone_cateɡory_numbers",
+            ], f"無支持个調符：{tone_marks}"
+
+        def ipaLetters(text: str) -> str:
+            text = text.replace("ng", "ŋ").replace("g", "ɡ").replace("j", "dz")
+            text = _IPA_ASPIRATED.sub(r"\1ʰ", text)
+            text = _IPA_OPEN_O.sub(r"ɔ\1", text)
+            return (
+                text.replace("oo", "ɔ")
+                .replace("ir", "ɯ")
+                .replace("er", "ə")
+                .replace("ee", "ɛ")
+            )
+
+        stages = [
+            ("lower", lambda text: text.lower().replace("-", " ")),
+            (
+                "addDefaultToneNumber",
+                partial(_IPA_SEGMENTAL_SYLLABLE.sub, self._addDefaultToneNumberMatch),
+            ),  # 添陰平、陰入數字調
+            (
+                "addIpaToneMarks",
+                partial(
+                    _IPA_NUMBERED_SYLLABLE.sub,
+                    lambda x: self.addIpaToneMarks(
+                        x.group(1), int(x.group(2)), tone_marks
+                    ),
+                ),
+            ),
+            ("nasalize", partial(_IPA_NN.sub, "\\1\u0303")),
+            (
+                "moveIpaNasal",
+                partial(_IPA_NASAL_SYLLABLE.sub, lambda x: self.moveIpaNasal(x.group(0))),
+            ),
+        ]
+        if segments:
+            segments = dict(segments)
+            custom = re.compile(
+                "|".join(map(re.escape, sorted(segments, key=len, reverse=True)))
+            )
+            stages.append(
+                ("customSegments", partial(custom.sub, lambda x: segments[x.group(0)]))
+            )
+        stages.append(("ipaLetters", ipaLetters))
+        return stages
+
+    def ipa2TailoAscii(
+        self,
+        text: str,
+        tone_marks: Union[str, List[str], Dict[int, str]] = None,
+        segments: Dict[str, str] = None,
+    ) -> str:
+        """
+        寬式國際音標轉臺羅 ASCII（數字調）
+
+        照 `tailoAscii2Ipa` 共音節表逐个音節轉做國際音標，反過來建一个字典樹（trie），
+        對文本頭前開始逐位揣上長个音節，所以時間綴文本長度線性增加。
+        揣無音節个字原樣保留；`tailoAscii2Ipa` 共 "-" 換做空白，所以轉轉來是空白。
+
+        參數：
+            text (str): 國際音標文本
+            tone_marks、segments: 國際音標个規則，愛佮產生即个國際音標个時仝款，參考 `tailoAscii2Ipa`
+        返回：
+            str: 臺羅 ASCII 文本，逐个音節攏有數字調
+        """
+        return self._converter("ipa2TailoAscii", _freeze(tone_marks), _freeze(segments))(text)
+
+    def ipa2TailoUnicode(
+        self,
+        text: str,
+        tone_marks: Union[str, List[str], Dict[int, str]] = None,
+        segments: Dict[str, str] = None,
+        normalization: str = "NFC",
+    ) -> str:
+        """
+        寬式國際音標轉臺羅 Unicode，參考 `ipa2TailoAscii`、`tailoAscii2Unicode`
+        """
+        return self.converter(
+            "ipa", "tailo-uni", tone_marks=tone_marks, segments=segments, normalization=normalization
+        )(text)
+
+    def _ipa2TailoAsciiStages(
+        self,
+        tone_marks: Union[str, Tuple[str, ...], Dict[int, str]] = None,
+        segments: Dict[str, str] = None,
+    ):
+        trie = self._ipaTrie(tone_marks, segments)
+
+        def parseIpa(text: str) -> str:
+            pieces, i, length = [], 0, len(text)
+            while i < length:
+                node, j, syllable, end = trie, i, None, i + 1
+                while j < length:
+                    node = node.get(text[j])
+                    if node is None:
+                        break
+                    j += 1
+                    if "" in node:
+                        syllable, end = node[""], j
+                pieces.append(text[i:end] if syllable is None else syllable)
+                i = end
+            return "".join(pieces)
+
+        return [
+            ("normalize", partial(unicodedata.normalize, "NFD")),
+            ("parseIpa", parseIpa),
+        ]
+
+    def _ipaTrie(
+        self,
+        tone_marks: Union[str, Tuple[str, ...], Dict[int, str]] = None,
+        segments: Dict[str, str] = None,
+    ) -> Dict[str, object]:
+        """
+        國際音標 => 臺羅 ASCII 音節个字典樹，逐个節點是 {字: 下一个節點}，"" 是音節結束
+        """
+        forward = self._compiledConverter("tailoAscii2Ipa", tone_marks, segments)
+        syllables = [syllable for syllable in self.syllableInventory() if syllable[-1].isdigit()]
+        forms = _convertSyllables(forward, syllables)
+        if forms is None:  # 自定義調符無齊，逐个音節轉換
+            forms = []
+            for syllable in syllables:
+                try:
+                    forms.append(forward(syllable))
+                except (KeyError, IndexError):
+                    forms.append("")
+        trie = {}
+        for form, syllable in zip(forms, syllables):
+            form = unicodedata.normalize("NFD", form)
+            if not form:
+                continue
+            node = trie
+            for char in form:
+                node = node.setdefault(char, {})
+            node.setdefault("", syllable)
+        return trie
+
+
+class Syllable:
+    """
+    拆好結構个音節：聲母、介音、主要元音、韻尾、鼻化、聲調、大小寫
+
+    仝款个音節共用一个物件（interning），建立了後袂使改，會使直接用 `is`、`==` 比較，
+    嘛會使做字典鍵。
+
+    ``` python
+    >>> syllable = Syllable.parse("Tshiánn", "tailo-uni")
+    >>> syllable.initial, syllable.medial, syllable.nucleus, syllable.nasal, syllable.tone
+    ('tsh', 'i', 'a', True, 2)
+    >>> syllable.render("poj-uni")
+    'Chhiáⁿ'
+    ```
+
+    屬性：
+        initial (str): 聲母，無聲母是 ""
+        medial (str): 介音 "i"、"u" 抑是 ""
+        nucleus (str): 主要元音，包括成音節个 "m"、"ng"
+        coda (str): 韻尾，包括 "i"、"u" 佮喉塞 "h"，譬論講 "ng"、"ih"
+        nasal (bool): 敢有鼻化（nn）
+        tone (int): 聲調 1～9，0 是無寫數字調
+        case (int): 0 細寫，1 首字母大寫，2 全大寫
+    """
+
+    __slots__ = ("initial", "medial", "nucleus", "coda", "nasal", "tone", "case")
+
+    _interned = {}
+
+    def __new__(
+        cls, initial: str, medial: str, nucleus: str, coda: str, nasal: bool, tone: int, case: int = 0
+    ) -> "Syllable":
+        key = (initial, medial, nucleus, coda, nasal, tone, case)
+        syllable = cls._interned.get(key)
+        if syllable is None:
+            syllable = object.__new__(cls)
+            for name, value in zip(cls.__slots__, key):
+                object.__setattr__(syllable, name, value)
+            syllable = cls._interned.setdefault(key, syllable)
+        return syllable
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} 建立了後袂使改")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} 建立了後袂使改")
+
+    def __reduce__(self):
+        return (Syllable, tuple(getattr(self, name) for name in self.__slots__))
+
+    def __repr__(self) -> str:
+        return f"Syllable({self.tailoAscii()!r})"
+
+    @property
+    def final(self) -> str:
+        """
+        臺羅韻母（細寫）
+        """
+        coda, glottal = (self.coda[:-1], "h") if self.coda.endswith("h") else (self.coda, "")
+        return self.medial + self.nucleus + coda + ("nn" if self.nasal else "") + glottal
+
+    @property
+    def entering(self) -> bool:
+        """
+        敢是入聲（韻尾 p、t、k、h）
+        """
+        return self.coda[-1:] in ("p", "t", "k", "h")
+
+    def tailoAscii(self) -> str:
+        """
+        臺羅 ASCII 寫法，無寫數字調个音節就無數字
+        """
+        text = self.initial + self.final + (str(self.tone) if self.tone else "")
+        if self.case == 1:
+            return text.capitalize()
+        if self.case == 2:
+            return text.upper()
+        return text
+
+    @classmethod
+    def parse(cls, text: str, orthography: str = "tailo-asc", standard: str = None) -> Union["Syllable", None]:
+        """
+        拆一个音節
+
+        參數：
+            text (str): 一个音節
+            orthography (str，可選): 拼寫，"tailo-asc"、"tailo-uni"、"poj-asc"、"poj-uni"、"ipa"，默認 "tailo-asc"
+            standard (str，可選): 白話字標準
+        返回：
+            Union[Syllable, None]: 音節，毋是音節表內底个音節就返回 None
+        """
+        return _parseSyllable(text, orthography, standard)
+
+    def render(self, orthography: str = "tailo-asc", standard: str = None, **options) -> str:
+        """
+        音節佇某種拼寫个寫法
+
+        參數：
+            orthography (str，可選): 拼寫，默認 "tailo-asc"
+            standard (str，可選): 白話字標準
+            **options: 轉換方法个其他參數，參考 `ThoKit.converter`
+        返回：
+            str: 音節
+        """
+        if options:
+            return _sharedThoKit().converter("tailo-asc", orthography, standard, **options)(self.tailoAscii())
+        return _renderSyllable(self, orthography, standard)
+
+
+@lru_cache(maxsize=None)
+def _sharedThoKit() -> ThoKit:
+    """
+    `Syllable` 拆、寫音節共用个 ThoKit
+    """
+    return ThoKit()
+
+
+@lru_cache(maxsize=None)
+def _syllableConverter(src: str, dst: str, standard: str = None) -> Converter:
+    """
+    `Syllable` 拆、寫音節用个轉換器
+    """
+    return _sharedThoKit().converter(src, dst, standard)
+
+
+@lru_cache(maxsize=65536)
+def _parseSyllable(text: str, orthography: str, standard: str = None) -> Union[Syllable, None]:
+    """
+    `Syllable.parse` 个實作，結果記落來
+    """
+    if orthography != "tailo-asc":
+        text = _syllableConverter(orthography, "tailo-asc", standard)(text)
+    lower = text.lower()
+    match = _TAILO_SYLLABLE.fullmatch(lower)
+    if match is None:
+        return None
+    parts = _syllableParts().get(match[1])
+    if parts is None:
+        return None
+    case = 0 if text == lower else 1 if text == lower.capitalize() else 2 if text == text.upper() else None
+    if case is None:
+        return None
+    return Syllable(*parts, int(match[2] or 0), case)
+
+
+@lru_cache(maxsize=65536)
+def _renderSyllable(syllable: Syllable, orthography: str, standard: str = None) -> str:
+    """
+    `Syllable.render` 个實作，結果記落來
+    """
+    text = syllable.tailoAscii()
+    if orthography == "tailo-asc":
+        return text
+    return _syllableConverter("tailo-asc", orthography, standard)(text)
+
+
+@lru_cache(maxsize=None)
+def _syllableParts() -> Dict[str, Tuple[str, str, str, str, bool]]:
+    """
+    臺羅 ASCII 無聲調音節 => (聲母, 介音, 主要元音, 韻尾, 鼻化)
+    """
+    thokit = _sharedThoKit()
+    parts = {}
+    for final in thokit.tailo_finals:
+        match = _TAILO_FINAL.fullmatch(final)
+        medial, nucleus, coda, nasal, glottal = match.group("medial", "nucleus", "coda", "nasal", "glottal")
+        for initial in thokit.tailo_initials:
+            parts.setdefault(initial + final, (initial, medial or "", nucleus, coda + (glottal or ""), bool(nasal)))
+    return parts
@@ -0,0 +1,3 @@
+from thokit.cli import main
+
+main()
@@ -0,0 +1,157 @@
+"""
+命令行：`python -m thokit`
+
+一逝一逝轉換，大檔案佮 stdin 嘛會使，記憶體用量佮輸入大細無關。
+干焦 ASCII 个轉換方向直接轉換 bytes，其他方向用 `ThoKit.imapBatch`，會使分工作進程。
+"""
+
+import sys
+import inspect
+import argparse
+from collections import deque
+from typing import Dict, Iterator, List, Tuple
+
+from thokit import ThoKit, _ASCII_BYTES_REWRITES, _convertAsciiBytes
+
+
+def _convertAsciiStream(reader, writer, direction: str, chunk_size: int = 1 << 24) -> None:
+    """
+    大檔案一塊一塊轉換，逐塊佇換逝符切開，記憶體用量佮檔案大細無關
+    """
+    rest = b""
+    while True:
+        chunk = reader.read(chunk_size)
+        if not chunk:
+            break
+        end = chunk.rfind(b"\n") + 1
+        if not end:
+            rest += chunk
+            continue
+        writer.write(_convertAsciiBytes(direction, rest + chunk[:end]))
+        rest = chunk[end:]
+    writer.write(_convertAsciiBytes(direction, rest))
+
+
+_COMMANDS = {
+    "tailo-u2a": "tailoUnicode2Ascii",
+    "tailo-a2u": "tailoAscii2Unicode",
+    "poj-u2a": "pojUnicode2Ascii",
+    "poj-a2u": "pojAscii2Unicode",
+    "poj2tailo-a": "pojAscii2TailoAscii",
+    "tailo2poj-a": "tailoAscii2PojAscii",
+    "poj2tailo-u": "pojUnicode2TailoUnicode",
+    "tailo2poj-u": "tailoUnicode2PojUnicode",
+    "tailo-a2ipa": "tailoAscii2Ipa",
+    "ipa2tailo-a": "ipa2TailoAscii",
+}
+"""
+命令行个命令名對應个轉換方法
+"""
+
+
+def _addOptions(parser: argparse.ArgumentParser, method: str) -> None:
+    """
+    照轉換方法个參數加命令行選項
+    """
+    builder = getattr(ThoKit, f"_{method}Stages")
+    for name, parameter in inspect.signature(builder).parameters.items():
+        if name == "self":
+            continue
+        flag = "--" + name.replace("_", "-")
+        if isinstance(parameter.default, bool):
+            parser.add_argument(
+                flag, action=argparse.BooleanOptionalAction, default=parameter.default
+            )
+        elif parameter.annotation == Tuple[str, ...]:
+            parser.add_argument(flag, nargs="*", default=parameter.default)
+        elif parameter.annotation == Dict[str, str]:  # --segments ir=i er=e
+            parser.add_argument(
+                flag, nargs="*", type=lambda item: tuple(item.split("=", 1)), default=parameter.default
+            )
+        else:
+            parser.add_argument(flag, default=parameter.default)
+
+
+def _splitLineEnding(line: str) -> Tuple[str, str]:
+    """
+    共一逝文本分做內容佮換逝符
+    """
+    content = line.rstrip("\r\n")
+    return content, line[len(content) :]
+
+
+def main(argv: List[str] = None) -> None:
+    """
+    命令行入口，一逝一逝轉換，記憶體用量佮輸入大細無關
+
+    python -m thokit tailo-a2u < in.txt > out.txt
+    python -m thokit poj-a2u --standard campbell -w 4 in.txt -o out.txt
+    """
+    parser = argparse.ArgumentParser(prog="thokit", description="閩南方言拼寫方案轉換")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    commands = {}
+    for command, method in _COMMANDS.items():
+        subparser = commands[command] = subparsers.add_parser(command, help=method)
+        subparser.add_argument("input", nargs="?", default="-", help="輸入檔案，默認 stdin")
+        subparser.add_argument("-o", "--output", default="-", help="輸出檔案，默認 stdout")
+        if method not in _ASCII_BYTES_REWRITES:  # 干焦 ASCII 个轉換直接轉換 bytes，無分進程、無分引擎
+            subparser.add_argument("-w", "--workers", type=int, default=1, help="工作進程數")
+            subparser.add_argument("--chunksize", type=int, default=1024, help="逐塊个逝數")
+            subparser.add_argument("--engine", choices=["regex", "table", "token"], default="regex")
+        _addOptions(subparser, method)
+    arguments = vars(parser.parse_args(argv))
+    command = arguments.pop("command")
+    subparser, method = commands[command], _COMMANDS[command]
+    input_path, output_path = arguments.pop("input"), arguments.pop("output")
+    workers, chunksize = arguments.pop("workers", 1), arguments.pop("chunksize", 1024)
+    engine = arguments.pop("engine", "regex")
+    if workers < 1 or chunksize < 1:
+        subparser.error("--workers、--chunksize 愛是正整數")
+    if arguments.get("accent_marks") and len(arguments["accent_marks"]) != 10:
+        subparser.error("--accent-marks 愛有 10 个調符（第 0 到第 9 調，無調符个用 ''）")
+    kit = ThoKit()
+    try:
+        kit.compile(method, engine, **arguments)  # 先檢查選項，免得轉換到一半才出錯
+    except (AssertionError, TypeError, ValueError) as error:
+        given = " ".join(f"--{name.replace('_', '-')}={value}" for name, value in arguments.items() if value)
+        subparser.error(f"選項毋着：{str(error) or given}")
+
+    source = sys.stdin.fileno() if input_path == "-" else input_path
+    target = sys.stdout.fileno() if output_path == "-" else output_path
+    try:
+        if method in _ASCII_BYTES_REWRITES:
+            # 干焦 ASCII 个轉換直接轉換 bytes，毋免解碼、切逝，一个進程就比多進程較緊
+            with open(source, "rb", closefd=input_path != "-") as reader, open(
+                target, "wb", closefd=output_path != "-"
+            ) as writer:
+                _convertAsciiStream(reader, writer, method)
+            return
+
+        # 大塊讀寫；stdin/stdout 用檔案描述符重新開，袂關着原本个
+        stream = dict(encoding="utf-8", newline="", buffering=1 << 20)
+        with open(source, closefd=input_path != "-", **stream) as reader, open(
+            target, "w", closefd=output_path != "-", **stream
+        ) as writer:
+            endings = deque()
+
+            def contents() -> Iterator[str]:
+                for line in reader:
+                    content, ending = _splitLineEnding(line)
+                    endings.append(ending)
+                    yield content
+
+            converted = kit.imapBatch(
+                contents(), method, workers, chunksize, engine, **arguments
+            )
+            for line in converted:
+                writer.write(line + endings.popleft())
+    except UnicodeDecodeError as error:
+        subparser.error(f"輸入毋是 UTF-8：{error}")
+    except OSError as error:
+        subparser.error(str(error))
+    except (AssertionError, IndexError, KeyError) as error:
+        subparser.error(f"轉換失敗：{error!r}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+pandas、PyArrow 欄位个批量轉換（愛先裝 pandas 抑是 PyArrow）
+
+語料个羅馬字欄位定定有真濟重複个值（仝款个詞目、音節出現佇幾若百萬逝），
+用 `Series.map` 一逝一逝轉換，重複个值逐擺攏愛閣轉換。即个模組先共欄位分解做
+「無重複个值 + 索引」（factorize），無重複个值逐个干焦轉換一擺（會使用多進程），
+才照索引共結果撒倒轉去，返回佮輸入仝款个類型：
+
+``` python
+from thokit import columns
+
+df["poj"] = columns.convert(df["tailo"], "tailoAscii2PojAscii")
+table = table.set_column(0, "poj", columns.convert(table["tailo"], "tailoAscii2PojAscii"))
+```
+
+- `pandas.Series`：索引、名、dtype 攏保留；category 欄位干焦轉換 categories
+- `pyarrow.Array`、`pyarrow.ChunkedArray`：類型保留，分塊照原本；dictionary 欄位干焦轉換 dictionary
+
+欄位內底个值干焦用陣列運算撒倒轉去，袂逐逝變做 Python 字串；干焦無重複个值愛提出來轉換。
+空值（NA、null）佮毋是字串个值（譬論講 object 欄位內底个數字）原樣保留。
+"""
+
+from typing import List
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = pc = None
+
+if pd is None and pa is None:
+    raise ImportError("thokit.columns 愛先裝 pandas 抑是 PyArrow：pip install pandas pyarrow")
+
+from thokit import _sharedThoKit
+
+
+def convert(values, method: str, workers: int = 1, engine: str = "regex", **options):
+    """
+    轉換規个欄位，仝款个值干焦轉換一擺
+
+    參數：
+        values (Union[pd.Series, pa.Array, pa.ChunkedArray]): 欄位，值是字串
+        method (str): 轉換方法名，譬論講 "tailoAscii2Unicode"
+        workers (int，可選): 工作進程數，默認 1（佇本進程轉換）；None 是 CPU 核數，參考 `ThoKit.convertBatch`
+        engine (str，可選): 轉換引擎，參考 `ThoKit.compile`，默認 "regex"
+        **options: 佮該方法仝款个參數（無包括 text）
+    返回：
+        Union[pd.Series, pa.Array, pa.ChunkedArray]: 轉換了个欄位，類型佮輸入仝款
+    """
+
+    def convertUniques(uniques: List[str]) -> List[str]:
+        positions = [i for i, value in enumerate(uniques) if isinstance(value, str)]
+        if len(positions) == len(uniques):
+            return _sharedThoKit().convertBatch(uniques, method, workers, engine=engine, **options)
+        # 毋是字串个值原樣保留
+        converted = list(uniques)
+        texts = _sharedThoKit().convertBatch([uniques[i] for i in positions], method, workers, engine=engine, **options)
+        for i, text in zip(positions, texts):
+            converted[i] = text
+        return converted
+
+    if pd is not None and isinstance(values, pd.Series):
+        return _convertSeries(values, convertUniques)
+    assert pa is not None and isinstance(values, (pa.Array, pa.ChunkedArray)), f"無支持个欄位類型：{type(values).__name__}"
+    return _convertArrow(values, convertUniques)
+
+
+def _convertSeries(series: "pd.Series", convertUniques) -> "pd.Series":
+    """
+    pandas 欄位：`pd.factorize` 分解，結果用 numpy 个 take 撒倒轉去
+    """
+    import numpy as np
+
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # 轉換了仝款个 categories 愛鬥做伙
+        codes, categories = pd.factorize(pd.Index(convertUniques(series.cat.categories.tolist())))
+        codes = np.append(codes, -1)[series.cat.codes.to_numpy()]
+        categorical = pd.Categorical.from_codes(codes, categories, ordered=series.cat.ordered)
+        return pd.Series(categorical, index=series.index, name=series.name)
+    codes, uniques = pd.factorize(series)
+    converted = np.empty(len(uniques) + 1, dtype=object)
+    converted[:-1] = convertUniques(uniques.tolist())
+    # 空值个 code 是 -1，對着上尾个 None，了後用原本个空值
+    return series.where(codes == -1, converted[codes])
+
+
+def _convertArrow(array, convertUniques):
+    """
+    PyArrow 欄位：`unique` 佮 `index_in` 分解，結果用 `take` 撒倒轉去；ChunkedArray 逐塊撒，分塊照原本
+    """
+    if pa.types.is_dictionary(array.type):
+        if isinstance(array, pa.ChunkedArray):
+            chunks = [_convertArrow(chunk, convertUniques) for chunk in array.chunks]
+            return pa.chunked_array(chunks, type=array.type)
+        # dictionary 轉換了有重複嘛無要緊
+        dictionary = pa.array(convertUniques(array.dictionary.to_pylist()), type=array.dictionary.type)
+        return pa.DictionaryArray.from_arrays(array.indices, dictionary)
+    uniques = pc.drop_null(pc.unique(array))
+    converted = pa.array(convertUniques(uniques.to_pylist()), type=array.type)
+    if isinstance(array, pa.ChunkedArray):
+        chunks = [pc.take(converted, pc.index_in(chunk, value_set=uniques)) for chunk in array.chunks]
+        return pa.chunked_array(chunks, type=array.type)
+    return pc.take(converted, pc.index_in(array, value_set=uniques))
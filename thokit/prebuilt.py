@@ -0,0 +1,221 @@
+"""
+預先建好个音節表：`python -m thokit.prebuilt` 建 `thokit/prebuilt.bin`
+
+查表引擎（`engine="table"`）頭一擺用个時愛先轉換規个音節表，短命个工作進程逐擺啟動攏愛閣算。
+即个檔案共逐个轉換方向、逐个白話字標準个音節表佮音節表个各種拼寫存起來，
+頭一擺用着个時才讀，干焦讀需要个彼幾个表。
+
+檔案格式：`_MAGIC`、標頭長度（4 byte）、marshal 个標頭，後壁是逐个表
+（字串用 NUL 連做伙、UTF-8、zlib 壓縮）。標頭記轉換規則（`thokit/__init__.py`）个雜湊，
+規則若有改，檔案就袂用，照原本按怎轉換規則重建音節表。
+
+檔案佇 git 內底，佮套件做伙發佈；改着 `thokit/__init__.py` 就過時，愛行 `python -m thokit.prebuilt` 重建做伙 commit。
+`python -m thokit.prebuilt --check` 檢查敢會使用，`test/py/test_prebuilt.py` 嘛會檢查，過時就失敗。
+"""
+
+import os
+import zlib
+import struct
+import marshal
+import inspect
+import argparse
+from typing import Dict, List, Tuple, Union
+
+import thokit
+
+PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "prebuilt.bin")
+"""
+默認个檔案位置，佮套件做伙發佈
+"""
+
+_MAGIC = b"THOKIT-TABLES\x00"
+_FORMAT = 2
+
+
+def rulesHash() -> str:
+    """
+    轉換規則个雜湊：`thokit/__init__.py` 个 CRC-32 佮長度（免 import hashlib，啟動較緊）
+    """
+    with open(thokit.__file__, "rb") as f:
+        source = f.read()
+    return "%08x-%d" % (zlib.crc32(source), len(source))
+
+
+def inventoryKey(kit: "thokit.ThoKit") -> str:
+    """
+    音節表个組成（聲母、韻母、入聲韻尾）佮轉換用着个調符、調類表，ThoKit 實例个表若有改就對袂着
+    """
+    return repr(
+        (
+            kit.tailo_initials,
+            kit.tailo_finals,
+            kit.entering_endings,
+            kit.tailo_accent_marks,
+            kit.poj_accent_marks,
+            kit.ipa_tone_cateɡory_symbols,
+            kit.ipa_tone_cateɡory_numbers,
+        )
+    )
+
+
+class PrebuiltTables:
+    """
+    讀好標頭个音節表檔案，逐个表用着个時才讀
+
+    參數：
+        path (str): 檔案位置
+        inventory (str): 建檔个時个 `inventoryKey`
+        entries (Dict[str, Tuple[int, int]]): 表名 => (位置, 長度)
+    """
+
+    def __init__(self, path: str, inventory: str, entries: Dict[str, Tuple[int, int]]) -> None:
+        self.path = path
+        self.inventory = inventory
+        self.entries = entries
+
+    def get(self, key: str, length: int = None) -> Union[List[str], None]:
+        """
+        讀一个表，無抑是長度毋是 length 就返回 None
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        offset, size = entry
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            data = f.read(size)
+        values = zlib.decompress(data).decode("utf-8").split("\0")
+        if length is not None and len(values) != length:
+            return None
+        return values
+
+    def forms(self, orthography: str, standard: str = None) -> Union[List[str], None]:
+        """
+        音節表佇某種拼寫个形式，參考 `ThoKit._inventoryForms`
+        """
+        return self.get(formsKey(orthography, standard))
+
+    def table(self, hops: List["thokit.Converter"], length: int) -> Union[List[str], None]:
+        """
+        轉換器个音節表，順序佮音節表个形式仝款（無包括愛看隔壁音節个形式，參考 `ThoKit._tableConverter`）
+        """
+        return self.get(tableKey(hops), length)
+
+
+def load(path: str = PATH) -> Union[PrebuiltTables, None]:
+    """
+    讀音節表檔案个標頭；檔案無、格式抑是轉換規則對袂着就返回 None
+
+    參數：
+        path (str，可選): 檔案位置，默認 `PATH`
+    返回：
+        Union[PrebuiltTables, None]: 音節表檔案
+    """
+    try:
+        with open(path, "rb") as f:
+            if f.read(len(_MAGIC)) != _MAGIC:
+                return None
+            (size,) = struct.unpack("<I", f.read(4))
+            header = marshal.loads(f.read(size))
+    except (OSError, EOFError, ValueError, struct.error):
+        return None
+    if header.get("format") != _FORMAT or header.get("rules") != rulesHash():
+        return None
+    start = len(_MAGIC) + 4 + size
+    entries = {key: (start + offset, length) for key, (offset, length) in header["entries"].items()}
+    return PrebuiltTables(path, header["inventory"], entries)
+
+
+def formsKey(orthography: str, standard: str = None) -> str:
+    """
+    音節表某種拼寫个表名
+    """
+    return f"forms:{orthography}:{standard}"
+
+
+def tableKey(hops: List["thokit.Converter"]) -> str:
+    """
+    轉換器音節表个表名：逐段个轉換方向佮參數
+    """
+    return "table:" + repr(tuple((hop.direction, tuple(hop.options.items())) for hop in hops))
+
+
+def build(path: str = PATH) -> int:
+    """
+    建音節表檔案：逐个轉換方向、逐个白話字標準（其他參數用默認值）
+
+    參數：
+        path (str，可選): 檔案位置，默認 `PATH`
+    返回：
+        int: 檔案大小（byte）
+    """
+    kit = thokit.ThoKit(prebuilt=False)
+    blobs: Dict[str, bytes] = {}
+
+    def add(key: str, values: List[str]) -> None:
+        if key not in blobs:
+            blobs[key] = zlib.compress("\0".join(values).encode("utf-8"), 9)
+
+    for direction in thokit._SOURCE_ORTHOGRAPHIES:
+        parameters = inspect.signature(getattr(kit, f"_{direction}Stages")).parameters
+        name = next((name for name in ["standard", "poj_standard"] if name in parameters), None)
+        for standard in [None, *(kit.poj_standards if name else ())]:
+            converter = kit.compile(direction, engine="table", **({name: standard} if standard else {}))
+            orthography = thokit._SOURCE_ORTHOGRAPHIES[direction]
+            forms_standard = standard if orthography == "poj-uni" else None
+            forms = kit._inventoryForms(orthography, forms_standard)
+            table = converter.table
+            if not table:
+                continue
+            add(formsKey(orthography, forms_standard), forms)
+            add(tableKey([converter]), list(table.values()))
+
+    # 內容仝款个表（譬論講無受白話字標準影響个方向）干焦存一擺
+    entries, offsets, offset = {}, {}, 0
+    for key, blob in blobs.items():
+        if blob not in offsets:
+            offsets[blob] = offset
+            offset += len(blob)
+        entries[key] = (offsets[blob], len(blob))
+    header = marshal.dumps(
+        {"format": _FORMAT, "rules": rulesHash(), "inventory": inventoryKey(kit), "entries": entries}
+    )
+    with open(path, "wb") as f:
+        f.write(_MAGIC + struct.pack("<I", len(header)) + header)
+        for blob in offsets:
+            f.write(blob)
+    return os.path.getsize(path)
+
+
+def check(path: str = PATH) -> bool:
+    """
+    檢查音節表檔案敢會使用：檔案有、轉換規則佮默認 ThoKit 个表攏對會着
+
+    參數：
+        path (str，可選): 檔案位置，默認 `PATH`
+    返回：
+        bool: 會使用就返回 True
+    """
+    tables = load(path)
+    return tables is not None and tables.inventory == inventoryKey(thokit.ThoKit(prebuilt=False))
+
+
+def main(argv: List[str] = None) -> None:
+    """
+    命令行入口：`python -m thokit.prebuilt`
+    """
+    parser = argparse.ArgumentParser(prog="python -m thokit.prebuilt", description="建預先算好个音節表檔案")
+    parser.add_argument("-o", "--output", default=PATH, help=f"檔案位置，默認 {PATH}")
+    parser.add_argument("--check", action="store_true", help="干焦檢查檔案敢會使用，袂使用就 exit 1")
+    args = parser.parse_args(argv)
+    if args.check:
+        if not check(args.output):
+            parser.exit(1, f"{args.output}: 無抑是過時，愛重建\n")
+        print(f"{args.output}: OK")
+        return
+    size = build(args.output)
+    print(f"{args.output}: {size} bytes")
+
+
+if __name__ == "__main__":
+    main()
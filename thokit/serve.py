@@ -0,0 +1,390 @@
+"""
+轉換服務：`python -m thokit.serve`
+
+干焦用標準庫个 asyncio HTTP 服務，`POST /convert` 接 JSON：
+
+``` json
+{"method": "pojAscii2Unicode", "options": {"standard": "campbell"}, "text": "Tsui2"}
+{"src": "poj-uni", "dst": "ipa", "options": {"standard": "campbell"}, "texts": ["Tâi-oân", "ōe"]}
+```
+
+`text` 返回 `{"text": ...}`，`texts` 返回 `{"texts": [...]}`；`engine` 默認 "token"。
+
+仝時間來个請求會鬥做一批（micro-batch），參數仝款个文本規批送去工作進程轉換，
+事件迴圈（event loop）袂予轉換塞牢。工作進程一直用仝一个 `ThoKit`，
+編譯好个轉換器、音節快取逐个請求攏會用着。工作進程攏無閒个時，新个請求先排隊，
+等有閒个時鬥做較大批，毋是逐个請求加一擺排隊。
+
+參數（options）是用者傳來个，工作進程干焦記上近用過个幾个轉換器（LRU，`--converters`），
+逐个轉換器有家己个 `ThoKit`，趕出去个時編譯好个表、音節快取做伙放掉。
+一批內底有請求轉換失敗个時，彼組逐个請求重新家己轉換，袂連累仝批个其他請求。
+"""
+
+import os
+import json
+import asyncio
+import inspect
+import argparse
+from functools import lru_cache, partial
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Tuple
+
+from thokit import (
+    Converter,
+    ThoKit,
+    _ORTHOGRAPHY_GRAPH,
+    _POJ_UNICODE_DIRECT_DIRECTIONS,
+    _SOURCE_ORTHOGRAPHIES,
+    _sharedThoKit,
+)
+
+_MAX_BODY = 16 * 1024 * 1024
+
+_STATUS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+_worker_compile = None
+"""
+工作進程个轉換器 LRU，由 `_initWorker` 建立
+"""
+
+
+def _initWorker(cache_size: int, converters: int = 64) -> None:
+    """
+    工作進程个初始化：建立上濟記 converters 个轉換器个 LRU
+    """
+    global _worker_compile
+    _worker_compile = lru_cache(maxsize=converters)(partial(_compile, cache_size))
+
+
+def _compile(cache_size: int, key: Tuple[str, str, str, str, str]) -> Converter:
+    """
+    編譯轉換器：key 是 (method, src, dst, engine, options JSON)
+
+    逐个轉換器用家己个 ThoKit，LRU 趕出去个時規个 ThoKit 會使放掉。
+    """
+    method, src, dst, engine, options = key
+    options = json.loads(options)
+    if isinstance(options.get("tone_marks"), dict):  # JSON 物件个鍵是字串
+        options["tone_marks"] = {int(tone): mark for tone, mark in options["tone_marks"].items()}
+    kit = ThoKit(cache_size)
+    if method:
+        return kit.compile(method, engine, **options)
+    return kit.converter(src, dst, engine=engine, **options)
+
+
+def _convertTexts(key: Tuple[str, str, str, str, str], texts: List[str]) -> List[str]:
+    """
+    工作進程个轉換：key 是 (method, src, dst, engine, options JSON)
+    """
+    return list(map(_worker_compile(key), texts))
+
+
+class MicroBatcher:
+    """
+    共仝時間來个轉換請求鬥做一批，送去工作池轉換
+
+    參數：
+        executor (Executor): 工作池，逐个工作愛先用 `_initWorker` 初始化
+        workers (int): 仝時間上濟送出去幾批
+        max_batch (int，可選): 一批上濟幾逝文本，默認 256
+        max_delay (float，可選): 頭一个請求上濟等幾秒鬥批，默認 0.002
+    """
+
+    def __init__(self, executor: Executor, workers: int, max_batch: int = 256, max_delay: float = 0.002) -> None:
+        self.executor = executor
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(workers)
+        self._task = None
+
+    def start(self) -> None:
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    async def convert(self, key: Tuple[str, str, str, str, str], texts: List[str]) -> List[str]:
+        """
+        轉換文本，等規批轉換好才返回
+
+        參數：
+            key (Tuple): 轉換器个鍵 (method, src, dst, engine, options JSON)
+            texts (List[str]): 文本
+        返回：
+            List[str]: 轉換了个文本
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((key, texts, future))
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            # 先等有閒个工作，才開始鬥批：工作攏無閒个時，請求佇隊列內底累積，鬥做較大批
+            await self._slots.acquire()
+            jobs = [await self._queue.get()]
+            size = len(jobs[0][1])
+            deadline = loop.time() + self.max_delay
+            while size < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0 and self._queue.empty():
+                    break
+                try:
+                    job = self._queue.get_nowait() if timeout <= 0 else await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                jobs.append(job)
+                size += len(job[1])
+            loop.create_task(self._dispatch(jobs))
+
+    async def _dispatch(self, jobs: List[Tuple[Tuple, List[str], asyncio.Future]]) -> None:
+        loop = asyncio.get_running_loop()
+        groups: Dict[Tuple, List[Tuple[List[str], asyncio.Future]]] = {}
+        for key, texts, future in jobs:
+            groups.setdefault(key, []).append((texts, future))
+        try:
+            calls = [
+                loop.run_in_executor(self.executor, _convertTexts, key, [text for texts, _ in group for text in texts])
+                for key, group in groups.items()
+            ]
+            retries = []
+            for (key, group), result in zip(groups.items(), await asyncio.gather(*calls, return_exceptions=True)):
+                if isinstance(result, BaseException) and len(group) > 1:
+                    # 毋知影是佗一个請求害个，逐个請求家己閣轉換一擺
+                    retries += [(key, [(texts, future)]) for texts, future in group]
+                    continue
+                self._resolve(group, result)
+            calls = [loop.run_in_executor(self.executor, _convertTexts, key, group[0][0]) for key, group in retries]
+            for (_, group), result in zip(retries, await asyncio.gather(*calls, return_exceptions=True)):
+                self._resolve(group, result)
+        finally:
+            self._slots.release()
+
+    @staticmethod
+    def _resolve(group: List[Tuple[List[str], asyncio.Future]], result) -> None:
+        """
+        共一組轉換个結果（抑是例外）分予逐个請求
+        """
+        start = 0
+        for texts, future in group:
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result[start : start + len(texts)])
+            start += len(texts)
+
+
+def _isStrings(value, length: int = None) -> bool:
+    """
+    value 敢是字串陣列（length 毋是 None 就愛是即个長度）
+    """
+    return isinstance(value, list) and all(isinstance(item, str) for item in value) and length in (None, len(value))
+
+
+def _checkOptions(directions: List[str], options: dict, standard: bool = False) -> None:
+    """
+    照逐段轉換方法个參數檢查 options 个名、型態佮長度，毋着就 raise ValueError
+
+    工作進程內底才出錯个時（譬論講 tone_marks 傷短，轉換到一半 IndexError），用者干焦看着 500，
+    所以請求个參數佇服務進程先檢查，返回 400。
+
+    參數：
+        directions (List[str]): 逐段个轉換方向
+        options (dict): 請求个參數
+        standard (bool，可選): 敢會使有 "standard"（`ThoKit.converter` 个參數，無路線用着嘛會使）
+    """
+    kit = _sharedThoKit()
+    parameters = {}
+    for direction in directions:
+        parameters.update(inspect.signature(getattr(kit, f"_{direction}Stages")).parameters)
+    for name, value in options.items():
+        if name == "standard" and standard:
+            valid = value is None or value in kit.poj_standards
+        elif name not in parameters:
+            raise ValueError(f"{'、'.join(directions)} 無即个參數：{name}")
+        elif isinstance(parameters[name].default, bool):
+            valid = isinstance(value, bool)
+        elif name in ["standard", "poj_standard"]:
+            valid = value is None or value in kit.poj_standards
+        elif name == "normalization":
+            valid = value in kit.normalization_forms
+        elif name == "accent_marks":
+            valid = _isStrings(value) and len(value) in (0, len(kit.tailo_accent_marks))
+        elif name == "tone_marks":
+            tones = len(kit.ipa_tone_cateɡory_symbols)
+            valid = (
+                value in [None, "ipa_tone_cateɡory_symbols", "ipa_tone_cateɡory_numbers"]
+                or _isStrings(value, tones)
+                or isinstance(value, dict)
+                and all(tone.isdigit() and int(tone) < tones and isinstance(mark, str) for tone, mark in value.items())
+            )
+        elif name == "segments":
+            valid = value is None or isinstance(value, dict) and all(isinstance(item, str) for item in value.values())
+        else:
+            valid = True
+        if not valid:
+            raise ValueError(f"參數 {name} 毋着：{json.dumps(value, ensure_ascii=False)}")
+
+
+def _parseRequest(body: bytes) -> Tuple[Tuple[str, str, str, str, str], List[str], bool]:
+    """
+    解析 JSON 請求，返回 (轉換器个鍵, 文本, 敢是批量)；請求毋着就 raise ValueError
+    """
+    request = json.loads(body)
+    if not isinstance(request, dict):
+        raise ValueError("請求愛是 JSON 物件")
+    method, src, dst = request.get("method"), request.get("src"), request.get("dst")
+    if bool(method) == bool(src and dst):
+        raise ValueError("愛有 method，抑是 src 佮 dst")
+    engine = request.get("engine", "token")
+    if engine not in ["regex", "table", "token"]:
+        raise ValueError(f"無支持个轉換引擎：{engine}")
+    options = request.get("options", {})
+    if not isinstance(options, dict):
+        raise ValueError("options 愛是 JSON 物件")
+    if method:
+        if method not in _SOURCE_ORTHOGRAPHIES:
+            raise ValueError(f"無支持个轉換方法：{method}")
+        _checkOptions([method], options)
+    else:
+        for orthography in (src, dst):
+            if orthography not in _ORTHOGRAPHY_GRAPH:
+                raise ValueError(f"無支持个拼寫：{orthography}")
+        if src == dst:
+            raise ValueError(f"輸入、輸出拼寫仝款：{src}")
+        _checkOptions(_sharedThoKit()._orthographyPath(src, dst, _POJ_UNICODE_DIRECT_DIRECTIONS), options, True)
+    batched = "texts" in request
+    texts = request["texts"] if batched else [request.get("text")]
+    if not _isStrings(texts):
+        raise ValueError("text 愛是字串，texts 愛是字串陣列")
+    key = (method or "", src or "", dst or "", engine, json.dumps(options, sort_keys=True, ensure_ascii=False))
+    return key, texts, batched
+
+
+async def _respond(writer: asyncio.StreamWriter, status: int, payload: dict, keep_alive: bool) -> None:
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    head = (
+        f"HTTP/1.1 {status} {_STATUS[status]}\r\n"
+        "Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    writer.write(head.encode("latin-1") + body)
+    await writer.drain()
+
+
+async def _handle(batcher: MicroBatcher, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """
+    一个連線：HTTP/1.1，支持 keep-alive
+    """
+    try:
+        while True:
+            line = await reader.readline()
+            if not line.strip():
+                break
+            verb, path, version = line.decode("latin-1").split(" ", 2)
+            headers = {}
+            while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+            connection = headers.get("connection", "").lower()
+            keep_alive = connection != "close" and (version.strip() != "HTTP/1.0" or connection == "keep-alive")
+            length = int(headers.get("content-length", 0))
+            if length > _MAX_BODY:
+                await _respond(writer, 413, {"error": "請求傷大"}, False)
+                break
+            body = await reader.readexactly(length)
+            if path.split("?", 1)[0] != "/convert":
+                await _respond(writer, 404, {"error": f"無即个路徑：{path}"}, keep_alive)
+            elif verb != "POST":
+                await _respond(writer, 405, {"error": "干焦支持 POST"}, keep_alive)
+            else:
+                try:
+                    key, texts, batched = _parseRequest(body)
+                    converted = await batcher.convert(key, texts)
+                except (AssertionError, KeyError, TypeError, ValueError) as error:
+                    # 無寫訊息个 assert 个 str 是空个，用 repr 至少有例外个類型
+                    await _respond(writer, 400, {"error": str(error) or repr(error)}, keep_alive)
+                except Exception as error:
+                    await _respond(writer, 500, {"error": str(error) or repr(error)}, keep_alive)
+                else:
+                    payload = {"texts": converted} if batched else {"text": converted[0]}
+                    await _respond(writer, 200, payload, keep_alive)
+            if not keep_alive:
+                break
+    except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    workers: int = None,
+    max_batch: int = 256,
+    max_delay: float = 0.002,
+    cache_size: int = 4096,
+    converters: int = 64,
+) -> None:
+    """
+    啟動轉換服務，一直行到取消
+
+    參數：
+        host (str，可選): 監聽个地址，默認 "127.0.0.1"
+        port (int，可選): 監聽个埠，默認 8000
+        workers (int，可選): 工作進程數，默認 CPU 數；1 就佇服務進程个一个執行緒轉換
+        max_batch (int，可選): 一批上濟幾逝文本，默認 256
+        max_delay (float，可選): 鬥批上濟等幾秒，默認 0.002
+        cache_size (int，可選): 工作進程 ThoKit 个音節快取大小，默認 4096
+        converters (int，可選): 工作進程上濟記幾个編譯好个轉換器（LRU），默認 64
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        executor = ThreadPoolExecutor(1, initializer=_initWorker, initargs=(cache_size, converters))
+    else:
+        executor = ProcessPoolExecutor(workers, initializer=_initWorker, initargs=(cache_size, converters))
+    batcher = MicroBatcher(executor, workers, max_batch, max_delay)
+    batcher.start()
+    server = await asyncio.start_server(lambda reader, writer: _handle(batcher, reader, writer), host, port)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await batcher.stop()
+        executor.shutdown(cancel_futures=True)
+
+
+def main(argv: List[str] = None) -> None:
+    """
+    命令行入口：`python -m thokit.serve --port 8000 --workers 4`
+    """
+    parser = argparse.ArgumentParser(prog="python -m thokit.serve", description="THOKIT 轉換服務")
+    parser.add_argument("--host", default="127.0.0.1", help="監聽个地址，默認 127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000, help="監聽个埠，默認 8000")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="工作進程數，默認 CPU 數")
+    parser.add_argument("--max-batch", type=int, default=256, help="一批上濟幾逝文本，默認 256")
+    parser.add_argument("--max-delay", type=float, default=0.002, help="鬥批上濟等幾秒，默認 0.002")
+    parser.add_argument("--cache-size", type=int, default=4096, help="音節快取大小，默認 4096")
+    parser.add_argument("--converters", type=int, default=64, help="工作進程上濟記幾个轉換器，默認 64")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.max_batch, args.max_delay, args.cache_size, args.converters))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
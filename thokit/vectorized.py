@@ -0,0 +1,276 @@
+"""
+音節 ID 陣列个向量化轉換（愛先裝 NumPy）
+
+文本先編碼做整數陣列，一个音節一个 ID，ID 包括聲母、韻母、聲調、大小寫，
+佮拼寫無關；了後換聲調、換拼寫攏是陣列運算佮查表，毋免逐个音節閣行正則表達式。
+
+``` python
+from thokit import vectorized
+
+ids, offsets, pieces = vectorized.encode(lines, source="poj-uni")
+ids = vectorized.stripTones(ids)
+lines = vectorized.decode(ids, offsets, pieces, target="poj-uni", standard="campbell")
+```
+
+音節 ID = ((聲母 × 韻母數 + 韻母) × 10 + 聲調) × 3 + 大小寫：
+    - 聲母、韻母是 `ThoKit.tailo_initials`、`ThoKit.tailo_finals` 个索引
+    - 聲調 1～9；0 是無寫數字調，干焦 ASCII 拼寫會編出來；Unicode 無調符个陰平、陰入編做 1、4
+    - 大小寫 0 細寫，1 首字母大寫，2 全大寫
+
+分隔文字佮音節表無个音節是負數 ID，對應 `encode` 返回个 `pieces`（-1 是 `pieces[0]`），
+解碼个時用轉換器轉換。`pieces` 逐擺編碼家己一份，陣列若欲存落來，`pieces` 嘛愛做伙存。
+
+查表个時逐个音節家己轉換，文本頭、尾个特殊寫法（白話字甘爲霖、杜嘉德標準）無考慮。
+"""
+
+import unicodedata
+from collections import namedtuple
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
+
+try:
+    import numpy as np
+except ImportError as error:
+    raise ImportError("thokit.vectorized 愛先裝 NumPy：pip install numpy") from error
+
+from thokit import (
+    ThoKit,
+    _CASE_EITHER,
+    _CASE_UPPER,
+    _TOKEN,
+    _ORTHOGRAPHY_GRAPH,
+    _caseMask,
+    _convertSyllables,
+    _eitherCase,
+    _freeze,
+)
+
+_TONES = 10
+_CASES = 3
+
+Encoded = namedtuple("Encoded", ["ids", "offsets", "pieces"])
+"""
+`encode` 个結果：音節 ID、逐逝个起點、分隔文字佮音節表無个字串（負數 ID `-1 - i` 對應 `pieces[i]`）
+"""
+
+_tables = {}
+_lookups = {}
+
+
+@lru_cache(maxsize=None)
+def _kit() -> ThoKit:
+    """
+    建表用个 ThoKit，頭一擺用着个時才建
+    """
+    return ThoKit()
+
+
+@lru_cache(maxsize=None)
+def _layout() -> Tuple[int, int]:
+    """
+    音節 ID 个排列：(韻母數, 音節 ID 數)
+    """
+    finals = len(_kit().tailo_finals)
+    return finals, len(_kit().tailo_initials) * finals * _TONES * _CASES
+
+
+def _forms() -> List[str]:
+    """
+    逐个音節 ID 个臺羅 ASCII 寫法
+    """
+    forms = []
+    for initial in _kit().tailo_initials:
+        for final in _kit().tailo_finals:
+            for tone in range(_TONES):
+                syllable = initial + final + (str(tone) if tone else "")
+                forms += [syllable, syllable.capitalize(), syllable.upper()]
+    return forms
+
+
+def _table(orthography: str, standard: str = None, **options) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    音節 ID 佇某種拼寫个寫法佮長度
+    """
+    key = (orthography, standard, *sorted((name, _freeze(value)) for name, value in options.items()))
+    table = _tables.get(key)
+    if table is not None:
+        return table
+    assert orthography in _ORTHOGRAPHY_GRAPH, f"無支持个拼寫：{orthography}"
+    forms = _forms()
+    if orthography != "tailo-asc":
+        convert = _kit().converter("tailo-asc", orthography, standard, engine="table", **options)
+        forms = _convertSyllables(convert, forms) or [convert(form) for form in forms]
+    strings = np.array(forms, dtype=object)
+    lengths = np.fromiter(map(len, forms), dtype=np.int64, count=len(forms))
+    return _tables.setdefault(key, (strings, lengths))
+
+
+def _lookup(orthography: str, standard: str = None) -> Dict[str, int]:
+    """
+    某種拼寫个音節對音節 ID；寫法仝款个時，照韻母有影个聲調優先，其次無寫數字調
+    """
+    key = (orthography, standard)
+    lookup = _lookups.get(key)
+    if lookup is not None:
+        return lookup
+    strings, _ = _table(orthography, standard)
+    kit = _kit()
+    finals, syllables = _layout()
+    entering = np.array([final[-1] in kit.entering_endings for final in kit.tailo_finals])
+    ids = np.arange(syllables)
+    tones = ids // _CASES % _TONES
+    valid = np.where(entering[ids // (_CASES * _TONES) % finals], np.isin(tones, [4, 8]), ~np.isin(tones, [0, 4, 8]))
+    order = np.lexsort((ids, np.where(valid, 0, np.where(tones == 0, 1, 2))))
+    lookup = {}
+    for i, form in zip(order.tolist(), strings[order].tolist()):
+        lookup.setdefault(form, i)
+        if not form.isascii():
+            lookup.setdefault(unicodedata.normalize("NFC", form), i)
+            lookup.setdefault(unicodedata.normalize("NFD", form), i)
+    return _lookups.setdefault(key, lookup)
+
+
+def encode(lines: Iterable[str], source: str = "tailo-asc", standard: str = None) -> Encoded:
+    """
+    文本編碼做音節 ID 陣列
+
+    參數：
+        lines (Iterable[str]): 一逝一逝个文本
+        source (str，可選): 輸入拼寫，"tailo-asc"、"tailo-uni"、"poj-asc"、"poj-uni"、"ipa"，默認 "tailo-asc"
+        standard (str，可選): 白話字標準
+    返回：
+        Encoded: (ids, offsets, pieces)，第 i 逝是 `ids[offsets[i]:offsets[i + 1]]`，
+            負數 ID `-1 - j` 是 `pieces[j]`
+    """
+    lookup = _lookup(source, standard)
+    ids, offsets = [], [0]
+    pieces: List[str] = []
+    piece_ids: Dict[str, int] = {}
+    for line in lines:
+        split = _TOKEN.split(line)
+        for i, piece in enumerate(split):
+            if not piece:
+                continue
+            syllable = lookup.get(piece) if i % 2 else None
+            if syllable is None:
+                syllable = piece_ids.get(piece)
+                if syllable is None:
+                    syllable = piece_ids[piece] = -1 - len(pieces)
+                    pieces.append(piece)
+            elif syllable % _CASES == 1 and _caseMask(piece) == _CASE_EITHER:
+                # 首字母大寫佮全大寫寫法仝款个音節（譬論講 "Ó͘"）照隔壁个音節，參考 `_eitherCase`
+                if _eitherCase(split, i) == _CASE_UPPER:
+                    syllable += 1
+            ids.append(syllable)
+        offsets.append(len(ids))
+    return Encoded(np.array(ids, dtype=np.int32), np.array(offsets, dtype=np.int64), pieces)
+
+
+def decode(
+    ids: "np.ndarray",
+    offsets: "np.ndarray",
+    pieces: List[str],
+    target: str = "tailo-asc",
+    standard: str = None,
+    **options,
+) -> List[str]:
+    """
+    音節 ID 陣列解碼做文本
+
+    參數：
+        ids (np.ndarray): 音節 ID
+        offsets (np.ndarray): 逐逝个起點，上尾一个是 `len(ids)`
+        pieces (List[str]): 仝一擺 `encode` 返回个 `pieces`
+        target (str，可選): 輸出拼寫，默認 "tailo-asc"
+        standard (str，可選): 白話字標準
+        **options: 轉換方法个其他參數，參考 `ThoKit.converter`
+    返回：
+        List[str]: 一逝一逝个文本
+    """
+    strings, lengths = _table(target, standard, **options)
+    if target == "tailo-asc":
+        rendered = list(pieces)
+    else:
+        rendered = list(map(_kit().converter("tailo-asc", target, standard, engine="table", **options), pieces))
+    rendered.reverse()
+    # 分隔文字倒頭排佇表个後壁，負數 ID 直接做索引
+    strings = np.concatenate([strings, np.array(rendered, dtype=object)])
+    lengths = np.concatenate([lengths, np.fromiter(map(len, rendered), dtype=np.int64, count=len(rendered))])
+    ids = np.asarray(ids)
+    text = "".join(strings[ids].tolist())
+    bounds = np.concatenate([[0], np.cumsum(lengths[ids])])[np.asarray(offsets)].tolist()
+    return [text[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+
+
+def fields(ids: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray"]:
+    """
+    音節 ID 拆做聲母、韻母、聲調、大小寫，分隔文字攏是 -1
+
+    參數：
+        ids (np.ndarray): 音節 ID
+    返回：
+        Tuple[np.ndarray, ...]: (聲母, 韻母, 聲調, 大小寫)
+    """
+    ids = np.asarray(ids)
+    syllable = ids >= 0
+    finals, _ = _layout()
+    return tuple(
+        np.where(syllable, value, -1)
+        for value in [
+            ids // (_CASES * _TONES * finals),
+            ids // (_CASES * _TONES) % finals,
+            ids // _CASES % _TONES,
+            ids % _CASES,
+        ]
+    )
+
+
+def compose(
+    initials: "np.ndarray", finals: "np.ndarray", tones: "np.ndarray", cases: "np.ndarray"
+) -> "np.ndarray":
+    """
+    聲母、韻母、聲調、大小寫組做音節 ID，`fields` 个反向
+
+    參數：
+        initials (np.ndarray): 聲母索引
+        finals (np.ndarray): 韻母索引
+        tones (np.ndarray): 聲調，0～9
+        cases (np.ndarray): 大小寫，0～2
+    返回：
+        np.ndarray: 音節 ID
+    """
+    initials, finals, tones, cases = map(np.asarray, [initials, finals, tones, cases])
+    ids = ((initials * _layout()[0] + finals) * _TONES + tones) * _CASES + cases
+    return ids.astype(np.int32)
+
+
+def stripTones(ids: "np.ndarray") -> "np.ndarray":
+    """
+    提掉聲調，音節攏變做無寫數字調，分隔文字無變
+
+    參數：
+        ids (np.ndarray): 音節 ID
+    返回：
+        np.ndarray: 音節 ID
+    """
+    ids = np.asarray(ids)
+    return np.where(ids >= 0, ids - ids // _CASES % _TONES * _CASES, ids).astype(ids.dtype)
+
+
+def mapTones(ids: "np.ndarray", mapping: Dict[int, int]) -> "np.ndarray":
+    """
+    照對照表換聲調，譬論講 {6: 7} 共第六調攏當做第七調，分隔文字無變
+
+    參數：
+        ids (np.ndarray): 音節 ID
+        mapping (Dict[int, int]): 舊聲調 => 新聲調，0 是無寫數字調
+    返回：
+        np.ndarray: 音節 ID
+    """
+    ids = np.asarray(ids)
+    tones = np.arange(_TONES)
+    for old, new in mapping.items():
+        assert 0 <= old < _TONES and 0 <= new < _TONES, f"無效个聲調：{old} => {new}"
+        tones[old] = new
+    tone = ids // _CASES % _TONES
+    return np.where(ids >= 0, ids + (tones[tone] - tone) * _CASES, ids).astype(ids.dtype)